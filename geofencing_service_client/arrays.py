@@ -0,0 +1,133 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from typing import Any, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from geofencing_service_client.models import Polygon, Circle, AirspaceVolume, UASZone, UASZoneFilterReply
+
+# Versions of the models of the UASZones that keep their coordinates in numpy arrays instead of nested lists, as a
+# basis for vectorised geometry. numpy is an optional dependency which is only needed by this module.
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('numpy is required for the array backed models: pip install numpy')
+
+
+class ArrayPolygon(Polygon):
+
+    def __init__(self, coordinates: Sequence[Any], dtype: Optional[Any] = None) -> None:
+        """
+        A Polygon holding each of its rings as a contiguous (n, 2) array of longitude/latitude. Rings which are
+        already arrays of the given dtype are kept as they are without copying.
+
+        :param coordinates: the GeoJSON coordinates or a list of (n, 2) arrays, one per ring
+        :param dtype: float64 by default, float32 halves the memory but to_json will not round trip exactly
+        """
+        _require_numpy()
+        dtype = np.float64 if dtype is None else dtype
+
+        self.type = "Polygon"
+        self.coordinates: List['np.ndarray'] = [np.ascontiguousarray(ring, dtype=dtype) for ring in coordinates]
+
+    @property
+    def exterior(self) -> 'np.ndarray':
+        return self.coordinates[0]
+
+    @property
+    def interiors(self) -> List['np.ndarray']:
+        return self.coordinates[1:]
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ == self.__class__ and len(self.coordinates) == len(other.coordinates) and \
+            all(np.array_equal(ring, other_ring) for ring, other_ring in zip(self.coordinates, other.coordinates))
+
+    __hash__ = None
+
+    def to_json(self) -> Any:
+        return {
+            "type": self.type,
+            "coordinates": [ring.tolist() for ring in self.coordinates]
+        }
+
+
+class ArrayCircle(Circle):
+
+    def __init__(self, center: Sequence[float], radius: float, dtype: Optional[Any] = None) -> None:
+        """
+        A Circle holding its center as a (2,) array of longitude/latitude
+
+        :param center:
+        :param radius:
+        :param dtype: float64 by default
+        """
+        _require_numpy()
+        dtype = np.float64 if dtype is None else dtype
+
+        self.type = "Circle"
+        self.center: 'np.ndarray' = np.ascontiguousarray(center, dtype=dtype)
+        self.radius = radius
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ == self.__class__ and np.array_equal(self.center, other.center) and \
+            self.radius == other.radius
+
+    __hash__ = None
+
+    def to_json(self) -> Any:
+        return {
+            "type": self.type,
+            "center": self.center.tolist(),
+            "radius": self.radius
+        }
+
+
+class ArrayAirspaceVolume(AirspaceVolume):
+
+    _polygon_class = ArrayPolygon
+    _circle_class = ArrayCircle
+
+
+class ArrayUASZone(UASZone):
+
+    _airspace_volume_class = ArrayAirspaceVolume
+
+
+class ArrayUASZoneFilterReply(UASZoneFilterReply):
+
+    _uas_zone_class = ArrayUASZone
+
@@ -0,0 +1,350 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import typing as t
+from datetime import timedelta
+
+from rest_client.errors import APIError
+from rest_client.typing import JSONType
+
+from geofencing_service_client.bulk import BulkReport, run_bulk_async, map_concurrently_async, iter_concurrently_async
+from geofencing_service_client.cache import FilterReplyCache
+from geofencing_service_client.errors import handle_geofencing_service_error
+from geofencing_service_client.filtering import uas_zone_intersects_area
+from geofencing_service_client.geofencing_service import GeofencingServiceClient
+from geofencing_service_client.models import UASZone, UASZonesFilter, UASZoneFilterReply, UASZoneCreateReply, \
+    SubscribeToUASZonesUpdatesReply, GenericReply, UASZoneSubscriptionReply, UASZoneSubscriptionsReply, Reply
+from geofencing_service_client.rate_limit import RateLimiter
+from geofencing_service_client.sharding import split_uas_zones_filter_by_area, split_uas_zones_filter_by_time, \
+    tiles_are_exact
+from geofencing_service_client.utils import unique_by
+
+__author__ = "EUROCONTROL (SWIM)"
+
+
+class AsyncRequestor:
+
+    def __init__(self, request_handler: t.Any) -> None:
+        """
+        :param request_handler: an instance of an object capable of handling http requests asynchronously, i.e.
+                                httpx.AsyncClient(base_url=...). Its get/post/put/delete methods should be
+                                coroutines returning a response with status_code, text, content and json()
+        """
+        self.request_handler = request_handler
+
+    async def perform_request(self,
+                              method: str,
+                              url: str,
+                              json: t.Optional[JSONType] = None,
+                              response_class: t.Optional[t.Any] = None) -> t.Any:
+        """
+        The asynchronous counterpart of rest_client.Requestor.perform_request
+
+        :param method: the http method, i.e. 'GET'
+        :param url:
+        :param json: the body of the request, if any
+        :param response_class: the model to deserialize the response body into
+        :return:
+        """
+        request_kwargs = {'json': json} if json is not None else {}
+
+        response = await getattr(self.request_handler, method.lower())(url, **request_kwargs)
+
+        if not 200 <= response.status_code < 300:
+            raise APIError(response.text, response.status_code)
+
+        if not response.content:
+            return None
+
+        response_json = response.json()
+
+        return response_class.from_json(response_json) if response_class else response_json
+
+
+class AsyncGeofencingServiceClient(AsyncRequestor):
+
+    _BASE_URL = GeofencingServiceClient._BASE_URL
+
+    def __init__(self,
+                 request_handler: t.Any,
+                 cache: t.Optional[FilterReplyCache] = None,
+                 rate_limiter: t.Optional[RateLimiter] = None) -> None:
+        """
+        :param request_handler: an instance of an object capable of handling http requests asynchronously, i.e.
+                                httpx.AsyncClient(base_url=...)
+        :param cache: if provided, the replies of filter_uas_zones are cached and invalidated whenever a UASZone is
+                      created or deleted through this client
+        :param rate_limiter: if provided, the requests are delayed to stay within its rates without blocking the
+                             event loop
+        """
+        AsyncRequestor.__init__(self, request_handler)
+
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+        self._url_uas_zones = self._BASE_URL + 'uas_zones/'
+        self._url_uas_zones_filter = self._BASE_URL + 'uas_zones/filter/'
+        self._url_uas_zones_by_identifier = self._BASE_URL + 'uas_zones/{uas_zone_identifier}'
+        self._url_subscriptions = self._BASE_URL + 'subscriptions/'
+        self._url_subscription_by_id = self._BASE_URL + 'subscriptions/{subscription_id}'
+        self._url_ping_credentials = self._BASE_URL + 'ping-credentials'
+
+    async def perform_request(self, method: str, url: str, *args, **kwargs) -> t.Any:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self._endpoint_group(method, url))
+
+        return await AsyncRequestor.perform_request(self, method, url, *args, **kwargs)
+
+    _endpoint_group = GeofencingServiceClient._endpoint_group
+
+    @handle_geofencing_service_error
+    async def filter_uas_zones(self, uas_zones_filter: UASZonesFilter) -> UASZoneFilterReply:
+        """
+        Retrieves UASZones based on the provided filter criteria
+
+        :param uas_zones_filter:
+        :return:
+        """
+        if self.cache is None:
+            return await self._filter_uas_zones(uas_zones_filter)
+
+        reply = self.cache.get(uas_zones_filter)
+        if reply is None:
+            generation = self.cache.generation
+            reply = await self._filter_uas_zones(uas_zones_filter)
+            self.cache.put(uas_zones_filter, reply, generation=generation)
+
+        return reply
+
+    async def _filter_uas_zones(self, uas_zones_filter: UASZonesFilter) -> UASZoneFilterReply:
+        return await self.perform_request('POST',
+                                          self._url_uas_zones_filter,
+                                          json=uas_zones_filter.to_json(),
+                                          response_class=UASZoneFilterReply)
+
+    async def filter_uas_zones_many(self,
+                                    uas_zones_filters: t.Iterable[UASZonesFilter],
+                                    max_concurrency: int = 8,
+                                    merge: bool = False) -> t.Union[t.List[UASZoneFilterReply], t.List[UASZone]]:
+        """
+        Retrieves UASZones for many filters with up to max_concurrency requests in flight over the same request
+        handler, so its connection pool is shared between them.
+
+        :param uas_zones_filters:
+        :param max_concurrency:
+        :param merge: if True, the UASZones of all the replies are merged in one list, deduplicated by identifier
+        :return: the UASZoneFilterReply of each filter in input order or, if merge is True, the merged UASZones
+        """
+        replies = await map_concurrently_async(self.filter_uas_zones,
+                                               uas_zones_filters,
+                                               max_concurrency=max_concurrency)
+
+        if not merge:
+            return replies
+
+        uas_zones = (uas_zone for reply in replies for uas_zone in reply.uas_zone_list)
+
+        return list(unique_by(uas_zones, key=lambda uas_zone: uas_zone.identifier))
+
+    async def iter_filter_uas_zones_tiled(self,
+                                          uas_zones_filter: UASZonesFilter,
+                                          rows: int = 2,
+                                          columns: int = 2,
+                                          max_concurrency: int = 4) -> t.AsyncIterator[UASZone]:
+        """
+        Splits the area of the filter in a grid of rows x columns tiles, retrieves the UASZones of the tiles
+        concurrently and yields them as the tiles arrive, deduplicated by identifier across tiles. The tiles of
+        concave polygons and of polygons with holes reach outside of them, so their UASZones are narrowed down to the
+        ones within the area.
+
+        :param uas_zones_filter:
+        :param rows:
+        :param columns:
+        :param max_concurrency:
+        :return:
+        """
+        tile_filters = split_uas_zones_filter_by_area(uas_zones_filter, rows=rows, columns=columns)
+        horizontal_projection = None if tiles_are_exact(uas_zones_filter) \
+            else uas_zones_filter.airspace_volume.horizontal_projection
+
+        seen_identifiers = set()
+        async for reply in iter_concurrently_async(self.filter_uas_zones,
+                                                   tile_filters,
+                                                   max_concurrency=max_concurrency,
+                                                   ordered=False):
+            for uas_zone in reply.uas_zone_list:
+                if horizontal_projection is not None and not uas_zone_intersects_area(uas_zone, horizontal_projection):
+                    continue
+                if uas_zone.identifier not in seen_identifiers:
+                    seen_identifiers.add(uas_zone.identifier)
+                    yield uas_zone
+
+    async def iter_filter_uas_zones_by_time_window(self,
+                                                   uas_zones_filter: UASZonesFilter,
+                                                   window: timedelta = timedelta(weeks=1),
+                                                   max_concurrency: int = 4,
+                                                   lazy: bool = False) -> t.AsyncIterator[UASZone]:
+        """
+        Splits the time range of the filter in consecutive windows and yields the UASZones window by window in
+        chronological order, deduplicated by identifier across windows. The UASZones of the first window can be
+        processed while the next ones are still being retrieved.
+
+        :param uas_zones_filter:
+        :param window: i.e. timedelta(days=1) or timedelta(weeks=1)
+        :param max_concurrency: how many windows are retrieved in parallel ahead of the consumer
+        :param lazy: if True, a window is retrieved only once the UASZones of the previous one have been consumed
+        :return:
+        """
+        window_filters = split_uas_zones_filter_by_time(uas_zones_filter, window=window)
+
+        if lazy:
+            replies = (await self.filter_uas_zones(window_filter) for window_filter in window_filters)
+        else:
+            replies = iter_concurrently_async(self.filter_uas_zones, window_filters, max_concurrency=max_concurrency)
+
+        seen_identifiers = set()
+        async for reply in replies:
+            for uas_zone in reply.uas_zone_list:
+                if uas_zone.identifier not in seen_identifiers:
+                    seen_identifiers.add(uas_zone.identifier)
+                    yield uas_zone
+
+    @handle_geofencing_service_error
+    async def post_uas_zone(self, uas_zone: UASZone) -> UASZoneCreateReply:
+        """
+        Create a new UASZone
+
+        :param uas_zone:
+        :return:
+        """
+        try:
+            return await self.perform_request('POST',
+                                              self._url_uas_zones,
+                                              json=uas_zone.to_json(),
+                                              response_class=UASZoneCreateReply)
+        finally:
+            self._invalidate_cache()
+
+    async def post_uas_zones(self, uas_zones: t.Iterable[UASZone], max_concurrency: int = 8) -> BulkReport:
+        """
+        Creates many UASZones with up to max_concurrency requests in flight. A failing UASZone does not stop the
+        upload; its APIError takes the place of its reply in the report.
+
+        :param uas_zones:
+        :param max_concurrency:
+        :return: a BulkReport with a UASZoneCreateReply or APIError per UASZone and the latency stats of the run
+        """
+        return await run_bulk_async(self.post_uas_zone, uas_zones, max_concurrency=max_concurrency)
+
+    @handle_geofencing_service_error
+    async def delete_uas_zone_by_identifier(self, uas_zone_identifier: int) -> GenericReply:
+        """
+        Delete an UASZone
+
+        :param uas_zone_identifier:
+        :return:
+        """
+        url = self._url_uas_zones_by_identifier.format(uas_zone_identifier=uas_zone_identifier)
+
+        try:
+            return await self.perform_request('DELETE', url, response_class=GenericReply)
+        finally:
+            self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    @handle_geofencing_service_error
+    async def post_subscription(self, uas_zones_filter: UASZonesFilter) -> SubscribeToUASZonesUpdatesReply:
+        """
+        Creates a new subscription based on the provided filter criteria. The subscriber can then use the returned
+        broker publication_location in order to receive updates of created or deleted UASZones that satisfy the provided
+        criteria.
+
+        :param uas_zones_filter:
+        :return:
+        """
+        return await self.perform_request('POST',
+                                          self._url_subscriptions,
+                                          json=uas_zones_filter.to_json(),
+                                          response_class=SubscribeToUASZonesUpdatesReply)
+
+    @handle_geofencing_service_error
+    async def get_subscriptions(self) -> UASZoneSubscriptionsReply:
+        """
+        Retrieves subscription data (id and queue)
+
+        :return:
+        """
+        return await self.perform_request('GET', self._url_subscriptions, response_class=UASZoneSubscriptionsReply)
+
+    @handle_geofencing_service_error
+    async def get_subscription_by_id(self, subscription_id: str) -> UASZoneSubscriptionReply:
+        """
+        Retrieves subscription data (id and queue)
+
+        :param subscription_id:
+        :return:
+        """
+        url = self._url_subscription_by_id.format(subscription_id=subscription_id)
+
+        return await self.perform_request('GET', url, response_class=UASZoneSubscriptionReply)
+
+    @handle_geofencing_service_error
+    async def put_subscription(self, subscription_id: str, update_data: t.Dict[str, bool]) -> Reply:
+        """
+        It can be used to pause/resume a subscription by updating its status.
+        Example:
+            {'active': false} will pause a subscription if is already active
+            {'active': true} will resume a subscription if is already paused
+
+        :param subscription_id:
+        :param update_data:
+        :return:
+        """
+        url = self._url_subscription_by_id.format(subscription_id=subscription_id)
+
+        return await self.perform_request('PUT', url, json=update_data, response_class=Reply)
+
+    @handle_geofencing_service_error
+    async def delete_subscription_by_id(self, subscription_id: str) -> Reply:
+        """
+        Unsubscribes the subscriber from the subscription by deleting the subscription
+
+        :param subscription_id:
+        :return:
+        """
+        url = self._url_subscription_by_id.format(subscription_id=subscription_id)
+
+        return await self.perform_request('DELETE', url, response_class=Reply)
+
+    async def ping_credentials(self):
+
+        return await self.perform_request('GET', self._url_ping_credentials)
@@ -0,0 +1,262 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, List, Union, Any, Awaitable, TypeVar, Iterator, AsyncIterator
+
+from geofencing_service_client.stats import LatencyStats
+
+T = TypeVar('T')
+
+
+class BulkReport:
+
+    def __init__(self, results: List[Union[Any, Exception]], stats: LatencyStats) -> None:
+        """
+        The outcome of a bulk operation
+
+        :param results: one item per input in the same order, either the reply or the exception that was raised, i.e.
+                        an APIError or a network error of the request handler
+        :param stats: the latencies and throughput of the run
+        """
+        self.results = results
+        self.stats = stats
+
+    @property
+    def succeeded(self) -> List[Any]:
+        return [result for result in self.results if not isinstance(result, Exception)]
+
+    @property
+    def failed(self) -> List[Exception]:
+        return [result for result in self.results if isinstance(result, Exception)]
+
+    def __repr__(self) -> str:
+        return f"BulkReport(succeeded={len(self.succeeded)}, failed={len(self.failed)}, stats={self.stats!r})"
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f'max_concurrency should be at least 1, got {max_concurrency}')
+
+
+def run_bulk(func: Callable[[T], Any], items: Iterable[T], max_concurrency: int) -> BulkReport:
+    """
+    Calls func for every item with at most max_concurrency calls in flight. The exceptions raised by the calls, i.e.
+    APIErrors, undecodable error replies or timeouts, are collected per item instead of aborting the run, so that the
+    replies of the items already processed are not lost.
+
+    :param func:
+    :param items:
+    :param max_concurrency:
+    :return:
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    def timed_call(item):
+        start = time.perf_counter()
+        try:
+            result = func(item)
+        except Exception as e:
+            result = e
+
+        return result, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        outcomes = list(executor.map(timed_call, items))
+    elapsed = time.perf_counter() - start
+
+    return BulkReport(results=[result for result, _ in outcomes],
+                      stats=LatencyStats(latencies=[latency for _, latency in outcomes], elapsed=elapsed))
+
+
+def map_concurrently(func: Callable[[T], Any], items: Iterable[T], max_concurrency: int) -> List[Any]:
+    """
+    Calls func for every item with at most max_concurrency calls in flight and returns the results in input order.
+    The first exception raised by a call is propagated.
+
+    :param func:
+    :param items:
+    :param max_concurrency:
+    :return:
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return list(executor.map(func, items))
+
+
+async def map_concurrently_async(func: Callable[[T], Awaitable[Any]],
+                                 items: Iterable[T],
+                                 max_concurrency: int) -> List[Any]:
+    """
+    The asyncio counterpart of map_concurrently
+
+    :param func: a coroutine function
+    :param items:
+    :param max_concurrency:
+    :return:
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_call(item):
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*[bounded_call(item) for item in items])
+
+
+def iter_concurrently(func: Callable[[T], Any],
+                      items: Iterable[T],
+                      max_concurrency: int,
+                      ordered: bool = True) -> Iterator[Any]:
+    """
+    Calls func for every item with at most max_concurrency calls in flight and yields the results as soon as they
+    are available. New calls are only started as results are consumed, so at most max_concurrency results are held
+    at any time. The first exception raised by a call is propagated.
+
+    :param func:
+    :param items:
+    :param max_concurrency:
+    :param ordered: if True the results are yielded in input order, otherwise in order of completion
+    :return:
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    pending = deque()
+
+    def submit_next() -> None:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            break
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(f for f in pending if f in done)
+                pending.remove(future)
+
+            result = future.result()
+            submit_next()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def iter_concurrently_async(func: Callable[[T], Awaitable[Any]],
+                                  items: Iterable[T],
+                                  max_concurrency: int,
+                                  ordered: bool = True) -> AsyncIterator[Any]:
+    """
+    The asyncio counterpart of iter_concurrently
+
+    :param func: a coroutine function
+    :param items:
+    :param max_concurrency:
+    :param ordered:
+    :return:
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    items = iter(items)
+    pending = deque()
+
+    def submit_next() -> None:
+        for item in items:
+            pending.append(asyncio.ensure_future(func(item)))
+            break
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+
+        while pending:
+            if ordered:
+                task = pending.popleft()
+                await asyncio.wait([task])
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = next(t for t in pending if t in done)
+                pending.remove(task)
+
+            result = task.result()
+            submit_next()
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def run_bulk_async(func: Callable[[T], Awaitable[Any]], items: Iterable[T], max_concurrency: int) -> BulkReport:
+    """
+    The asyncio counterpart of run_bulk
+
+    :param func: a coroutine function
+    :param items:
+    :param max_concurrency:
+    :return:
+    """
+    _validate_max_concurrency(max_concurrency)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def timed_call(item):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await func(item)
+            except Exception as e:
+                result = e
+
+            return result, time.perf_counter() - start
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*[timed_call(item) for item in items])
+    elapsed = time.perf_counter() - start
+
+    return BulkReport(results=[result for result, _ in outcomes],
+                      stats=LatencyStats(latencies=[latency for _, latency in outcomes], elapsed=elapsed))
@@ -0,0 +1,219 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Callable
+
+from geofencing_service_client.filtering import uas_zones_filter_contains, filter_uas_zones_locally
+from geofencing_service_client.fingerprints import uas_zones_filter_fingerprint
+from geofencing_service_client.models import UASZonesFilter, UASZoneFilterReply
+
+
+class CacheStats:
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.derived_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return f"CacheStats(hits={self.hits}, derived_hits={self.derived_hits}, misses={self.misses}, " \
+               f"hit_rate={self.hit_rate:.2f}, " \
+               f"evictions={self.evictions}, expirations={self.expirations}, invalidations={self.invalidations})"
+
+
+class _CacheEntry:
+
+    def __init__(self,
+                 uas_zones_filter: UASZonesFilter,
+                 reply: UASZoneFilterReply,
+                 expires_at: float,
+                 size: int) -> None:
+        self.uas_zones_filter = uas_zones_filter
+        self.reply = reply
+        self.expires_at = expires_at
+        self.size = size
+
+
+def _estimate_reply_size(reply: UASZoneFilterReply) -> int:
+    return len(json.dumps([uas_zone.to_json() for uas_zone in reply.uas_zone_list], default=str))
+
+
+class FilterReplyCache:
+
+    def __init__(self,
+                 ttl: float = 60.0,
+                 max_entries: int = 128,
+                 max_bytes: Optional[int] = None,
+                 derive_contained: bool = False,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        A thread safe TTL and LRU cache of UASZoneFilterReply keyed by the canonical fingerprint of UASZonesFilter.
+        The cached filters and replies are shared between callers and should be treated as read only.
+
+        :param ttl: seconds after which an entry expires
+        :param max_entries: the least recently used entries are evicted beyond this number
+        :param max_bytes: if provided, the least recently used entries are evicted when the total estimated JSON size
+                          of the cached UASZones exceeds it
+        :param derive_contained: if True, a filter that is not cached but is contained spatially, vertically and
+                                 temporally in a cached one is answered by filtering the UASZones of the cached reply
+                                 locally (see filtering.uas_zones_filter_contains)
+        :param clock:
+        """
+        if max_entries < 1:
+            raise ValueError(f'max_entries should be at least 1, got {max_entries}')
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.derive_contained = derive_contained
+        self.stats = CacheStats()
+
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Increases on every invalidation. A reply retrieved before an invalidation should not be cached after it.
+        """
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, uas_zones_filter: UASZonesFilter) -> Optional[UASZoneFilterReply]:
+        key = uas_zones_filter_fingerprint(uas_zones_filter)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+
+                return entry.reply
+
+            containing_entry = self._find_containing_entry(uas_zones_filter) if self.derive_contained else None
+
+            if containing_entry is None:
+                self.stats.misses += 1
+                return None
+
+            self.stats.hits += 1
+            self.stats.derived_hits += 1
+
+        return UASZoneFilterReply(
+            uas_zone_list=filter_uas_zones_locally(containing_entry.reply.uas_zone_list, uas_zones_filter),
+            generic_reply=containing_entry.reply.generic_reply
+        )
+
+    def put(self,
+            uas_zones_filter: UASZonesFilter,
+            reply: UASZoneFilterReply,
+            generation: Optional[int] = None) -> None:
+        """
+        :param uas_zones_filter:
+        :param reply:
+        :param generation: the generation of the cache before the reply was requested. If the cache has been
+                           invalidated since, the reply is considered stale and is not cached.
+        """
+        key = uas_zones_filter_fingerprint(uas_zones_filter)
+        size = _estimate_reply_size(reply) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(uas_zones_filter=uas_zones_filter,
+                                             reply=reply,
+                                             expires_at=self._clock() + self.ttl,
+                                             size=size)
+            self._total_size += size
+
+            self._evict()
+
+    def invalidate(self) -> None:
+        """
+        Drops all the entries, i.e. after a UASZone has been created or deleted
+        """
+        with self._lock:
+            self._entries.clear()
+            self._total_size = 0
+            self._generation += 1
+            self.stats.invalidations += 1
+
+    def _find_containing_entry(self, uas_zones_filter: UASZonesFilter) -> Optional[_CacheEntry]:
+        now = self._clock()
+
+        # the most recently used entries are checked first
+        for key in reversed(self._entries):
+            entry = self._entries[key]
+            if entry.expires_at > now and uas_zones_filter_contains(entry.uas_zones_filter, uas_zones_filter):
+                self._entries.move_to_end(key)
+                return entry
+
+        return None
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_size -= entry.size
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or \
+                (self.max_bytes is not None and self._total_size > self.max_bytes):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
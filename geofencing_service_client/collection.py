@@ -0,0 +1,381 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import operator
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from geofencing_service_client.geometry import BoundingBox, circle_bounding_box
+from geofencing_service_client.models import CodeZoneType, CodeRestrictionType, CodeUSpaceClassType, UASZone, \
+    UomDistance
+from geofencing_service_client.utils import make_timezone_aware, parse_datetime_iso
+
+_FEET_IN_M = 0.3048
+
+# the bounds used for missing applicability start and end date times
+MIN_TIMESTAMP = -2 ** 63
+MAX_TIMESTAMP = 2 ** 63 - 1
+
+TYPES = tuple(CodeZoneType)
+RESTRICTIONS = tuple(CodeRestrictionType)
+U_SPACE_CLASSES = tuple(CodeUSpaceClassType)
+
+_TYPE_CODES = {member.value: code for code, member in enumerate(TYPES)}
+_RESTRICTION_CODES = {member.value: code for code, member in enumerate(RESTRICTIONS)}
+_U_SPACE_CLASS_CODES = {member.value: code for code, member in enumerate(U_SPACE_CLASSES)}
+
+# the fields of the JSON objects that are rebuilt from the columns and left out of the slim objects
+_COLUMN_KEYS = ('identifier', 'type', 'restriction', 'uSpaceClass')
+
+# replaces the coordinates of the polygons in the slim objects
+_RING_COUNT_KEY = 'ringCount'
+
+
+def _epoch(dt: datetime) -> int:
+    # naive date times are considered UTC as in UASZonesFilter.to_json
+    return int((dt if dt.tzinfo is not None else make_timezone_aware(dt)).timestamp())
+
+
+def _timestamp(datetime_iso: Optional[str], default: int) -> int:
+    return default if datetime_iso is None else _epoch(parse_datetime_iso(datetime_iso))
+
+
+def _limit_in_m(airspace_volume: Dict[str, Any], key: str) -> float:
+    limit = airspace_volume.get(key)
+    if limit is None:
+        return float('nan')
+
+    return limit * _FEET_IN_M if airspace_volume.get('uomDimensions') == UomDistance.FEET.value else float(limit)
+
+
+def _gather_ranges(offsets: 'np.ndarray', indices: 'np.ndarray'):
+    """
+    Returns the offsets and the positions of the items of the ranges offsets[i]:offsets[i + 1] for i in indices
+    once packed together
+    """
+    starts = offsets[indices]
+    lengths = offsets[indices + 1] - starts
+
+    new_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+
+    positions = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1], dtype=np.int64)
+
+    return new_offsets, positions
+
+
+class UASZoneCollection:
+
+    def __init__(self,
+                 identifiers: 'np.ndarray',
+                 types: 'np.ndarray',
+                 restrictions: 'np.ndarray',
+                 u_space_classes: 'np.ndarray',
+                 lower_limits: 'np.ndarray',
+                 upper_limits: 'np.ndarray',
+                 bounding_boxes: 'np.ndarray',
+                 applicability_starts: 'np.ndarray',
+                 applicability_ends: 'np.ndarray',
+                 coordinates: 'np.ndarray',
+                 ring_offsets: 'np.ndarray',
+                 zone_ring_offsets: 'np.ndarray',
+                 slim_objects: 'np.ndarray') -> None:
+        """
+        A struct of arrays view of many UASZones meant for analytics and bulk queries. Every column is indexed by
+        zone, except for the packed rings of the polygons of all the zones: the rings of zone i are the ones from
+        zone_ring_offsets[i] to zone_ring_offsets[i + 1] and ring j is coordinates[ring_offsets[j]:ring_offsets[j + 1]].
+        The rest of the fields of the zones are kept in slim JSON objects, so that the zones can be converted back to
+        UASZone on demand without storing their coordinates twice.
+
+        :param identifiers: object array of str
+        :param types: int8 array of indexes in TYPES
+        :param restrictions: int8 array of indexes in RESTRICTIONS
+        :param u_space_classes: int8 array of indexes in U_SPACE_CLASSES or -1 if missing
+        :param lower_limits: float64 array of the lowest lower limit of the geometry of each zone in meters
+        :param upper_limits: float64 array of the highest upper limit of the geometry of each zone in meters
+        :param bounding_boxes: (n, 4) float64 array of the bounding box of the geometry of each zone
+        :param applicability_starts: int64 array of epoch seconds or MIN_TIMESTAMP if missing
+        :param applicability_ends: int64 array of epoch seconds or MAX_TIMESTAMP if missing
+        :param coordinates: (m, 2) float64 array of the points of all the rings
+        :param ring_offsets: int64 array of the offsets of the rings in coordinates
+        :param zone_ring_offsets: int64 array of the offsets of the rings of each zone in ring_offsets
+        :param slim_objects: object array of the JSON objects of the zones without the fields held by the columns. The
+                             coordinates of each polygon are replaced by the number of its rings, unless its positions
+                             have altitudes which are only kept there.
+        """
+        self.identifiers = identifiers
+        self.types = types
+        self.restrictions = restrictions
+        self.u_space_classes = u_space_classes
+        self.lower_limits = lower_limits
+        self.upper_limits = upper_limits
+        self.bounding_boxes = bounding_boxes
+        self.applicability_starts = applicability_starts
+        self.applicability_ends = applicability_ends
+        self.coordinates = coordinates
+        self.ring_offsets = ring_offsets
+        self.zone_ring_offsets = zone_ring_offsets
+        self.slim_objects = slim_objects
+
+    @classmethod
+    def from_json(cls, object_dict: Dict[str, Any]) -> 'UASZoneCollection':
+        """
+        Builds the collection straight from the JSON of a UASZoneFilterReply without creating UASZone objects
+
+        :param object_dict:
+        """
+        return cls.from_uas_zone_list_json(object_dict['UASZoneList'])
+
+    @classmethod
+    def from_uas_zone_list_json(cls, uas_zone_objects: List[Dict[str, Any]]) -> 'UASZoneCollection':
+        """
+        Builds the collection straight from the JSON objects of UASZones
+
+        :param uas_zone_objects:
+        """
+        if np is None:
+            raise ImportError('numpy is required for UASZoneCollection: pip install numpy')
+
+        size = len(uas_zone_objects)
+        types = np.empty(size, dtype=np.int8)
+        restrictions = np.empty(size, dtype=np.int8)
+        u_space_classes = np.empty(size, dtype=np.int8)
+        lower_limits = np.empty(size, dtype=np.float64)
+        upper_limits = np.empty(size, dtype=np.float64)
+        bounding_boxes = np.empty((size, 4), dtype=np.float64)
+        applicability_starts = np.empty(size, dtype=np.int64)
+        applicability_ends = np.empty(size, dtype=np.int64)
+        zone_ring_offsets = np.zeros(size + 1, dtype=np.int64)
+        slim_objects = np.empty(size, dtype=object)
+
+        points: List[List[float]] = []
+        ring_offsets = [0]
+        circle_bounding_boxes: Dict[int, List[BoundingBox]] = {}
+
+        for i, uas_zone_object in enumerate(uas_zone_objects):
+            types[i] = _TYPE_CODES[uas_zone_object['type']]
+            restrictions[i] = _RESTRICTION_CODES[uas_zone_object['restriction']]
+            u_space_class = uas_zone_object.get('uSpaceClass')
+            u_space_classes[i] = _U_SPACE_CLASS_CODES[u_space_class] if u_space_class else -1
+
+            geometry = uas_zone_object['geometry']
+            lower_limits[i] = min((_limit_in_m(volume, 'lowerLimit') for volume in geometry), default=float('nan'))
+            upper_limits[i] = max((_limit_in_m(volume, 'upperLimit') for volume in geometry), default=float('nan'))
+
+            slim_geometry = []
+            for volume in geometry:
+                projection = volume['horizontalProjection']
+                if projection['type'] == 'Circle':
+                    circle_bounding_boxes.setdefault(i, []).append(
+                        circle_bounding_box(projection['center'], projection['radius']))
+                    slim_geometry.append(volume)
+                    continue
+
+                planar = True
+                for ring in projection['coordinates']:
+                    if set(map(len, ring)) <= {2}:
+                        points.extend(ring)
+                    else:
+                        # only the longitude and latitude of positions with altitudes go to the columns
+                        planar = False
+                        points.extend(position[:2] for position in ring)
+                    ring_offsets.append(len(points))
+
+                if planar:
+                    slim_projection = {key: value for key, value in projection.items() if key != 'coordinates'}
+                    slim_projection[_RING_COUNT_KEY] = len(projection['coordinates'])
+                    volume = dict(volume, horizontalProjection=slim_projection)
+                slim_geometry.append(volume)
+
+            zone_ring_offsets[i + 1] = len(ring_offsets) - 1
+
+            slim_object = {key: value for key, value in uas_zone_object.items() if key not in _COLUMN_KEYS}
+            slim_object['geometry'] = slim_geometry
+            slim_objects[i] = slim_object
+
+            applicability = uas_zone_object.get('applicability') or {}
+            applicability_starts[i] = _timestamp(applicability.get('startDateTime'), MIN_TIMESTAMP)
+            applicability_ends[i] = _timestamp(applicability.get('endDateTime'), MAX_TIMESTAMP)
+
+        coordinates = np.array(points, dtype=np.float64).reshape(-1, 2)
+        ring_offsets = np.array(ring_offsets, dtype=np.int64)
+
+        # the bounding boxes of the polygons are reduced over the points of all the rings of each zone at once
+        point_offsets = ring_offsets[zone_ring_offsets]
+        with_points = np.flatnonzero(point_offsets[1:] > point_offsets[:-1])
+        bounding_boxes[:, :2] = np.inf
+        bounding_boxes[:, 2:] = -np.inf
+        if len(with_points):
+            starts = point_offsets[with_points]
+            bounding_boxes[with_points, :2] = np.minimum.reduceat(coordinates, starts)
+            bounding_boxes[with_points, 2:] = np.maximum.reduceat(coordinates, starts)
+        for i, boxes in circle_bounding_boxes.items():
+            bounding_boxes[i, :2] = np.minimum(bounding_boxes[i, :2], np.min([box[:2] for box in boxes], axis=0))
+            bounding_boxes[i, 2:] = np.maximum(bounding_boxes[i, 2:], np.max([box[2:] for box in boxes], axis=0))
+
+        identifiers = np.empty(size, dtype=object)
+        identifiers[:] = [uas_zone_object['identifier'] for uas_zone_object in uas_zone_objects]
+
+        return cls(identifiers=identifiers,
+                   types=types,
+                   restrictions=restrictions,
+                   u_space_classes=u_space_classes,
+                   lower_limits=lower_limits,
+                   upper_limits=upper_limits,
+                   bounding_boxes=bounding_boxes,
+                   applicability_starts=applicability_starts,
+                   applicability_ends=applicability_ends,
+                   coordinates=coordinates,
+                   ring_offsets=ring_offsets,
+                   zone_ring_offsets=zone_ring_offsets,
+                   slim_objects=slim_objects)
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    def __getitem__(self, key: Union[int, slice, 'np.ndarray']) -> Union[UASZone, 'UASZoneCollection']:
+        """
+        Returns the UASZone at the given position, or a new collection for slices, boolean masks and index arrays
+        """
+        if isinstance(key, (int, np.integer)):
+            return self.uas_zone(self._normalize_index(key))
+
+        return self.take(np.arange(len(self))[key])
+
+    def _normalize_index(self, index: int) -> int:
+        index = operator.index(index)
+        normalized = index + len(self) if index < 0 else index
+        if not 0 <= normalized < len(self):
+            raise IndexError(f'index {index} is out of range for {len(self)} zones')
+
+        return normalized
+
+    def take(self, indices: 'np.ndarray') -> 'UASZoneCollection':
+        """
+        Returns a new collection with the zones at the given positions
+
+        :param indices:
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+
+        zone_ring_offsets, ring_positions = _gather_ranges(self.zone_ring_offsets, indices)
+        ring_offsets, point_positions = _gather_ranges(self.ring_offsets, ring_positions)
+
+        return UASZoneCollection(identifiers=self.identifiers[indices],
+                                 types=self.types[indices],
+                                 restrictions=self.restrictions[indices],
+                                 u_space_classes=self.u_space_classes[indices],
+                                 lower_limits=self.lower_limits[indices],
+                                 upper_limits=self.upper_limits[indices],
+                                 bounding_boxes=self.bounding_boxes[indices],
+                                 applicability_starts=self.applicability_starts[indices],
+                                 applicability_ends=self.applicability_ends[indices],
+                                 coordinates=self.coordinates[point_positions],
+                                 ring_offsets=ring_offsets,
+                                 zone_ring_offsets=zone_ring_offsets,
+                                 slim_objects=self.slim_objects[indices])
+
+    def rings(self, index: int) -> List['np.ndarray']:
+        """
+        Returns the rings of the polygons of the zone at the given position as views on coordinates
+
+        :param index:
+        """
+        index = self._normalize_index(index)
+        ring_offsets = self.ring_offsets[self.zone_ring_offsets[index]:self.zone_ring_offsets[index + 1] + 1]
+
+        return [self.coordinates[start:end] for start, end in zip(ring_offsets[:-1], ring_offsets[1:])]
+
+    def uas_zone_object(self, index: int) -> Dict[str, Any]:
+        """
+        Rebuilds the JSON object of the zone at the given position from the columns and its slim object
+
+        :param index:
+        """
+        index = self._normalize_index(index)
+        slim_object = self.slim_objects[index]
+        rings = iter(self.rings(index))
+
+        geometry = []
+        for volume in slim_object['geometry']:
+            projection = volume['horizontalProjection']
+            if _RING_COUNT_KEY in projection:
+                ring_count = projection[_RING_COUNT_KEY]
+                projection = {key: value for key, value in projection.items() if key != _RING_COUNT_KEY}
+                projection['coordinates'] = [next(rings).tolist() for _ in range(ring_count)]
+                volume = dict(volume, horizontalProjection=projection)
+            elif projection['type'] != 'Circle':
+                # the positions with altitudes were kept in the slim object, their planar copies are skipped
+                for _ in projection['coordinates']:
+                    next(rings)
+            geometry.append(volume)
+
+        u_space_class = self.u_space_classes[index]
+
+        return dict(slim_object,
+                    identifier=self.identifiers[index],
+                    type=TYPES[self.types[index]].value,
+                    restriction=RESTRICTIONS[self.restrictions[index]].value,
+                    uSpaceClass=U_SPACE_CLASSES[u_space_class].value if u_space_class >= 0 else None,
+                    geometry=geometry)
+
+    def uas_zone(self, index: int) -> UASZone:
+        return UASZone.from_json(self.uas_zone_object(index))
+
+    def to_uas_zones(self) -> List[UASZone]:
+        return [self.uas_zone(index) for index in range(len(self))]
+
+    def intersects_bounding_box(self, bounding_box: BoundingBox) -> 'np.ndarray':
+        """
+        Returns the boolean mask of the zones whose bounding box intersects the given one
+
+        :param bounding_box: (min_lon, min_lat, max_lon, max_lat)
+        """
+        min_x, min_y, max_x, max_y = bounding_box
+
+        return (self.bounding_boxes[:, 0] <= max_x) & (self.bounding_boxes[:, 2] >= min_x) & \
+               (self.bounding_boxes[:, 1] <= max_y) & (self.bounding_boxes[:, 3] >= min_y)
+
+    def applicable_between(self, start_date_time: datetime, end_date_time: datetime) -> 'np.ndarray':
+        """
+        Returns the boolean mask of the zones whose applicability overlaps the given time range
+
+        :param start_date_time:
+        :param end_date_time:
+        """
+        return (self.applicability_starts <= _epoch(end_date_time)) & \
+               (self.applicability_ends >= _epoch(start_date_time))
@@ -0,0 +1,126 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from typing import Any
+
+from geofencing_service_client.models import Polygon, Circle, AirspaceVolume, DailyPeriod, TimePeriod, Authority, \
+    UASZone, UASZoneFilterReply
+
+# Slotted versions of the models of the UASZones meant for keeping large numbers of them in memory. They have no
+# per-instance __dict__ and reuse the constructors and the from_json/to_json of the models they mirror.
+
+
+class _CompactModel:
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ == self.__class__ and \
+            all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{self.__class__.__name__}({fields})'
+
+
+class CompactPolygon(_CompactModel):
+    __slots__ = ('type', 'coordinates')
+
+    __init__ = Polygon.__init__
+    from_json = classmethod(Polygon.from_json.__func__)
+    to_json = Polygon.to_json
+
+
+class CompactCircle(_CompactModel):
+    __slots__ = ('type', 'center', 'radius')
+
+    __init__ = Circle.__init__
+    from_json = classmethod(Circle.from_json.__func__)
+    to_json = Circle.to_json
+
+
+class CompactAirspaceVolume(_CompactModel):
+    __slots__ = ('horizontal_projection', 'uom_dimensions', 'upper_limit', 'lower_limit', 'upper_vertical_reference',
+                 'lower_vertical_reference')
+
+    _polygon_class = CompactPolygon
+    _circle_class = CompactCircle
+
+    __init__ = AirspaceVolume.__init__
+    from_json = classmethod(AirspaceVolume.from_json.__func__)
+    to_json = AirspaceVolume.to_json
+
+
+class CompactDailyPeriod(_CompactModel):
+    __slots__ = ('day', 'start_time', 'end_time')
+
+    __init__ = DailyPeriod.__init__
+    from_json = classmethod(DailyPeriod.from_json.__func__)
+    to_json = DailyPeriod.to_json
+
+
+class CompactTimePeriod(_CompactModel):
+    __slots__ = ('permanent', 'start_date_time', 'end_date_time', 'schedule')
+
+    _daily_period_class = CompactDailyPeriod
+
+    __init__ = TimePeriod.__init__
+    from_json = classmethod(TimePeriod.from_json.__func__)
+    to_json = TimePeriod.to_json
+
+
+class CompactAuthority(_CompactModel):
+    __slots__ = ('name', 'service', 'purpose', 'email', 'contact_name', 'site_url', 'phone', 'interval_before')
+
+    __init__ = Authority.__init__
+    from_json = classmethod(Authority.from_json.__func__)
+    to_json = Authority.to_json
+
+
+class CompactUASZone(_CompactModel):
+    __slots__ = ('identifier', 'country', 'type', 'restriction', 'zone_authority', 'geometry', 'name',
+                 'restriction_conditions', 'region', 'reason', 'other_reason_info', 'regulation_exemption',
+                 'u_space_class', 'message', 'applicability', 'extended_properties')
+
+    _authority_class = CompactAuthority
+    _airspace_volume_class = CompactAirspaceVolume
+    _time_period_class = CompactTimePeriod
+
+    __init__ = UASZone.__init__
+    from_json = classmethod(UASZone.from_json.__func__)
+    to_json = UASZone.to_json
+
+
+class CompactUASZoneFilterReply(UASZoneFilterReply):
+
+    _uas_zone_class = CompactUASZone
@@ -30,20 +30,36 @@ Details on EUROCONTROL: http://www.eurocontrol.int
 
 __author__ = "EUROCONTROL (SWIM)"
 
+import inspect
 import json
 from functools import wraps
 
 from rest_client.errors import APIError
 
 
+def _extract_geofencing_service_error_detail(e: APIError) -> None:
+    geofencing_service_reply = json.loads(e.detail)
+    e.detail = geofencing_service_reply['genericReply']['RequestExceptionDescription']
+
+
 def handle_geofencing_service_error(f):
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def async_decorator(*args, **kwargs):
+            try:
+                return await f(*args, **kwargs)
+            except APIError as e:
+                _extract_geofencing_service_error_detail(e)
+                raise e
+
+        return async_decorator
+
     @wraps(f)
     def decorator(*args, **kwargs):
         try:
             return f(*args, **kwargs)
         except APIError as e:
-            geofencing_service_reply = json.loads(e.detail)
-            e.detail = geofencing_service_reply['genericReply']['RequestExceptionDescription']
+            _extract_geofencing_service_error_detail(e)
             raise e
 
     return decorator
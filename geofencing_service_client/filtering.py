@@ -0,0 +1,125 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import datetime
+from typing import Any, List, Iterable
+
+from geofencing_service_client.geometry import horizontal_projection_contains, horizontal_projections_intersect
+from geofencing_service_client.models import UASZonesFilter, UASZone, AirspaceVolume
+from geofencing_service_client.utils import make_timezone_aware
+
+
+def _as_aware(dt: datetime) -> datetime:
+    # naive date times of the UASZones are considered UTC
+    return dt if dt.tzinfo is not None else make_timezone_aware(dt)
+
+
+def _as_sent(dt: datetime) -> datetime:
+    # UASZonesFilter.to_json replaces the timezone of its date times with UTC, so the filters are compared by the
+    # date times the Geofencing Service actually gets
+    return make_timezone_aware(dt)
+
+
+def _same_vertical_range(airspace_volume1: AirspaceVolume, airspace_volume2: AirspaceVolume) -> bool:
+    return (airspace_volume1.uom_dimensions, airspace_volume1.lower_limit, airspace_volume1.lower_vertical_reference,
+            airspace_volume1.upper_limit, airspace_volume1.upper_vertical_reference) == \
+           (airspace_volume2.uom_dimensions, airspace_volume2.lower_limit, airspace_volume2.lower_vertical_reference,
+            airspace_volume2.upper_limit, airspace_volume2.upper_vertical_reference)
+
+
+def uas_zones_filter_contains(outer: UASZonesFilter, inner: UASZonesFilter) -> bool:
+    """
+    Whether every UASZone satisfying the inner filter also satisfies the outer one, so that the reply of the inner
+    filter can be derived from the reply of the outer one with uas_zone_matches_filter. Both filters should have the
+    same vertical range, the area and the time range of the inner filter should lie within the ones of the outer
+    filter and its regions should be a subset of the outer regions. The check is conservative: inner polygons with
+    holes are never considered contained.
+
+    :param outer:
+    :param inner:
+    :return:
+    """
+    if outer.regions and (not inner.regions or not set(inner.regions) <= set(outer.regions)):
+        return False
+
+    if not outer.regions and inner.regions:
+        return False
+
+    if not _as_sent(outer.start_date_time) <= _as_sent(inner.start_date_time) or \
+            not _as_sent(inner.end_date_time) <= _as_sent(outer.end_date_time):
+        return False
+
+    if not _same_vertical_range(outer.airspace_volume, inner.airspace_volume):
+        return False
+
+    inner_projection = inner.airspace_volume.horizontal_projection
+    if inner_projection.type == 'Polygon' and len(inner_projection.coordinates) > 1:
+        return False
+
+    return horizontal_projection_contains(outer.airspace_volume.horizontal_projection, inner_projection)
+
+
+def uas_zone_matches_filter(uas_zone: UASZone, uas_zones_filter: UASZonesFilter) -> bool:
+    """
+    Whether the UASZone lies in the regions of the filter, its applicability overlaps with the time range of the filter
+    and at least one of its volumes intersects with the area of the filter. The vertical range is not checked, hence
+    it is only meant to narrow down the reply of a filter with the same vertical range.
+
+    :param uas_zone:
+    :param uas_zones_filter:
+    :return:
+    """
+    if uas_zones_filter.regions and uas_zone.region not in uas_zones_filter.regions:
+        return False
+
+    applicability = uas_zone.applicability
+    if applicability is not None and (
+            _as_aware(applicability.start_date_time) > _as_sent(uas_zones_filter.end_date_time) or
+            _as_aware(applicability.end_date_time) < _as_sent(uas_zones_filter.start_date_time)):
+        return False
+
+    return uas_zone_intersects_area(uas_zone, uas_zones_filter.airspace_volume.horizontal_projection)
+
+
+def uas_zone_intersects_area(uas_zone: UASZone, horizontal_projection: Any) -> bool:
+    """
+    :param uas_zone:
+    :param horizontal_projection: a Polygon or Circle
+    :return: whether at least one of the volumes of the UASZone intersects with the area, the holes of polygons
+             excluded
+    """
+    return any(horizontal_projections_intersect(airspace_volume.horizontal_projection, horizontal_projection)
+               for airspace_volume in uas_zone.geometry)
+
+
+def filter_uas_zones_locally(uas_zones: Iterable[UASZone], uas_zones_filter: UASZonesFilter) -> List[UASZone]:
+    return [uas_zone for uas_zone in uas_zones if uas_zone_matches_filter(uas_zone, uas_zones_filter)]
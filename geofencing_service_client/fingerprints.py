@@ -0,0 +1,109 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import hashlib
+import json
+from datetime import timezone
+from typing import Any, TYPE_CHECKING
+
+from geofencing_service_client.utils import parse_datetime_iso
+
+if TYPE_CHECKING:  # the models use the fingerprints as well
+    from geofencing_service_client.models import UASZonesFilter
+
+# coordinates are compared up to ~0.1mm so that different float formatting of the same point is not significant
+COORDINATES_PRECISION = 9
+
+_DATETIME_KEYS = {'startDateTime', 'endDateTime'}
+
+
+def _canonical_number(value: Any) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+
+    return round(float(value), COORDINATES_PRECISION)
+
+
+def _canonical_coordinates(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_canonical_coordinates(item) for item in value]
+
+    return _canonical_number(value)
+
+
+def _canonical_datetime(value: str) -> str:
+    return parse_datetime_iso(value).astimezone(timezone.utc).isoformat()
+
+
+def canonicalize(object_json: Any) -> Any:
+    """
+    Normalizes the JSON representation of a model so that equivalent representations become identical:
+    - coordinates, centers and radiuses are turned into floats with a fixed precision
+    - date times are converted to UTC
+    - regions are sorted
+
+    :param object_json:
+    :return:
+    """
+    if isinstance(object_json, dict):
+        result = {}
+        for key, value in object_json.items():
+            if key in ('coordinates', 'center', 'radius'):
+                value = _canonical_coordinates(value)
+            elif key in _DATETIME_KEYS and isinstance(value, str):
+                value = _canonical_datetime(value)
+            elif key == 'regions' and isinstance(value, list):
+                value = sorted(value)
+            else:
+                value = canonicalize(value)
+            result[key] = value
+
+        return result
+
+    if isinstance(object_json, list):
+        return [canonicalize(item) for item in object_json]
+
+    return object_json
+
+
+def fingerprint_json(object_json: Any) -> str:
+    """
+    :param object_json:
+    :return: a hex digest of the canonical form of the JSON object
+    """
+    canonical = json.dumps(canonicalize(object_json), sort_keys=True, separators=(',', ':'))
+
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def uas_zones_filter_fingerprint(uas_zones_filter: 'UASZonesFilter') -> str:
+    return fingerprint_json(uas_zones_filter.to_json())
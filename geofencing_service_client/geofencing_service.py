@@ -28,13 +28,30 @@ http://opensource.org/licenses/BSD-3-Clause
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
 import typing as t
+from datetime import timedelta
 
 from rest_client import Requestor, ClientFactory
-from rest_client.typing import RequestHandler
+from rest_client.errors import APIError
+from rest_client.typing import RequestHandler, JSONType
 
+from geofencing_service_client.bulk import BulkReport, run_bulk, map_concurrently, iter_concurrently
+from geofencing_service_client.cache import FilterReplyCache
 from geofencing_service_client.errors import handle_geofencing_service_error
+from geofencing_service_client.filtering import uas_zone_intersects_area
+from geofencing_service_client.fingerprints import uas_zones_filter_fingerprint
+from geofencing_service_client.hedging import HedgingPolicy
+from geofencing_service_client.interning import InternTable
+from geofencing_service_client.json_codecs import JSONCodec
 from geofencing_service_client.models import UASZone, UASZonesFilter, UASZoneFilterReply, UASZoneCreateReply, \
-    SubscribeToUASZonesUpdatesReply, GenericReply, UASZoneSubscriptionReply, UASZoneSubscriptionsReply, Reply
+    SubscribeToUASZonesUpdatesReply, GenericReply, UASZoneSubscriptionReply, UASZoneSubscriptionsReply, Reply, \
+    LazyUASZone
+from geofencing_service_client.pool import PooledRequestHandler
+from geofencing_service_client.rate_limit import RateLimiter, EndpointGroup
+from geofencing_service_client.sharding import split_uas_zones_filter_by_area, split_uas_zones_filter_by_time, \
+    tiles_are_exact
+from geofencing_service_client.singleflight import SingleFlight
+from geofencing_service_client.streaming import UASZoneFilterReplyStream
+from geofencing_service_client.utils import unique_by
 
 __author__ = "EUROCONTROL (SWIM)"
 
@@ -43,12 +60,37 @@ class GeofencingServiceClient(Requestor, ClientFactory):
 
     _BASE_URL = 'geofencing-service/api/1.0/'
 
-    def __init__(self, request_handler: RequestHandler) -> None:
+    def __init__(self,
+                 request_handler: RequestHandler,
+                 cache: t.Optional[FilterReplyCache] = None,
+                 coalesce_requests: bool = False,
+                 hedging_policy: t.Optional[HedgingPolicy] = None,
+                 rate_limiter: t.Optional[RateLimiter] = None,
+                 json_codec: t.Optional[JSONCodec] = None,
+                 intern_table: t.Optional[InternTable] = None) -> None:
         """
         :param request_handler: an instance of an object capable of handling http requests, i.e. requests.session()
+        :param cache: if provided, the replies of filter_uas_zones are cached and invalidated whenever a UASZone is
+                      created or deleted through this client
+        :param coalesce_requests: if True, concurrent filter_uas_zones calls with equivalent filters, or
+                                  get_subscription_by_id calls with the same id, share one request and its reply
+        :param hedging_policy: if provided, it is applied on the requests of filter_uas_zones and
+                               get_subscription_by_id
+        :param rate_limiter: if provided, the requests are delayed to stay within its rates
+        :param json_codec: if provided, it is used instead of the request handler to encode the request bodies and to
+                           decode the response bodies, i.e. default_json_codec() for the fastest one installed
+        :param intern_table: if provided, the UASZones retrieved by filtering share their identical authorities,
+                             applicabilities, strings and lists through it, which should then be treated as read only
         """
         Requestor.__init__(self, request_handler)
 
+        self.cache = cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self.hedging_policy = hedging_policy
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec
+        self.intern_table = intern_table
+
         self._url_uas_zones = self._BASE_URL + 'uas_zones/'
         self._url_uas_zones_filter = self._BASE_URL + 'uas_zones/filter/'
         self._url_uas_zones_by_identifier = self._BASE_URL + 'uas_zones/{uas_zone_identifier}'
@@ -56,7 +98,58 @@ class GeofencingServiceClient(Requestor, ClientFactory):
         self._url_subscription_by_id = self._BASE_URL + 'subscriptions/{subscription_id}'
         self._url_ping_credentials = self._BASE_URL + 'ping-credentials'
 
-    @handle_geofencing_service_error
+    @classmethod
+    def create_pooled(cls,
+                      host: str,
+                      https: bool = True,
+                      timeout: int = 30,
+                      verify: t.Union[bool, str] = True,
+                      username: t.Optional[str] = None,
+                      password: t.Optional[str] = None,
+                      pool_size: int = 10,
+                      max_retries: int = 0,
+                      prewarm: int = 0,
+                      **kwargs) -> 'GeofencingServiceClient':
+        """
+        Creates a client on top of a keep-alive connection pool of pool_size connections. pool_size should be at
+        least the max_concurrency used with the bulk and fan-out methods.
+
+        :param host:
+        :param https:
+        :param timeout:
+        :param verify:
+        :param username:
+        :param password:
+        :param pool_size:
+        :param max_retries:
+        :param prewarm: the number of connections to open upfront by pinging the credentials concurrently, so that
+                        the first actual requests do not pay for the TCP and TLS setup
+        :param kwargs: passed to the constructor of the client, i.e. cache
+        :return:
+        """
+        request_handler = PooledRequestHandler(host=host,
+                                               https=https,
+                                               timeout=timeout,
+                                               verify=verify,
+                                               auth=(username, password) if username is not None else None,
+                                               pool_size=pool_size,
+                                               max_retries=max_retries)
+
+        client = cls(request_handler=request_handler, **kwargs)
+
+        if prewarm > 0:
+            client.prewarm(connections=min(prewarm, pool_size))
+
+        return client
+
+    def prewarm(self, connections: int) -> None:
+        """
+        Opens up to the given number of connections by pinging the credentials concurrently
+
+        :param connections:
+        """
+        map_concurrently(lambda _: self.ping_credentials(), range(connections), max_concurrency=connections)
+
     def filter_uas_zones(self, uas_zones_filter: UASZonesFilter) -> UASZoneFilterReply:
         """
         Retrieves UASZones based on the provided filter criteria
@@ -64,10 +157,205 @@ class GeofencingServiceClient(Requestor, ClientFactory):
         :param uas_zones_filter:
         :return:
         """
-        return self.perform_request('POST',
-                                    self._url_uas_zones_filter,
-                                    json=uas_zones_filter.to_json(),
-                                    response_class=UASZoneFilterReply)
+        if self.cache is None:
+            return self._filter_uas_zones(uas_zones_filter)
+
+        reply = self.cache.get(uas_zones_filter)
+        if reply is None:
+            generation = self.cache.generation
+            reply = self._filter_uas_zones(uas_zones_filter)
+            self.cache.put(uas_zones_filter, reply, generation=generation)
+
+        return reply
+
+    def _filter_uas_zones(self, uas_zones_filter: UASZonesFilter) -> UASZoneFilterReply:
+        if self._single_flight is None:
+            return self._request_uas_zones_filter(uas_zones_filter)
+
+        key = ('filter_uas_zones', uas_zones_filter_fingerprint(uas_zones_filter))
+
+        return self._single_flight.do(key, lambda: self._request_uas_zones_filter(uas_zones_filter))
+
+    # the errors are handled here rather than in the public methods so that coalesced calls share the handled error
+    @handle_geofencing_service_error
+    def _request_uas_zones_filter(self, uas_zones_filter: UASZonesFilter) -> UASZoneFilterReply:
+        # filtering does not change any state on the server so it can be hedged
+        return self._perform_read_request('POST',
+                                          self._url_uas_zones_filter,
+                                          json=uas_zones_filter.to_json(),
+                                          response_class=self._uas_zone_filter_reply_class)
+
+    def iter_filter_uas_zones(self,
+                              uas_zones_filter: UASZonesFilter,
+                              chunk_size: int = 64 * 1024,
+                              lazy: bool = False) -> UASZoneFilterReplyStream:
+        """
+        Retrieves UASZones based on the provided filter criteria yielding them one at a time while the response is
+        being read, so that memory stays constant regardless of their number. The genericReply of the response is
+        available via the generic_reply of the returned stream once it has been read.
+
+        :param uas_zones_filter:
+        :param chunk_size: how many bytes of the response to read at a time
+        :param lazy: whether to yield LazyUASZone objects that decode their fields on first access
+        :return:
+        """
+        response = self._request_uas_zones_filter_stream(uas_zones_filter)
+
+        return UASZoneFilterReplyStream(response.iter_content(chunk_size=chunk_size),
+                                        on_close=response.close,
+                                        uas_zone_class=LazyUASZone if lazy else self._uas_zone_class)
+
+    @handle_geofencing_service_error
+    def _request_uas_zones_filter_stream(self, uas_zones_filter: UASZonesFilter) -> t.Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(EndpointGroup.READS)
+
+        response = self.request_handler.post(self._url_uas_zones_filter,
+                                             stream=True,
+                                             **self._body_kwargs(uas_zones_filter.to_json()))
+
+        if not 200 <= response.status_code < 300:
+            try:
+                raise APIError(response.text, response.status_code)
+            finally:
+                response.close()
+
+        return response
+
+    @property
+    def _uas_zone_class(self) -> t.Type[UASZone]:
+        return UASZone if self.intern_table is None else self.intern_table.uas_zone_class
+
+    @property
+    def _uas_zone_filter_reply_class(self) -> t.Type[UASZoneFilterReply]:
+        return UASZoneFilterReply if self.intern_table is None else self.intern_table.uas_zone_filter_reply_class
+
+    def perform_request(self, method: str, url: str, *args, **kwargs) -> t.Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._endpoint_group(method, url))
+
+        if self.json_codec is not None:
+            return self._perform_request_with_codec(method, url, *args, **kwargs)
+
+        return Requestor.perform_request(self, method, url, *args, **kwargs)
+
+    def _body_kwargs(self, json: JSONType) -> t.Dict[str, t.Any]:
+        if self.json_codec is None:
+            return {'json': json}
+
+        return {'data': self.json_codec.dumps(json), 'headers': {'Content-Type': 'application/json'}}
+
+    def _perform_request_with_codec(self,
+                                    method: str,
+                                    url: str,
+                                    json: t.Optional[JSONType] = None,
+                                    response_class: t.Optional[t.Any] = None) -> t.Any:
+        request_kwargs = self._body_kwargs(json) if json is not None else {}
+
+        response = getattr(self.request_handler, method.lower())(url, **request_kwargs)
+
+        # the error detail stays the text of the response as handle_geofencing_service_error expects
+        if not 200 <= response.status_code < 300:
+            raise APIError(response.text, response.status_code)
+
+        if not response.content:
+            return None
+
+        response_json = self.json_codec.loads(response.content)
+
+        return response_class.from_json(response_json) if response_class else response_json
+
+    def _endpoint_group(self, method: str, url: str) -> EndpointGroup:
+        if url.startswith(self._url_subscriptions):
+            return EndpointGroup.SUBSCRIPTIONS
+
+        if method == 'GET' or url == self._url_uas_zones_filter:
+            return EndpointGroup.READS
+
+        return EndpointGroup.WRITES
+
+    def _perform_read_request(self, *args, **kwargs) -> t.Any:
+        if self.hedging_policy is None:
+            return self.perform_request(*args, **kwargs)
+
+        return self.hedging_policy.call(lambda: self.perform_request(*args, **kwargs))
+
+    def filter_uas_zones_many(self,
+                              uas_zones_filters: t.Iterable[UASZonesFilter],
+                              max_concurrency: int = 8,
+                              merge: bool = False) -> t.Union[t.List[UASZoneFilterReply], t.List[UASZone]]:
+        """
+        Retrieves UASZones for many filters with up to max_concurrency requests in flight over the same request
+        handler, so its connection pool is shared between them.
+
+        :param uas_zones_filters:
+        :param max_concurrency:
+        :param merge: if True, the UASZones of all the replies are merged in one list, deduplicated by identifier
+        :return: the UASZoneFilterReply of each filter in input order or, if merge is True, the merged UASZones
+        """
+        replies = map_concurrently(self.filter_uas_zones, uas_zones_filters, max_concurrency=max_concurrency)
+
+        if not merge:
+            return replies
+
+        uas_zones = (uas_zone for reply in replies for uas_zone in reply.uas_zone_list)
+
+        return list(unique_by(uas_zones, key=lambda uas_zone: uas_zone.identifier))
+
+    def iter_filter_uas_zones_tiled(self,
+                                    uas_zones_filter: UASZonesFilter,
+                                    rows: int = 2,
+                                    columns: int = 2,
+                                    max_concurrency: int = 4) -> t.Iterator[UASZone]:
+        """
+        Splits the area of the filter in a grid of rows x columns tiles, retrieves the UASZones of the tiles
+        concurrently and yields them as the tiles arrive, deduplicated by identifier across tiles. The tiles of
+        concave polygons and of polygons with holes reach outside of them, so their UASZones are narrowed down to the
+        ones within the area.
+
+        :param uas_zones_filter:
+        :param rows:
+        :param columns:
+        :param max_concurrency:
+        :return:
+        """
+        tile_filters = split_uas_zones_filter_by_area(uas_zones_filter, rows=rows, columns=columns)
+
+        replies = iter_concurrently(self.filter_uas_zones, tile_filters, max_concurrency=max_concurrency, ordered=False)
+        uas_zones = (uas_zone for reply in replies for uas_zone in reply.uas_zone_list)
+
+        if not tiles_are_exact(uas_zones_filter):
+            horizontal_projection = uas_zones_filter.airspace_volume.horizontal_projection
+            uas_zones = (uas_zone for uas_zone in uas_zones
+                         if uas_zone_intersects_area(uas_zone, horizontal_projection))
+
+        return unique_by(uas_zones, key=lambda uas_zone: uas_zone.identifier)
+
+    def iter_filter_uas_zones_by_time_window(self,
+                                             uas_zones_filter: UASZonesFilter,
+                                             window: timedelta = timedelta(weeks=1),
+                                             max_concurrency: int = 4,
+                                             lazy: bool = False) -> t.Iterator[UASZone]:
+        """
+        Splits the time range of the filter in consecutive windows and yields the UASZones window by window in
+        chronological order, deduplicated by identifier across windows. The UASZones of the first window can be
+        processed while the next ones are still being retrieved.
+
+        :param uas_zones_filter:
+        :param window: i.e. timedelta(days=1) or timedelta(weeks=1)
+        :param max_concurrency: how many windows are retrieved in parallel ahead of the consumer
+        :param lazy: if True, a window is retrieved only once the UASZones of the previous one have been consumed
+        :return:
+        """
+        window_filters = split_uas_zones_filter_by_time(uas_zones_filter, window=window)
+
+        if lazy:
+            replies = (self.filter_uas_zones(window_filter) for window_filter in window_filters)
+        else:
+            replies = iter_concurrently(self.filter_uas_zones, window_filters, max_concurrency=max_concurrency)
+        uas_zones = (uas_zone for reply in replies for uas_zone in reply.uas_zone_list)
+
+        return unique_by(uas_zones, key=lambda uas_zone: uas_zone.identifier)
 
     @handle_geofencing_service_error
     def post_uas_zone(self, uas_zone: UASZone) -> UASZoneCreateReply:
@@ -77,10 +365,24 @@ class GeofencingServiceClient(Requestor, ClientFactory):
         :param uas_zone:
         :return:
         """
-        return self.perform_request('POST',
-                                    self._url_uas_zones,
-                                    json=uas_zone.to_json(),
-                                    response_class=UASZoneCreateReply)
+        try:
+            return self.perform_request('POST',
+                                        self._url_uas_zones,
+                                        json=uas_zone.to_json(),
+                                        response_class=UASZoneCreateReply)
+        finally:
+            self._invalidate_cache()
+
+    def post_uas_zones(self, uas_zones: t.Iterable[UASZone], max_concurrency: int = 8) -> BulkReport:
+        """
+        Creates many UASZones with up to max_concurrency requests in flight. A failing UASZone does not stop the
+        upload; its APIError takes the place of its reply in the report.
+
+        :param uas_zones:
+        :param max_concurrency:
+        :return: a BulkReport with a UASZoneCreateReply or APIError per UASZone and the latency stats of the run
+        """
+        return run_bulk(self.post_uas_zone, uas_zones, max_concurrency=max_concurrency)
 
     @handle_geofencing_service_error
     def delete_uas_zone_by_identifier(self, uas_zone_identifier: int) -> GenericReply:
@@ -92,7 +394,14 @@ class GeofencingServiceClient(Requestor, ClientFactory):
         """
         url = self._url_uas_zones_by_identifier.format(uas_zone_identifier=uas_zone_identifier)
 
-        return self.perform_request('DELETE', url, response_class=GenericReply)
+        try:
+            return self.perform_request('DELETE', url, response_class=GenericReply)
+        finally:
+            self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate()
 
     @handle_geofencing_service_error
     def post_subscription(self, uas_zones_filter: UASZonesFilter) -> SubscribeToUASZonesUpdatesReply:
@@ -119,7 +428,6 @@ class GeofencingServiceClient(Requestor, ClientFactory):
         """
         return self.perform_request('GET', self._url_subscriptions, response_class=UASZoneSubscriptionsReply)
 
-    @handle_geofencing_service_error
     def get_subscription_by_id(self, subscription_id: str) -> UASZoneSubscriptionReply:
         """
         Retrieves subscription data (id and queue)
@@ -127,9 +435,18 @@ class GeofencingServiceClient(Requestor, ClientFactory):
         :param subscription_id:
         :return:
         """
+        if self._single_flight is None:
+            return self._request_subscription_by_id(subscription_id)
+
+        key = ('get_subscription_by_id', subscription_id)
+
+        return self._single_flight.do(key, lambda: self._request_subscription_by_id(subscription_id))
+
+    @handle_geofencing_service_error
+    def _request_subscription_by_id(self, subscription_id: str) -> UASZoneSubscriptionReply:
         url = self._url_subscription_by_id.format(subscription_id=subscription_id)
 
-        return self.perform_request('GET', url, response_class=UASZoneSubscriptionReply)
+        return self._perform_read_request('GET', url, response_class=UASZoneSubscriptionReply)
 
     @handle_geofencing_service_error
     def put_subscription(self, subscription_id: str, update_data: t.Dict[str, bool]) -> Reply:
@@ -0,0 +1,432 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import math
+from typing import List, Tuple, Sequence, Union, Callable, Any
+
+Point = Sequence[Union[float, int]]
+Ring = List[List[Union[float, int]]]
+BoundingBox = Tuple[float, float, float, float]
+
+EARTH_RADIUS_IN_M = 6371008.8
+
+# clipped areas below this fraction of the clipping box are considered rounding errors
+_ZERO_AREA_TOLERANCE = 1e-9
+
+
+def ring_bounding_box(ring: Sequence[Point]) -> BoundingBox:
+    """
+    :param ring:
+    :return: (min_x, min_y, max_x, max_y)
+    """
+    xs = [point[0] for point in ring]
+    ys = [point[1] for point in ring]
+
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def split_bounding_box(bounding_box: BoundingBox, rows: int, columns: int) -> List[BoundingBox]:
+    """
+    Splits the bounding box in a grid of rows x columns equally sized cells
+
+    :param bounding_box:
+    :param rows:
+    :param columns:
+    :return: the cells row by row, starting from the lower left one
+    """
+    if rows < 1 or columns < 1:
+        raise ValueError(f'rows and columns should be at least 1, got {rows} and {columns}')
+
+    min_x, min_y, max_x, max_y = bounding_box
+    width = (max_x - min_x) / columns
+    height = (max_y - min_y) / rows
+
+    # the outer edges are taken from the bounding box itself so that floating point errors do not leave gaps
+    xs = [min_x + width * column for column in range(columns)] + [max_x]
+    ys = [min_y + height * row for row in range(rows)] + [max_y]
+
+    return [(xs[column], ys[row], xs[column + 1], ys[row + 1]) for row in range(rows) for column in range(columns)]
+
+
+def _clip_ring_by_edge(ring: Ring,
+                       is_inside: Callable[[Point], bool],
+                       intersection: Callable[[Point, Point], List[float]]) -> Ring:
+    result = []
+    for index, current in enumerate(ring):
+        previous = ring[index - 1]
+
+        if is_inside(current):
+            if not is_inside(previous):
+                result.append(intersection(previous, current))
+            result.append(list(current))
+        elif is_inside(previous):
+            result.append(intersection(previous, current))
+
+    return result
+
+
+def _intersection_at_x(x: float) -> Callable[[Point, Point], List[float]]:
+    def intersection(p1: Point, p2: Point) -> List[float]:
+        return [x, p1[1] + (p2[1] - p1[1]) * (x - p1[0]) / (p2[0] - p1[0])]
+
+    return intersection
+
+
+def _intersection_at_y(y: float) -> Callable[[Point, Point], List[float]]:
+    def intersection(p1: Point, p2: Point) -> List[float]:
+        return [p1[0] + (p2[0] - p1[0]) * (y - p1[1]) / (p2[1] - p1[1]), y]
+
+    return intersection
+
+
+def ring_area(ring: Sequence[Point]) -> float:
+    """
+    :param ring: a closed ring
+    :return: the area enclosed by the ring in squared units of its coordinates (shoelace formula)
+    """
+    return abs(sum(p[0] * q[1] - q[0] * p[1] for p, q in zip(ring, ring[1:]))) / 2
+
+
+def ring_is_convex(ring: Sequence[Point]) -> bool:
+    """
+    :param ring: a closed ring
+    :return: whether all the turns along the ring have the same direction. Collinear points are ignored.
+    """
+    points = _remove_duplicate_points([list(point) for point in ring[:-1]])
+    turns = [_orientation(points[index - 2], points[index - 1], point) for index, point in enumerate(points)]
+
+    return all(turn >= 0 for turn in turns) or all(turn <= 0 for turn in turns)
+
+
+def bounding_box_ring(bounding_box: BoundingBox) -> Ring:
+    """
+    :param bounding_box:
+    :return: the closed counterclockwise ring of the bounding box
+    """
+    min_x, min_y, max_x, max_y = bounding_box
+
+    return [[min_x, min_y], [max_x, min_y], [max_x, max_y], [min_x, max_y], [min_x, min_y]]
+
+
+def _remove_duplicate_points(ring: Ring) -> Ring:
+    # the ring is open, so the last point is compared with the first one as well
+    result = [point for index, point in enumerate(ring) if point != ring[index - 1]]
+
+    return result if result else ring[:1]
+
+
+def clip_ring_to_bounding_box(ring: Sequence[Point], bounding_box: BoundingBox) -> Ring:
+    """
+    Clips a closed GeoJSON ring to the bounding box with the Sutherland-Hodgman algorithm. The result is exact for
+    convex rings. The clipped ring of a concave one encloses the right area, but its disjoint parts are joined by
+    zero width bridges along the edges of the box, which may run outside of the ring.
+
+    :param ring: a closed ring, i.e. its first and last points are the same
+    :param bounding_box:
+    :return: the clipped closed ring without repeated points or an empty list if the ring and the bounding box do not
+             overlap with a positive area
+    """
+    min_x, min_y, max_x, max_y = bounding_box
+
+    # work on the open ring and close it at the end
+    clipped = [list(point) for point in ring[:-1]]
+
+    edges = [
+        (lambda p: p[0] >= min_x, _intersection_at_x(min_x)),
+        (lambda p: p[0] <= max_x, _intersection_at_x(max_x)),
+        (lambda p: p[1] >= min_y, _intersection_at_y(min_y)),
+        (lambda p: p[1] <= max_y, _intersection_at_y(max_y)),
+    ]
+    for is_inside, intersection in edges:
+        if not clipped:
+            break
+        clipped = _clip_ring_by_edge(clipped, is_inside, intersection)
+
+    clipped = _remove_duplicate_points(clipped)
+    if len(clipped) < 3:
+        return []
+
+    clipped.append(list(clipped[0]))
+
+    # rings touching the box along an edge or at a corner are clipped to a degenerate ring
+    if ring_area(clipped) <= _ZERO_AREA_TOLERANCE * (max_x - min_x) * (max_y - min_y):
+        return []
+
+    return clipped
+
+
+def bounding_boxes_intersect(bb1: BoundingBox, bb2: BoundingBox) -> bool:
+    return bb1[0] <= bb2[2] and bb2[0] <= bb1[2] and bb1[1] <= bb2[3] and bb2[1] <= bb1[3]
+
+
+def _orientation(p: Point, q: Point, r: Point) -> float:
+    return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+
+def _on_segment(p: Point, q: Point, r: Point) -> bool:
+    """
+    Whether r, which is collinear with p and q, lies on the segment pq
+    """
+    return min(p[0], q[0]) <= r[0] <= max(p[0], q[0]) and min(p[1], q[1]) <= r[1] <= max(p[1], q[1])
+
+
+def segments_intersect(p1: Point, p2: Point, q1: Point, q2: Point) -> bool:
+    """
+    Whether the segments p1p2 and q1q2 have at least one common point
+    """
+    d1 = _orientation(q1, q2, p1)
+    d2 = _orientation(q1, q2, p2)
+    d3 = _orientation(p1, p2, q1)
+    d4 = _orientation(p1, p2, q2)
+
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        return True
+
+    return (d1 == 0 and _on_segment(q1, q2, p1)) or \
+           (d2 == 0 and _on_segment(q1, q2, p2)) or \
+           (d3 == 0 and _on_segment(p1, p2, q1)) or \
+           (d4 == 0 and _on_segment(p1, p2, q2))
+
+
+def segments_cross(p1: Point, p2: Point, q1: Point, q2: Point) -> bool:
+    """
+    Whether the segments p1p2 and q1q2 cross each other at a single point interior to both of them
+    """
+    d1 = _orientation(q1, q2, p1)
+    d2 = _orientation(q1, q2, p2)
+    d3 = _orientation(p1, p2, q1)
+    d4 = _orientation(p1, p2, q2)
+
+    return ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4))
+
+
+def _ring_edges(ring: Sequence[Point]):
+    return zip(ring, ring[1:])
+
+
+def point_on_ring_boundary(point: Point, ring: Sequence[Point]) -> bool:
+    return any(_orientation(p, q, point) == 0 and _on_segment(p, q, point) for p, q in _ring_edges(ring))
+
+
+def point_in_ring(point: Point, ring: Sequence[Point]) -> bool:
+    """
+    Whether the point lies within the closed ring or on its boundary (ray casting)
+    """
+    if point_on_ring_boundary(point, ring):
+        return True
+
+    x, y = point[0], point[1]
+    inside = False
+    for p, q in _ring_edges(ring):
+        if (p[1] > y) != (q[1] > y):
+            x_intersection = p[0] + (y - p[1]) * (q[0] - p[0]) / (q[1] - p[1])
+            if x < x_intersection:
+                inside = not inside
+
+    return inside
+
+
+def rings_intersect(ring1: Sequence[Point], ring2: Sequence[Point]) -> bool:
+    """
+    Whether the areas enclosed by the two rings have at least one common point
+    """
+    if not bounding_boxes_intersect(ring_bounding_box(ring1), ring_bounding_box(ring2)):
+        return False
+
+    if point_in_ring(ring1[0], ring2) or point_in_ring(ring2[0], ring1):
+        return True
+
+    return any(segments_intersect(p1, p2, q1, q2) for p1, p2 in _ring_edges(ring1) for q1, q2 in _ring_edges(ring2))
+
+
+def point_in_polygon(point: Point, rings: Sequence[Sequence[Point]]) -> bool:
+    """
+    Whether the point lies within the exterior ring of the polygon, i.e. its first ring, and not strictly within one
+    of its interior rings. The boundaries of the holes belong to the polygon.
+    """
+    if not point_in_ring(point, rings[0]):
+        return False
+
+    return not any(point_in_ring(point, hole) and not point_on_ring_boundary(point, hole) for hole in rings[1:])
+
+
+def polygons_intersect(rings1: Sequence[Sequence[Point]], rings2: Sequence[Sequence[Point]]) -> bool:
+    """
+    Whether the areas of the two polygons, i.e. within their exterior rings and outside of their interior rings,
+    have at least one common point
+    """
+    if not bounding_boxes_intersect(ring_bounding_box(rings1[0]), ring_bounding_box(rings2[0])):
+        return False
+
+    # when no boundaries meet, each boundary lies completely within or outside of the other polygon
+    if point_in_polygon(rings1[0][0], rings2) or point_in_polygon(rings2[0][0], rings1):
+        return True
+
+    return any(segments_intersect(p1, p2, q1, q2)
+               for ring1 in rings1 for ring2 in rings2
+               for p1, p2 in _ring_edges(ring1) for q1, q2 in _ring_edges(ring2))
+
+
+def ring_contains_ring(outer: Sequence[Point], inner: Sequence[Point]) -> bool:
+    """
+    Whether the area enclosed by the inner ring lies completely within the area enclosed by the outer one. Common
+    boundaries are allowed.
+    """
+    if not all(point_in_ring(point, outer) for point in inner):
+        return False
+
+    return not any(segments_cross(p1, p2, q1, q2) for p1, p2 in _ring_edges(outer) for q1, q2 in _ring_edges(inner))
+
+
+def haversine_distance(point1: Point, point2: Point) -> float:
+    """
+    :param point1: [lon, lat]
+    :param point2: [lon, lat]
+    :return: the great circle distance in meters
+    """
+    lon1, lat1, lon2, lat2 = map(math.radians, (point1[0], point1[1], point2[0], point2[1]))
+
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+
+    return 2 * EARTH_RADIUS_IN_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _to_local_meters(point: Point, origin: Point) -> Tuple[float, float]:
+    """
+    Projects the point on a plane tangent at origin (equirectangular approximation, fine for short distances)
+    """
+    x = math.radians(point[0] - origin[0]) * math.cos(math.radians(origin[1])) * EARTH_RADIUS_IN_M
+    y = math.radians(point[1] - origin[1]) * EARTH_RADIUS_IN_M
+
+    return x, y
+
+
+def _distance_to_segment(center: Point, p: Point, q: Point) -> float:
+    px, py = _to_local_meters(p, center)
+    qx, qy = _to_local_meters(q, center)
+    dx, dy = qx - px, qy - py
+    length_squared = dx * dx + dy * dy
+
+    t = 0.0 if length_squared == 0 else max(0.0, min(1.0, -(px * dx + py * dy) / length_squared))
+
+    return math.hypot(px + t * dx, py + t * dy)
+
+
+def circle_intersects_ring(center: Point, radius: float, ring: Sequence[Point]) -> bool:
+    if point_in_ring(center, ring):
+        return True
+
+    return any(_distance_to_segment(center, p, q) <= radius for p, q in _ring_edges(ring))
+
+
+def circle_intersects_polygon(center: Point, radius: float, rings: Sequence[Sequence[Point]]) -> bool:
+    """
+    Whether the circle has at least one common point with the area of the polygon, i.e. within its exterior ring and
+    outside of its interior rings
+    """
+    if point_in_polygon(center, rings):
+        return True
+
+    return any(_distance_to_segment(center, p, q) <= radius for ring in rings for p, q in _ring_edges(ring))
+
+
+def circle_contains_ring(center: Point, radius: float, ring: Sequence[Point]) -> bool:
+    return all(haversine_distance(center, point) <= radius for point in ring)
+
+
+def circle_bounding_box(center: Point, radius: float) -> BoundingBox:
+    """
+    :param center: [lon, lat]
+    :param radius: in meters
+    :return: an approximate bounding box in degrees
+    """
+    delta_lat = math.degrees(radius / EARTH_RADIUS_IN_M)
+    delta_lon = delta_lat / max(math.cos(math.radians(center[1])), 1e-12)
+
+    return center[0] - delta_lon, center[1] - delta_lat, center[0] + delta_lon, center[1] + delta_lat
+
+
+def horizontal_projection_bounding_box(projection: Any) -> BoundingBox:
+    """
+    :param projection: a Polygon or Circle
+    :return:
+    """
+    if projection.type == 'Circle':
+        return circle_bounding_box(projection.center, projection.radius)
+
+    return ring_bounding_box(projection.coordinates[0])
+
+
+def merge_bounding_boxes(bounding_boxes: Sequence[BoundingBox]) -> BoundingBox:
+    return (min(bb[0] for bb in bounding_boxes),
+            min(bb[1] for bb in bounding_boxes),
+            max(bb[2] for bb in bounding_boxes),
+            max(bb[3] for bb in bounding_boxes))
+
+
+def horizontal_projections_intersect(projection1: Any, projection2: Any) -> bool:
+    """
+    :param projection1: a Polygon or Circle
+    :param projection2: a Polygon or Circle
+    :return:
+    """
+    if projection1.type == 'Circle' and projection2.type == 'Circle':
+        return haversine_distance(projection1.center, projection2.center) <= projection1.radius + projection2.radius
+
+    if projection1.type == 'Circle':
+        return circle_intersects_polygon(projection1.center, projection1.radius, projection2.coordinates)
+
+    if projection2.type == 'Circle':
+        return circle_intersects_polygon(projection2.center, projection2.radius, projection1.coordinates)
+
+    return polygons_intersect(projection1.coordinates, projection2.coordinates)
+
+
+def horizontal_projection_contains(outer: Any, inner: Any) -> bool:
+    """
+    Whether the inner Polygon or Circle lies completely within the outer one. The check is conservative: it returns
+    False for polygons with holes and for circles within polygons.
+
+    :param outer: a Polygon or Circle
+    :param inner: a Polygon or Circle
+    :return:
+    """
+    if outer.type == 'Circle':
+        if inner.type == 'Circle':
+            return haversine_distance(outer.center, inner.center) + inner.radius <= outer.radius
+
+        return circle_contains_ring(outer.center, outer.radius, inner.coordinates[0])
+
+    if inner.type == 'Circle' or len(outer.coordinates) > 1:
+        return False
+
+    return ring_contains_ring(outer.coordinates[0], inner.coordinates[0])
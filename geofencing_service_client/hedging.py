@@ -0,0 +1,202 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError
+from typing import Callable, Generic, Optional, TypeVar
+
+from geofencing_service_client.stats import percentile
+
+T = TypeVar('T')
+
+
+class HedgingStats:
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """
+        The fraction of the requests that were hedged
+        """
+        return self.hedges / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """
+        The fraction of the hedges that replied before their primary request
+        """
+        return self.hedge_wins / self.hedges if self.hedges else 0.0
+
+    def __repr__(self) -> str:
+        return f"HedgingStats(requests={self.requests}, hedges={self.hedges}, hedge_wins={self.hedge_wins}, " \
+               f"hedge_rate={self.hedge_rate:.3f}, win_rate={self.win_rate:.3f})"
+
+
+class _Attempt(Generic[T]):
+
+    def __init__(self, func: Callable[[], T]) -> None:
+        """
+        Runs func in the pool noting when it actually started, so that the time spent waiting for a free worker is
+        neither counted towards the hedging delay nor recorded as latency.
+
+        :param func:
+        """
+        self.func = func
+        self.started = threading.Event()
+        self.start_time: Optional[float] = None
+        self.latency: Optional[float] = None
+
+    def __call__(self) -> T:
+        self.start_time = time.perf_counter()
+        self.started.set()
+        try:
+            return self.func()
+        finally:
+            self.latency = time.perf_counter() - self.start_time
+
+
+class HedgingPolicy:
+
+    def __init__(self,
+                 percentile: float = 95.0,
+                 initial_delay: float = 0.1,
+                 min_delay: float = 0.005,
+                 max_delay: float = 2.0,
+                 budget: float = 0.05,
+                 window: int = 1000,
+                 min_samples: int = 20,
+                 max_workers: int = 16) -> None:
+        """
+        Fires a duplicate of an idempotent request if no reply has arrived within a delay equal to the given
+        percentile of the recently observed latencies. The first successful reply wins.
+
+        :param percentile: of the recent latencies to wait for before hedging
+        :param initial_delay: the delay in seconds used until min_samples latencies have been observed
+        :param min_delay: lower bound of the delay in seconds
+        :param max_delay: upper bound of the delay in seconds
+        :param budget: the maximum fraction of requests that can be hedged
+        :param window: the number of recent latencies the delay is based on
+        :param min_samples:
+        :param max_workers: the maximum number of requests (primaries and hedges) in flight
+        """
+        if not 0 <= budget <= 1:
+            raise ValueError(f'budget should be between 0 and 1, got {budget}')
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.min_samples = min_samples
+        self.stats = HedgingStats()
+
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hedging')
+
+    @property
+    def delay(self) -> float:
+        with self._lock:
+            latencies = list(self._latencies)
+
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+
+        return min(max(percentile(latencies, self.percentile), self.min_delay), self.max_delay)
+
+    def _record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self.stats.hedges + 1 > self.budget * self.stats.requests:
+                return False
+
+            self.stats.hedges += 1
+            return True
+
+    def call(self, func: Callable[[], T]) -> T:
+        """
+        :param func: performs the idempotent request
+        :return: the first successful reply. If both the primary and the hedge fail, the last error is raised.
+        """
+        with self._lock:
+            self.stats.requests += 1
+
+        primary_attempt = _Attempt(func)
+        primary = self._executor.submit(primary_attempt)
+        primary_attempt.started.wait()
+
+        try:
+            result = primary.result(timeout=self.delay)
+        except TimeoutError:
+            pass
+        else:
+            self._record(primary_attempt.latency)
+            return result
+
+        if not self._acquire_hedge():
+            result = primary.result()
+            self._record(primary_attempt.latency)
+            return result
+
+        hedge_attempt = _Attempt(func)
+        hedge = self._executor.submit(hedge_attempt)
+
+        attempts = {primary: primary_attempt, hedge: hedge_attempt}
+        pending = set(attempts)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+
+                if future is hedge:
+                    with self._lock:
+                        self.stats.hedge_wins += 1
+
+                self._record(attempts[future].latency)
+                return future.result()
+
+        raise error
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,193 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Type, TypeVar
+
+from rest_client.typing import JSONType
+
+from geofencing_service_client.models import UASZone, UASZoneFilterReply, Authority, TimePeriod
+
+T = TypeVar('T')
+
+
+class _InterningAuthority(Authority):
+
+    _intern_table: 'InternTable'
+
+    @classmethod
+    def from_json(cls, object_dict: JSONType):
+        # the shared authorities are plain ones, this class only routes their decoding through the table
+        return cls._intern_table.intern_model(Authority, object_dict)
+
+
+class _InterningTimePeriod(TimePeriod):
+
+    _intern_table: 'InternTable'
+
+    @classmethod
+    def from_json(cls, object_dict: JSONType):
+        return cls._intern_table.intern_model(TimePeriod, object_dict)
+
+
+class InterningUASZone(UASZone):
+    """
+    A UASZone decoded through the InternTable its class is bound to (see InternTable.uas_zone_class). It compares
+    equal to the UASZone decoded from the same JSON.
+    """
+
+    _intern_table: 'InternTable'
+
+    _authority_class = _InterningAuthority
+    _time_period_class = _InterningTimePeriod
+
+    @classmethod
+    def from_json(cls, object_dict: JSONType):
+        uas_zone = super().from_json(object_dict)
+
+        intern_table = cls._intern_table
+        uas_zone.country = intern_table.intern_string(uas_zone.country)
+        uas_zone.restriction_conditions = intern_table.intern_list(uas_zone.restriction_conditions)
+        uas_zone.other_reason_info = intern_table.intern_string(uas_zone.other_reason_info)
+        uas_zone.message = intern_table.intern_string(uas_zone.message)
+
+        return uas_zone
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, UASZone):
+            return NotImplemented
+
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+
+class InterningUASZoneFilterReply(UASZoneFilterReply):
+
+    _uas_zone_class = InterningUASZone
+
+
+class InternTable:
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """
+        A thread safe and bounded LRU table of decoded values, so that identical authorities, applicabilities,
+        strings and lists are decoded once and shared between the UASZones of one or more replies. The shared values
+        should be treated as read only since changing one of them changes it for every UASZone holding it.
+
+        :param max_entries: the least recently used values are evicted beyond this number
+        """
+        if max_entries < 1:
+            raise ValueError(f'max_entries should be at least 1, got {max_entries}')
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: Dict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # the model classes bound to this table, to be plugged in wherever the UASZones are decoded through the
+        # class hooks of the models, i.e. as response_class
+        self.uas_zone_class: Type[InterningUASZone] = _bind(
+            InterningUASZone,
+            _intern_table=self,
+            _authority_class=_bind(_InterningAuthority, _intern_table=self),
+            _time_period_class=_bind(_InterningTimePeriod, _intern_table=self)
+        )
+        self.uas_zone_filter_reply_class: Type[InterningUASZoneFilterReply] = _bind(
+            InterningUASZoneFilterReply,
+            _uas_zone_class=self.uas_zone_class
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _intern(self, key: Hashable, create: Callable[[], T]) -> T:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = create()
+
+        with self._lock:
+            # another thread might have interned an equal value meanwhile
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            self.misses += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def intern_string(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+
+        return self._intern((str, value), lambda: value)
+
+    def intern_list(self, value: Optional[List[Any]]) -> Optional[List[Any]]:
+        if value is None:
+            return None
+
+        try:
+            key = (list, tuple(value))
+            hash(key)
+        except TypeError:
+            return value
+
+        return self._intern(key, lambda: value)
+
+    def intern_model(self, model_class: Type[T], object_dict: Optional[JSONType]) -> Optional[T]:
+        """
+        Returns the model decoded from object_dict, or an identical one decoded before
+
+        :param model_class: i.e. Authority or TimePeriod
+        :param object_dict:
+        """
+        if object_dict is None:
+            return None
+
+        # the repr of the JSON is cheaper than a canonical dump; equal objects whose keys come in a different order
+        # are merely not shared
+        key = (model_class, repr(object_dict))
+
+        return self._intern(key, lambda: model_class.from_json(object_dict))
+
+
+def _bind(model_class: Type[T], **class_attributes) -> Type[T]:
+    return type(model_class.__name__, (model_class,), class_attributes)
@@ -0,0 +1,193 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Any
+
+from rest_client.typing import JSONType
+
+from geofencing_service_client.models import UASZone, UASZonesFilter, UASZonesUpdateMessage, UASZonesUpdateEvent
+
+MessageCallback = Callable[[JSONType], None]
+
+
+class BrokerTransport(ABC):
+    """
+    Delivers the messages published on a publication location, i.e. an AMQP queue, to a callback
+    """
+
+    @abstractmethod
+    def subscribe(self, publication_location: str, callback: MessageCallback) -> None:
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, publication_location: str) -> None:
+        pass
+
+
+class InMemoryBroker(BrokerTransport):
+    """
+    An in-process BrokerTransport where messages are published explicitly and delivered synchronously, i.e. in tests
+    """
+
+    def __init__(self) -> None:
+        self._callbacks = defaultdict(list)
+
+    def subscribe(self, publication_location: str, callback: MessageCallback) -> None:
+        self._callbacks[publication_location].append(callback)
+
+    def unsubscribe(self, publication_location: str) -> None:
+        self._callbacks.pop(publication_location, None)
+
+    def publish(self, publication_location: str, message: JSONType) -> None:
+        for callback in list(self._callbacks[publication_location]):
+            callback(message)
+
+
+class ZoneMirror:
+
+    def __init__(self,
+                 client: Any,
+                 uas_zones_filter: UASZonesFilter,
+                 transport: BrokerTransport,
+                 on_update: Optional[Callable[[UASZonesUpdateMessage], None]] = None) -> None:
+        """
+        Keeps an in-memory set of the UASZones satisfying a filter up to date. It retrieves them once and applies
+        the create/delete updates of a subscription with the same filter afterwards.
+
+        :param client: a GeofencingServiceClient
+        :param uas_zones_filter:
+        :param transport: consumes the publication location of the subscription
+        :param on_update: called after an update has been applied
+        """
+        self.client = client
+        self.uas_zones_filter = uas_zones_filter
+        self.transport = transport
+        self.on_update = on_update
+
+        self.subscription_id: Optional[str] = None
+        self.publication_location: Optional[str] = None
+
+        self._uas_zones: Dict[str, UASZone] = {}
+        # reentrant so that on_update can read the mirror
+        self._lock = threading.RLock()
+        # updates received before the initial UASZones are loaded are applied afterwards
+        self._pending_messages: Optional[List[UASZonesUpdateMessage]] = None
+
+    @property
+    def started(self) -> bool:
+        return self.subscription_id is not None
+
+    def start(self) -> None:
+        """
+        Subscribes before retrieving the initial UASZones so that no update is missed in between
+        """
+        if self.started:
+            return
+
+        with self._lock:
+            self._pending_messages = []
+
+        subscription_reply = self.client.post_subscription(self.uas_zones_filter)
+        self.subscription_id = subscription_reply.subscription_id
+        self.publication_location = subscription_reply.publication_location
+
+        self.transport.subscribe(self.publication_location, self._on_message)
+
+        try:
+            filter_reply = self.client.filter_uas_zones(self.uas_zones_filter)
+        except Exception:
+            self.stop()
+            raise
+
+        with self._lock:
+            self._uas_zones = {uas_zone.identifier: uas_zone for uas_zone in filter_reply.uas_zone_list}
+
+            pending_messages, self._pending_messages = self._pending_messages, None
+            for message in pending_messages:
+                self._apply(message)
+
+    def stop(self) -> None:
+        """
+        Stops consuming updates and deletes the subscription
+        """
+        if not self.started:
+            return
+
+        self.transport.unsubscribe(self.publication_location)
+        self.client.delete_subscription_by_id(self.subscription_id)
+
+        self.subscription_id = None
+        self.publication_location = None
+
+    def __enter__(self) -> 'ZoneMirror':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def uas_zones(self) -> List[UASZone]:
+        with self._lock:
+            return list(self._uas_zones.values())
+
+    def get(self, identifier: str) -> Optional[UASZone]:
+        with self._lock:
+            return self._uas_zones.get(identifier)
+
+    def __len__(self) -> int:
+        return len(self._uas_zones)
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._uas_zones
+
+    def _on_message(self, message: JSONType) -> None:
+        update_message = UASZonesUpdateMessage.from_json(message)
+
+        with self._lock:
+            if self._pending_messages is not None:
+                self._pending_messages.append(update_message)
+                return
+
+            self._apply(update_message)
+
+    def _apply(self, message: UASZonesUpdateMessage) -> None:
+        if message.event == UASZonesUpdateEvent.CREATE:
+            self._uas_zones[message.uas_zone.identifier] = message.uas_zone
+        else:
+            self._uas_zones.pop(message.uas_zone.identifier, None)
+
+        if self.on_update is not None:
+            self.on_update(message)
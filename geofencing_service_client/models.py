@@ -28,14 +28,16 @@ http://opensource.org/licenses/BSD-3-Clause
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
 import enum
-from datetime import datetime
-from typing import List, Union, Dict, Optional, Any
+import hashlib
+from datetime import datetime, time
+from typing import List, Union, Dict, Optional, Any, Tuple
 
-import dateutil.parser
 from rest_client import BaseModel
 from rest_client.typing import JSONType
 
-from geofencing_service_client.utils import get_time_from_datetime_iso, make_timezone_aware
+from geofencing_service_client.fingerprints import fingerprint_json
+from geofencing_service_client.utils import enum_coercion, make_timezone_aware, parse_datetime_iso, parse_time_iso, \
+    time_from_datetime
 
 __author__ = "EUROCONTROL (SWIM)"
 
@@ -106,7 +108,80 @@ class CodeAuthorityRole(enum.Enum):
     INFORMATION = "INFORMATION"
 
 
-class Polygon(BaseModel):
+class UASZonesUpdateEvent(enum.Enum):
+    CREATE = "create"
+    DELETE = "delete"
+
+
+_as_code_yes_no_type = enum_coercion(CodeYesNoType)
+_as_code_week_day = enum_coercion(CodeWeekDay)
+_as_code_zone_type = enum_coercion(CodeZoneType)
+_as_code_restriction_type = enum_coercion(CodeRestrictionType)
+_as_code_u_space_class_type = enum_coercion(CodeUSpaceClassType)
+_as_code_zone_reason_type = enum_coercion(CodeZoneReasonType)
+_as_code_vertical_reference_type = enum_coercion(CodeVerticalReferenceType)
+_as_request_status = enum_coercion(RequestStatus)
+_as_code_authority_role = enum_coercion(CodeAuthorityRole)
+_as_uas_zones_update_event = enum_coercion(UASZonesUpdateEvent)
+
+
+def _nested_fingerprint(value: Any) -> str:
+    if value is None:
+        return ''
+
+    if isinstance(value, list):
+        return ','.join(item.fingerprint for item in value)
+
+    return value.fingerprint
+
+
+class _FingerprintedModel(BaseModel):
+    """
+    A model compared and hashed by the fingerprint of its canonical JSON, which is computed once and reset whenever
+    one of its attributes is assigned. The nested models listed in _nested_fields are left out of the cached part and
+    contribute their own fingerprints, so that assigning their attributes is detected as well. In place changes of
+    the lists held by the models are not detected.
+    """
+
+    # (attribute, JSON key) of the nested models, or lists of them, that are fingerprinted on their own
+    _nested_fields: Tuple[Tuple[str, str], ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # the models have no data descriptors besides fingerprint, so the attributes are set in __dict__ directly
+        # which keeps the constructors fast
+        object_dict = self.__dict__
+        if '_fingerprint' in object_dict and not name.startswith('_'):
+            del object_dict['_fingerprint']
+        object_dict[name] = value
+
+    @property
+    def fingerprint(self) -> str:
+        own_fingerprint = self.__dict__.get('_fingerprint')
+        if own_fingerprint is None:
+            own_fingerprint = self.__dict__['_fingerprint'] = self._own_fingerprint()
+
+        if not self._nested_fields:
+            return own_fingerprint
+
+        parts = [own_fingerprint] + [_nested_fingerprint(getattr(self, name)) for name, _ in self._nested_fields]
+
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def _own_fingerprint(self) -> str:
+        own_json = self.to_json()
+        for _, key in self._nested_fields:
+            del own_json[key]
+
+        return fingerprint_json(own_json)
+
+    def __eq__(self, other: Any) -> bool:
+        return other.__class__ == self.__class__ and self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+
+class Polygon(_FingerprintedModel):
 
     def __init__(self, coordinates: List[List[List[float]]]):
         self.type= "Polygon"
@@ -125,7 +200,7 @@ class Polygon(BaseModel):
         }
 
 
-class Circle(BaseModel):
+class Circle(_FingerprintedModel):
 
     def __init__(self, center: List[float], radius: float) -> None:
         self.type= "Circle"
@@ -147,7 +222,12 @@ class Circle(BaseModel):
         }
 
 
-class AirspaceVolume(BaseModel):
+class AirspaceVolume(_FingerprintedModel):
+
+    _nested_fields = (('horizontal_projection', 'horizontalProjection'),)
+
+    _polygon_class = Polygon
+    _circle_class = Circle
 
     def __init__(self,
                  horizontal_projection: Union[Polygon, Circle],
@@ -169,15 +249,15 @@ class AirspaceVolume(BaseModel):
         self.uom_dimensions = uom_dimensions
         self.upper_limit = upper_limit
         self.lower_limit = lower_limit
-        self.upper_vertical_reference = CodeVerticalReferenceType(upper_vertical_reference)
-        self.lower_vertical_reference = CodeVerticalReferenceType(lower_vertical_reference)
+        self.upper_vertical_reference = _as_code_vertical_reference_type(upper_vertical_reference)
+        self.lower_vertical_reference = _as_code_vertical_reference_type(lower_vertical_reference)
 
     @classmethod
     def from_json(cls, object_dict):
         if object_dict['horizontalProjection']['type'] == 'Circle':
-            horizontal_projection = Circle.from_json(object_dict['horizontalProjection'])
+            horizontal_projection = cls._circle_class.from_json(object_dict['horizontalProjection'])
         else:
-            horizontal_projection = Polygon.from_json(object_dict['horizontalProjection'])
+            horizontal_projection = cls._polygon_class.from_json(object_dict['horizontalProjection'])
 
         return cls(
             horizontal_projection=horizontal_projection,
@@ -189,14 +269,9 @@ class AirspaceVolume(BaseModel):
         )
 
     def to_json(self) -> Dict[str, Any]:
-        if self.horizontal_projection.type == 'Circle':
-            horizontal_projection = Circle.to_json(self.horizontal_projection)
-        else:
-            horizontal_projection = Polygon.to_json(self.horizontal_projection)
-
         return {
             "uomDimensions": self.uom_dimensions,
-            "horizontalProjection": horizontal_projection,
+            "horizontalProjection": self.horizontal_projection.to_json(),
             "upperLimit": self.upper_limit,
             "lowerLimit": self.lower_limit,
             "upperVerticalReference": self.upper_vertical_reference.value,
@@ -204,41 +279,44 @@ class AirspaceVolume(BaseModel):
         }
 
 
-class DailyPeriod(BaseModel):
+class DailyPeriod(_FingerprintedModel):
 
-    _default_date = "2000-01-01"
-
-    def __init__(self, day: Union[str, CodeWeekDay], start_time: datetime, end_time: datetime) -> None:
+    def __init__(self,
+                 day: Union[str, CodeWeekDay],
+                 start_time: Union[time, datetime],
+                 end_time: Union[time, datetime]) -> None:
         """
 
         :param day:
-        :param start_time:
-        :param end_time:
+        :param start_time: the time of day, datetimes are accepted for backwards compatibility and only their time
+                           of day is kept
+        :param end_time: same as start_time
         """
-        self.day = day if isinstance(day, CodeWeekDay) else CodeWeekDay(day)
-        self.start_time = start_time
-        self.end_time = end_time
+        self.day = _as_code_week_day(day)
+        self.start_time = time_from_datetime(start_time) if isinstance(start_time, datetime) else start_time
+        self.end_time = time_from_datetime(end_time) if isinstance(end_time, datetime) else end_time
 
     @classmethod
     def from_json(cls, object_dict: JSONType):
-        start_time = f"{cls._default_date}T{object_dict['startTime']}"
-        end_time = f"{cls._default_date}T{object_dict['endTime']}"
-
         return cls(
             day=object_dict['day'],
-            start_time=dateutil.parser.parse(start_time),
-            end_time=dateutil.parser.parse(end_time),
+            start_time=parse_time_iso(object_dict['startTime']),
+            end_time=parse_time_iso(object_dict['endTime']),
         )
 
     def to_json(self) -> JSONType:
         return {
             'day': self.day.value,
-            'startTime': get_time_from_datetime_iso(self.start_time.isoformat()),
-            'endTime': get_time_from_datetime_iso(self.end_time.isoformat())
+            'startTime': self.start_time.isoformat(),
+            'endTime': self.end_time.isoformat()
         }
 
 
-class TimePeriod(BaseModel):
+class TimePeriod(_FingerprintedModel):
+
+    _nested_fields = (('schedule', 'schedule'),)
+
+    _daily_period_class = DailyPeriod
 
     def __init__(self,
                  permanent: Union[str, CodeYesNoType],
@@ -252,7 +330,7 @@ class TimePeriod(BaseModel):
         :param end_date_time:
         :param schedule:
         """
-        self.permanent = CodeYesNoType(permanent)
+        self.permanent = _as_code_yes_no_type(permanent)
         self.start_date_time = start_date_time
         self.end_date_time = end_date_time
         self.schedule = schedule
@@ -261,9 +339,9 @@ class TimePeriod(BaseModel):
     def from_json(cls, object_dict: JSONType):
         return cls(
             permanent=object_dict['permanent'],
-            start_date_time=dateutil.parser.parse(object_dict['startDateTime']),
-            end_date_time=dateutil.parser.parse(object_dict['endDateTime']),
-            schedule=[DailyPeriod.from_json(s) for s in object_dict['schedule']]
+            start_date_time=parse_datetime_iso(object_dict['startDateTime']),
+            end_date_time=parse_datetime_iso(object_dict['endDateTime']),
+            schedule=[cls._daily_period_class.from_json(s) for s in object_dict['schedule']]
         )
 
     def to_json(self) -> JSONType:
@@ -275,7 +353,7 @@ class TimePeriod(BaseModel):
         }
 
 
-class Authority(BaseModel):
+class Authority(_FingerprintedModel):
 
     def __init__(self,
                  name: str,
@@ -299,7 +377,7 @@ class Authority(BaseModel):
         """
         self.name = name
         self.service = service
-        self.purpose = CodeAuthorityRole(purpose)
+        self.purpose = _as_code_authority_role(purpose)
         self.email = email
         self.contact_name = contact_name
         self.site_url = site_url
@@ -332,7 +410,14 @@ class Authority(BaseModel):
         }
 
 
-class UASZone(BaseModel):
+class UASZone(_FingerprintedModel):
+
+    _nested_fields = (('zone_authority', 'zoneAuthority'), ('geometry', 'geometry'), ('applicability', 'applicability'))
+
+    _authority_class = Authority
+    _airspace_volume_class = AirspaceVolume
+    _time_period_class = TimePeriod
+
     def __init__(self,
                  identifier: str,
                  country: str,
@@ -371,18 +456,18 @@ class UASZone(BaseModel):
         """
         self.identifier = identifier
         self.country = country
-        self.type = CodeZoneType(type)
-        self.restriction = CodeRestrictionType(restriction)
+        self.type = _as_code_zone_type(type)
+        self.restriction = _as_code_restriction_type(restriction)
         self.zone_authority = zone_authority
         self.geometry = geometry
         self.name = name
         self.restriction_conditions = restriction_conditions
         self.region = region
-        self.reason = [CodeZoneReasonType(r) for r in reason if r is not None]
+        self.reason = [_as_code_zone_reason_type(r) for r in reason if r is not None]
         self.other_reason_info = other_reason_info
-        self.regulation_exemption = CodeYesNoType(regulation_exemption) if regulation_exemption \
+        self.regulation_exemption = _as_code_yes_no_type(regulation_exemption) if regulation_exemption \
             else None
-        self.u_space_class = CodeUSpaceClassType(u_space_class) if u_space_class else None
+        self.u_space_class = _as_code_u_space_class_type(u_space_class) if u_space_class else None
         self.message = message
         self.applicability = applicability
         self.extended_properties = extended_properties
@@ -392,10 +477,10 @@ class UASZone(BaseModel):
         return cls(
             identifier=object_dict['identifier'],
             country=object_dict['country'],
-            type=CodeZoneType(object_dict['type']),
+            type=object_dict['type'],
             restriction=object_dict['restriction'],
-            zone_authority=Authority.from_json(object_dict['zoneAuthority']),
-            geometry=[AirspaceVolume.from_json(geo) for geo in object_dict['geometry']],
+            zone_authority=cls._authority_class.from_json(object_dict['zoneAuthority']),
+            geometry=[cls._airspace_volume_class.from_json(geo) for geo in object_dict['geometry']],
             name=object_dict['name'],
             restriction_conditions=object_dict['restrictionConditions'],
             region=object_dict['region'],
@@ -404,7 +489,7 @@ class UASZone(BaseModel):
             regulation_exemption=object_dict['regulationExemption'],
             u_space_class=object_dict['uSpaceClass'],
             message=object_dict['message'],
-            applicability=TimePeriod.from_json(object_dict['applicability']),
+            applicability=cls._time_period_class.from_json(object_dict['applicability']),
             extended_properties=object_dict['extendedProperties'],
         )
 
@@ -429,6 +514,95 @@ class UASZone(BaseModel):
         }
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _optional_enum_field(coerce):
+    return (lambda value: coerce(value) if value else None,
+            lambda value: value.value if value is not None else None)
+
+
+class LazyUASZone(UASZone):
+    # attribute name -> (json key, decode, encode)
+    _fields = {
+        'identifier': ('identifier', _identity, _identity),
+        'country': ('country', _identity, _identity),
+        'type': ('type', _as_code_zone_type, lambda value: value.value),
+        'restriction': ('restriction', _as_code_restriction_type, lambda value: value.value),
+        'zone_authority': ('zoneAuthority', Authority.from_json, lambda value: value.to_json()),
+        'geometry': ('geometry',
+                     lambda value: [AirspaceVolume.from_json(geo) for geo in value],
+                     lambda value: [geo.to_json() for geo in value]),
+        'name': ('name', _identity, _identity),
+        'restriction_conditions': ('restrictionConditions', _identity, _identity),
+        'region': ('region', _identity, _identity),
+        'reason': ('reason',
+                   lambda value: [_as_code_zone_reason_type(r) for r in value if r is not None],
+                   lambda value: [r.value for r in value]),
+        'other_reason_info': ('otherReasonInfo', _identity, _identity),
+        'regulation_exemption': ('regulationExemption', *_optional_enum_field(_as_code_yes_no_type)),
+        'u_space_class': ('uSpaceClass', *_optional_enum_field(_as_code_u_space_class_type)),
+        'message': ('message', _identity, _identity),
+        'applicability': ('applicability', TimePeriod.from_json, lambda value: value.to_json()),
+        'extended_properties': ('extendedProperties', _identity, _identity),
+    }
+
+    def __init__(self, object_dict: JSONType) -> None:
+        """
+        A UASZone that keeps the JSON object it was created from and decodes each of its fields the first time it is
+        accessed. It compares equal to the eagerly decoded UASZone and only the fields that have been accessed or
+        assigned are encoded again in to_json.
+
+        :param object_dict:
+        """
+        self._object_dict = object_dict
+
+    @classmethod
+    def from_json(cls, object_dict: JSONType):
+        return cls(object_dict)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the fields that have not been decoded yet
+        try:
+            json_key, decode, _ = self._fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        value = decode(self._object_dict[json_key])
+        self.__dict__[name] = value
+
+        return value
+
+    def decode(self) -> UASZone:
+        """
+        Returns the eagerly decoded UASZone
+        """
+        return UASZone(**{name: getattr(self, name) for name in self._fields})
+
+    def _own_fingerprint(self) -> str:
+        # the raw JSON is not canonical, so the own fields are fingerprinted as the eager UASZone encodes them. The
+        # result is cached by the fingerprint property until one of the fields is assigned
+        return self.decode()._own_fingerprint()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, UASZone):
+            return NotImplemented
+
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def to_json(self) -> JSONType:
+        result = dict(self._object_dict)
+        for name, (json_key, _, encode) in self._fields.items():
+            if name in self.__dict__:
+                result[json_key] = encode(self.__dict__[name])
+
+        return result
+
+
 class UASZonesFilter(BaseModel):
 
     def __init__(self,
@@ -454,8 +628,8 @@ class UASZonesFilter(BaseModel):
         return cls(
             airspace_volume=AirspaceVolume.from_json(object_dict["airspaceVolume"]),
             regions=object_dict['regions'],
-            start_date_time=dateutil.parser.parse(object_dict['startDateTime']),
-            end_date_time=dateutil.parser.parse(object_dict['endDateTime']),
+            start_date_time=parse_datetime_iso(object_dict['startDateTime']),
+            end_date_time=parse_datetime_iso(object_dict['endDateTime']),
         )
 
     def to_json(self) -> Dict[str, Any]:
@@ -481,7 +655,7 @@ class GenericReply(BaseModel):
         :param request_exception_description:
         :param request_processed_timestamp:
         """
-        self.request_status = RequestStatus(request_status)
+        self.request_status = _as_request_status(request_status)
         self.request_exception_description = request_exception_description
         self.request_processed_timestamp = request_processed_timestamp
 
@@ -490,9 +664,18 @@ class GenericReply(BaseModel):
         return cls(
             request_status=object_dict['RequestStatus'],
             request_exception_description=object_dict['RequestExceptionDescription'],
-            request_processed_timestamp=dateutil.parser.parse(object_dict['RequestProcessedTimestamp'])
+            request_processed_timestamp=parse_datetime_iso(object_dict['RequestProcessedTimestamp'])
+            if object_dict.get('RequestProcessedTimestamp') else None
         )
 
+    def to_json(self) -> JSONType:
+        return {
+            'RequestStatus': self.request_status.value,
+            'RequestExceptionDescription': self.request_exception_description,
+            'RequestProcessedTimestamp': self.request_processed_timestamp.isoformat()
+            if self.request_processed_timestamp else None
+        }
+
 
 class Reply(BaseModel):
 
@@ -512,6 +695,8 @@ class Reply(BaseModel):
 
 class UASZoneFilterReply(Reply):
 
+    _uas_zone_class = UASZone
+
     def __init__(self, uas_zone_list: List[UASZone], generic_reply: GenericReply):
         super().__init__(generic_reply)
         self.uas_zone_list = uas_zone_list
@@ -519,10 +704,22 @@ class UASZoneFilterReply(Reply):
     @classmethod
     def from_json(cls, object_dict: JSONType):
         return cls(
-            uas_zone_list=[UASZone.from_json(uas_zone_object) for uas_zone_object in object_dict['UASZoneList']],
+            uas_zone_list=[cls._uas_zone_class.from_json(uas_zone_object)
+                          for uas_zone_object in object_dict['UASZoneList']],
             generic_reply=GenericReply.from_json(object_dict['genericReply'])
         )
 
+    def to_json(self) -> JSONType:
+        return {
+            'UASZoneList': [uas_zone.to_json() for uas_zone in self.uas_zone_list],
+            'genericReply': self.generic_reply.to_json()
+        }
+
+
+class LazyUASZoneFilterReply(UASZoneFilterReply):
+
+    _uas_zone_class = LazyUASZone
+
 
 class UASZoneCreateReply(Reply):
 
@@ -609,3 +806,30 @@ class UASZoneSubscriptionsReply(Reply):
             ],
             generic_reply=GenericReply.from_json(object_dict['genericReply'])
         )
+
+
+class UASZonesUpdateMessage(BaseModel):
+
+    def __init__(self, event: Union[str, UASZonesUpdateEvent], uas_zone: UASZone) -> None:
+        """
+        A message published on the broker of a subscription whenever a UASZone satisfying its filter is created or
+        deleted
+
+        :param event:
+        :param uas_zone:
+        """
+        self.event = _as_uas_zones_update_event(event)
+        self.uas_zone = uas_zone
+
+    @classmethod
+    def from_json(cls, object_dict: JSONType):
+        return cls(
+            event=object_dict['event'],
+            uas_zone=UASZone.from_json(object_dict['uas_zone'])
+        )
+
+    def to_json(self) -> JSONType:
+        return {
+            'event': self.event.value,
+            'uas_zone': self.uas_zone.to_json()
+        }
@@ -0,0 +1,83 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class PooledRequestHandler(requests.Session):
+
+    def __init__(self,
+                 host: str,
+                 https: bool = True,
+                 timeout: int = 30,
+                 verify: Union[bool, str] = True,
+                 auth: Optional[Tuple[str, str]] = None,
+                 pool_size: int = 10,
+                 pool_block: bool = True,
+                 max_retries: int = 0) -> None:
+        """
+        A requests session with one keep-alive connection pool per host, sized for the expected concurrency. The
+        relative urls of the clients are resolved against the host.
+
+        :param host: i.e. 'localhost:8080'
+        :param https:
+        :param timeout: the default timeout of the requests in seconds
+        :param verify: whether to verify the TLS certificate of the host or the path of a CA bundle
+        :param auth: (username, password) for basic authentication
+        :param pool_size: the maximum number of connections kept alive per host
+        :param pool_block: if True, requests beyond pool_size wait for a free connection instead of opening
+                           short-lived extra ones, which would be discarded right after and cause connection churn
+        :param max_retries: how many times failed connections are retried
+        """
+        super().__init__()
+
+        if pool_size < 1:
+            raise ValueError(f'pool_size should be at least 1, got {pool_size}')
+
+        self.base_url = f"{'https' if https else 'http'}://{host.rstrip('/')}/"
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.verify = verify
+        self.auth = auth
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=pool_block,
+                              max_retries=max_retries)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+
+        return super().request(method, self.base_url + url.lstrip('/'), *args, **kwargs)
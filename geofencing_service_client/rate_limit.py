@@ -0,0 +1,134 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import asyncio
+import enum
+import threading
+import time
+from typing import Optional, Callable, Dict
+
+
+class TokenBucket:
+
+    def __init__(self,
+                 rate: float,
+                 capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        A thread safe token bucket. Callers are not rejected when the bucket is empty: each one reserves its tokens
+        upfront and waits until they are refilled, so that concurrent callers are smoothed out to the rate in
+        arrival order.
+
+        :param rate: tokens refilled per second
+        :param capacity: the maximum number of tokens, i.e. the allowed burst. Defaults to the rate (one second worth
+                         of tokens)
+        :param clock:
+        """
+        if rate <= 0:
+            raise ValueError(f'rate should be positive, got {rate}')
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes the tokens, possibly in advance
+
+        :param tokens:
+        :return: the seconds to wait before the tokens are actually available
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            self._tokens -= tokens
+
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> None:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class EndpointGroup(enum.Enum):
+    READS = "reads"
+    WRITES = "writes"
+    SUBSCRIPTIONS = "subscriptions"
+
+
+class RateLimiter:
+
+    def __init__(self,
+                 reads: Optional[float] = None,
+                 writes: Optional[float] = None,
+                 subscriptions: Optional[float] = None,
+                 burst: Optional[float] = None) -> None:
+        """
+        Limits the requests of a client with a separate token bucket per endpoint group. It can be shared between
+        clients, threads and event loops.
+
+        :param reads: requests per second of filter_uas_zones and the other read calls, unlimited if None
+        :param writes: requests per second of post_uas_zone and delete_uas_zone_by_identifier, unlimited if None
+        :param subscriptions: requests per second of the subscription calls, unlimited if None
+        :param burst: the capacity of each bucket, defaults to one second worth of requests
+        """
+        rates = {
+            EndpointGroup.READS: reads,
+            EndpointGroup.WRITES: writes,
+            EndpointGroup.SUBSCRIPTIONS: subscriptions
+        }
+
+        self.buckets: Dict[EndpointGroup, TokenBucket] = {
+            group: TokenBucket(rate=rate, capacity=burst) for group, rate in rates.items() if rate is not None
+        }
+
+    def acquire(self, group: EndpointGroup) -> None:
+        bucket = self.buckets.get(group)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, group: EndpointGroup) -> None:
+        bucket = self.buckets.get(group)
+        if bucket is not None:
+            await bucket.acquire_async()
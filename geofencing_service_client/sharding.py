@@ -0,0 +1,147 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import timedelta
+from typing import List
+
+from geofencing_service_client.geometry import ring_bounding_box, split_bounding_box, clip_ring_to_bounding_box, \
+    ring_is_convex, bounding_box_ring
+from geofencing_service_client.models import UASZonesFilter, AirspaceVolume, Polygon
+
+
+def _copy_uas_zones_filter(uas_zones_filter: UASZonesFilter, **overrides) -> UASZonesFilter:
+    kwargs = {
+        'airspace_volume': uas_zones_filter.airspace_volume,
+        'regions': uas_zones_filter.regions,
+        'start_date_time': uas_zones_filter.start_date_time,
+        'end_date_time': uas_zones_filter.end_date_time
+    }
+    kwargs.update(overrides)
+
+    return UASZonesFilter(**kwargs)
+
+
+def _copy_airspace_volume(airspace_volume: AirspaceVolume, **overrides) -> AirspaceVolume:
+    kwargs = {
+        'horizontal_projection': airspace_volume.horizontal_projection,
+        'uom_dimensions': airspace_volume.uom_dimensions,
+        'upper_limit': airspace_volume.upper_limit,
+        'lower_limit': airspace_volume.lower_limit,
+        'upper_vertical_reference': airspace_volume.upper_vertical_reference,
+        'lower_vertical_reference': airspace_volume.lower_vertical_reference
+    }
+    kwargs.update(overrides)
+
+    return AirspaceVolume(**kwargs)
+
+
+def split_uas_zones_filter_by_area(uas_zones_filter: UASZonesFilter, rows: int, columns: int) -> List[UASZonesFilter]:
+    """
+    Splits the horizontal projection of the filter in a grid of rows x columns tiles over its bounding box. Cells that
+    do not overlap with the polygon by a positive area are left out. For a convex polygon each tile is the part of the
+    polygon that lies within its cell. For a concave one, whose part within a cell may be disjoint, each tile is the
+    whole cell, so the UASZones of the tiles should be narrowed down with uas_zone_intersects_area (see
+    tiles_are_exact). Interior rings are left out of the tiles, which therefore also cover the holes and need the same
+    narrowing down. Circles are not split and the filter is returned as is.
+
+    :param uas_zones_filter:
+    :param rows:
+    :param columns:
+    :return:
+    """
+    horizontal_projection = uas_zones_filter.airspace_volume.horizontal_projection
+
+    if horizontal_projection.type != 'Polygon':
+        return [uas_zones_filter]
+
+    exterior_ring = horizontal_projection.coordinates[0]
+    convex = ring_is_convex(exterior_ring)
+    cells = split_bounding_box(ring_bounding_box(exterior_ring), rows=rows, columns=columns)
+
+    result = []
+    for cell in cells:
+        tile = clip_ring_to_bounding_box(exterior_ring, cell)
+        if not tile:
+            continue
+
+        if not convex:
+            # the clipped ring would join the disjoint parts of the polygon with bridges running outside of it
+            tile = bounding_box_ring(cell)
+
+        airspace_volume = _copy_airspace_volume(uas_zones_filter.airspace_volume,
+                                                horizontal_projection=Polygon(coordinates=[tile]))
+        result.append(_copy_uas_zones_filter(uas_zones_filter, airspace_volume=airspace_volume))
+
+    return result
+
+
+def tiles_are_exact(uas_zones_filter: UASZonesFilter) -> bool:
+    """
+    Whether the tiles of split_uas_zones_filter_by_area cover exactly the area of the filter, i.e. it is a circle or a
+    convex polygon without holes, so that their UASZones need no narrowing down
+
+    :param uas_zones_filter:
+    :return:
+    """
+    horizontal_projection = uas_zones_filter.airspace_volume.horizontal_projection
+
+    if horizontal_projection.type != 'Polygon':
+        return True
+
+    return len(horizontal_projection.coordinates) == 1 and ring_is_convex(horizontal_projection.coordinates[0])
+
+
+def split_uas_zones_filter_by_time(uas_zones_filter: UASZonesFilter, window: timedelta) -> List[UASZonesFilter]:
+    """
+    Splits the time range of the filter in consecutive sub windows of the given duration. The last one is cut short
+    at the end of the range. An empty range, i.e. an instant, yields the filter itself.
+
+    :param uas_zones_filter:
+    :param window: i.e. timedelta(days=1) or timedelta(weeks=1)
+    :return: the filters in chronological order, at least one
+    """
+    if window <= timedelta(0):
+        raise ValueError(f'window should be positive, got {window}')
+
+    if uas_zones_filter.start_date_time >= uas_zones_filter.end_date_time:
+        return [uas_zones_filter]
+
+    result = []
+    start_date_time = uas_zones_filter.start_date_time
+    while start_date_time < uas_zones_filter.end_date_time:
+        end_date_time = min(start_date_time + window, uas_zones_filter.end_date_time)
+        result.append(_copy_uas_zones_filter(uas_zones_filter,
+                                             start_date_time=start_date_time,
+                                             end_date_time=end_date_time))
+        start_date_time = end_date_time
+
+    return result
@@ -0,0 +1,257 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from geofencing_service_client.arrays import ArrayUASZone, ArrayUASZoneFilterReply
+from geofencing_service_client.models import UASZone, UASZoneFilterReply
+
+# A compact binary format for handing UASZones over to other processes. The JSON of the models is encoded as a tree
+# of tagged values where every string (keys, enum values, date times) is stored once in a table and referenced by
+# index, while the points of the rings are stored as one raw little-endian float64 buffer at the end:
+#
+#   header | string table | tree | padding to 8 bytes | coordinates
+
+_MAGIC = b'GFZS'
+_VERSION = 1
+
+# magic, version, kind, string count, tree length, coordinates length in floats
+_HEADER = struct.Struct('<4sHBxIIQ')
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+# the number of points and their offset in floats in the coordinates
+_POINTS = struct.Struct('<IQ')
+
+_KIND_UAS_ZONES = 0
+_KIND_UAS_ZONE_FILTER_REPLY = 1
+
+_TAG_NONE, _TAG_FALSE, _TAG_TRUE, _TAG_INT, _TAG_FLOAT, _TAG_STR, _TAG_LIST, _TAG_DICT, _TAG_POINTS = range(9)
+
+
+def _is_points(value: List[Any]) -> bool:
+    # only floats are packed so that integer coordinates are not turned into floats
+    return len(value) > 0 and all(isinstance(point, list) and len(point) == 2 and
+                                  type(point[0]) is float and type(point[1]) is float for point in value)
+
+
+class _Encoder:
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.tree = bytearray()
+        self.coordinates = array('d')
+
+    def _string(self, value: str) -> bytes:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+
+        return _U32.pack(index)
+
+    def encode(self, value: Any) -> None:
+        tree = self.tree
+        if value is None:
+            tree.append(_TAG_NONE)
+        elif value is True:
+            tree.append(_TAG_TRUE)
+        elif value is False:
+            tree.append(_TAG_FALSE)
+        elif isinstance(value, int):
+            tree.append(_TAG_INT)
+            tree += _I64.pack(value)
+        elif isinstance(value, float):
+            tree.append(_TAG_FLOAT)
+            tree += _F64.pack(value)
+        elif isinstance(value, str):
+            tree.append(_TAG_STR)
+            tree += self._string(value)
+        elif isinstance(value, dict):
+            tree.append(_TAG_DICT)
+            tree += _U32.pack(len(value))
+            for key, item in value.items():
+                tree += self._string(key)
+                self.encode(item)
+        elif isinstance(value, list):
+            if _is_points(value):
+                tree.append(_TAG_POINTS)
+                tree += _POINTS.pack(len(value), len(self.coordinates))
+                for point in value:
+                    self.coordinates.extend(point)
+            else:
+                tree.append(_TAG_LIST)
+                tree += _U32.pack(len(value))
+                for item in value:
+                    self.encode(item)
+        else:
+            raise TypeError(f'Cannot encode {type(value).__name__} in a snapshot')
+
+    def dumps(self, kind: int) -> bytes:
+        strings = bytearray()
+        for string in self.strings:
+            encoded = string.encode('utf-8')
+            strings += _U32.pack(len(encoded))
+            strings += encoded
+
+        coordinates = self.coordinates
+        if sys.byteorder == 'big':
+            coordinates = array('d', coordinates)
+            coordinates.byteswap()
+
+        header = _HEADER.pack(_MAGIC, _VERSION, kind, len(self.strings), len(self.tree), len(coordinates))
+        padding = b'\0' * (-(len(header) + len(strings) + len(self.tree)) % 8)
+
+        return b''.join([header, strings, self.tree, padding, coordinates.tobytes()])
+
+
+class _Decoder:
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview], zero_copy: bool) -> None:
+        self.data = data
+        self.zero_copy = zero_copy
+
+        magic, version, self.kind, string_count, tree_length, coordinates_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Not a UASZones snapshot or unsupported version')
+
+        position = _HEADER.size
+        self.strings: List[str] = []
+        for _ in range(string_count):
+            length, = _U32.unpack_from(data, position)
+            position += _U32.size
+            self.strings.append(bytes(data[position:position + length]).decode('utf-8'))
+            position += length
+
+        self.position = position
+        self.coordinates_offset = position + tree_length + (-position - tree_length) % 8
+
+    def decode(self) -> Any:
+        data = self.data
+        tag = data[self.position]
+        self.position += 1
+
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_INT:
+            value, = _I64.unpack_from(data, self.position)
+            self.position += _I64.size
+            return value
+        if tag == _TAG_FLOAT:
+            value, = _F64.unpack_from(data, self.position)
+            self.position += _F64.size
+            return value
+        if tag == _TAG_STR:
+            return self._string()
+        if tag == _TAG_DICT:
+            size = self._u32()
+            return {self._string(): self.decode() for _ in range(size)}
+        if tag == _TAG_LIST:
+            return [self.decode() for _ in range(self._u32())]
+        if tag == _TAG_POINTS:
+            return self._points()
+
+        raise ValueError(f'Invalid tag {tag} in snapshot')
+
+    def _u32(self) -> int:
+        value, = _U32.unpack_from(self.data, self.position)
+        self.position += _U32.size
+        return value
+
+    def _string(self) -> str:
+        return self.strings[self._u32()]
+
+    def _points(self) -> Any:
+        count, offset = _POINTS.unpack_from(self.data, self.position)
+        self.position += _POINTS.size
+        start = self.coordinates_offset + offset * 8
+
+        if self.zero_copy:
+            return np.frombuffer(self.data, dtype='<f8', count=2 * count, offset=start).reshape(count, 2)
+
+        values = iter(struct.unpack_from(f'<{2 * count}d', self.data, start))
+        return [[x, y] for x, y in zip(values, values)]
+
+
+def dumps(uas_zones: Union[Iterable[UASZone], UASZoneFilterReply]) -> bytes:
+    """
+    Encodes a list of UASZones or a UASZoneFilterReply into a binary snapshot
+
+    :param uas_zones:
+    :return:
+    """
+    encoder = _Encoder()
+
+    if isinstance(uas_zones, UASZoneFilterReply):
+        encoder.encode(uas_zones.to_json())
+        return encoder.dumps(_KIND_UAS_ZONE_FILTER_REPLY)
+
+    encoder.encode([uas_zone.to_json() for uas_zone in uas_zones])
+    return encoder.dumps(_KIND_UAS_ZONES)
+
+
+def loads(data: Union[bytes, bytearray, memoryview],
+          zero_copy: bool = False) -> Union[List[UASZone], UASZoneFilterReply]:
+    """
+    Decodes a binary snapshot back into the list of UASZones or the UASZoneFilterReply it was created from
+
+    :param data:
+    :param zero_copy: if True, the zones are decoded into ArrayUASZone whose polygon rings are numpy arrays
+                      referencing data without copying it, which requires numpy
+    :return:
+    """
+    if zero_copy and np is None:
+        raise ImportError('numpy is required for zero copy snapshots: pip install numpy')
+
+    decoder = _Decoder(data, zero_copy=zero_copy)
+    object_json = decoder.decode()
+
+    if zero_copy:
+        uas_zone_class, uas_zone_filter_reply_class = ArrayUASZone, ArrayUASZoneFilterReply
+    else:
+        uas_zone_class, uas_zone_filter_reply_class = UASZone, UASZoneFilterReply
+
+    if decoder.kind == _KIND_UAS_ZONE_FILTER_REPLY:
+        return uas_zone_filter_reply_class.from_json(object_json)
+
+    return [uas_zone_class.from_json(uas_zone_object) for uas_zone_object in object_json]
@@ -0,0 +1,223 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple, Any
+
+from geofencing_service_client.filtering import uas_zone_matches_filter
+from geofencing_service_client.geometry import horizontal_projection_bounding_box, merge_bounding_boxes
+from geofencing_service_client.models import UASZone, UASZonesFilter
+from geofencing_service_client.utils import make_timezone_aware
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uas_zones (
+    identifier TEXT PRIMARY KEY,
+    region INTEGER,
+    min_x REAL NOT NULL,
+    min_y REAL NOT NULL,
+    max_x REAL NOT NULL,
+    max_y REAL NOT NULL,
+    start_timestamp REAL,
+    end_timestamp REAL,
+    uas_zone TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS uas_zones_applicability ON uas_zones (start_timestamp, end_timestamp);
+CREATE VIRTUAL TABLE IF NOT EXISTS uas_zones_rtree USING rtree (id, min_x, max_x, min_y, max_y);
+CREATE TRIGGER IF NOT EXISTS uas_zones_rtree_insert AFTER INSERT ON uas_zones BEGIN
+    INSERT INTO uas_zones_rtree VALUES (new.rowid, new.min_x, new.max_x, new.min_y, new.max_y);
+END;
+CREATE TRIGGER IF NOT EXISTS uas_zones_rtree_delete AFTER DELETE ON uas_zones BEGIN
+    DELETE FROM uas_zones_rtree WHERE id = old.rowid;
+END;
+"""
+
+
+def _timestamp(dt: Optional[datetime]) -> Optional[float]:
+    if dt is None:
+        return None
+
+    # naive date times of the UASZones are considered UTC
+    return (dt if dt.tzinfo is not None else make_timezone_aware(dt)).timestamp()
+
+
+def _uas_zone_row(uas_zone: UASZone) -> Tuple[Any, ...]:
+    min_x, min_y, max_x, max_y = merge_bounding_boxes([
+        horizontal_projection_bounding_box(airspace_volume.horizontal_projection)
+        for airspace_volume in uas_zone.geometry
+    ])
+    applicability = uas_zone.applicability
+
+    return (
+        uas_zone.identifier,
+        uas_zone.region,
+        min_x, min_y, max_x, max_y,
+        _timestamp(applicability.start_date_time) if applicability else None,
+        _timestamp(applicability.end_date_time) if applicability else None,
+        json.dumps(uas_zone.to_json())
+    )
+
+
+class SQLiteZoneStore:
+
+    def __init__(self, path: str) -> None:
+        """
+        A persistent store of UASZones keyed by identifier and indexed by bounding box (R*Tree) and applicability
+        window, so that a worker can start from a local snapshot and reconcile it with the Geofencing Service
+        afterwards.
+        It can be shared between threads.
+
+        :param path: the SQLite database file, or ':memory:'
+        """
+        self.path = path
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'SQLiteZoneStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM uas_zones").fetchone()[0]
+
+    def put(self, uas_zone: UASZone) -> None:
+        self.put_many([uas_zone])
+
+    def put_many(self, uas_zones: Iterable[UASZone]) -> None:
+        """
+        Inserts the UASZones or replaces the stored ones with the same identifier
+        """
+        # the last UASZone wins among the ones with the same identifier, as with INSERT OR REPLACE
+        rows = list({row[0]: row for row in map(_uas_zone_row, uas_zones)}.values())
+
+        with self._lock, self._connection:
+            # the rows are replaced by an explicit delete because REPLACE does not fire the trigger keeping the R*Tree
+            # in sync
+            self._connection.executemany("DELETE FROM uas_zones WHERE identifier = ?", [(row[0],) for row in rows])
+            self._connection.executemany("INSERT INTO uas_zones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def delete(self, identifier: str) -> None:
+        self.delete_many([identifier])
+
+    def delete_many(self, identifiers: Iterable[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM uas_zones WHERE identifier = ?",
+                                         [(identifier,) for identifier in identifiers])
+
+    def get(self, identifier: str) -> Optional[UASZone]:
+        with self._lock:
+            row = self._connection.execute("SELECT uas_zone FROM uas_zones WHERE identifier = ?",
+                                           (identifier,)).fetchone()
+
+        return UASZone.from_json(json.loads(row[0])) if row else None
+
+    def all(self) -> List[UASZone]:
+        with self._lock:
+            rows = self._connection.execute("SELECT uas_zone FROM uas_zones").fetchall()
+
+        return [UASZone.from_json(json.loads(row[0])) for row in rows]
+
+    def query(self, uas_zones_filter: UASZonesFilter) -> List[UASZone]:
+        """
+        Retrieves the stored UASZones that satisfy the filter. The candidates are selected by bounding box through the
+        R*Tree, by applicability window and by region in SQL and then checked with filtering.uas_zone_matches_filter.
+
+        :param uas_zones_filter:
+        :return:
+        """
+        min_x, min_y, max_x, max_y = horizontal_projection_bounding_box(
+            uas_zones_filter.airspace_volume.horizontal_projection)
+
+        sql = "SELECT uas_zone FROM uas_zones_rtree JOIN uas_zones ON uas_zones.rowid = uas_zones_rtree.id " \
+              "WHERE uas_zones_rtree.min_x <= ? AND uas_zones_rtree.max_x >= ? " \
+              "AND uas_zones_rtree.min_y <= ? AND uas_zones_rtree.max_y >= ? " \
+              "AND (start_timestamp IS NULL OR start_timestamp <= ?) " \
+              "AND (end_timestamp IS NULL OR end_timestamp >= ?)"
+        params = [max_x, min_x, max_y, min_y,
+                  # as sent by UASZonesFilter.to_json, which replaces the timezone with UTC
+                  make_timezone_aware(uas_zones_filter.end_date_time).timestamp(),
+                  make_timezone_aware(uas_zones_filter.start_date_time).timestamp()]
+
+        if uas_zones_filter.regions:
+            sql += f" AND region IN ({', '.join('?' * len(uas_zones_filter.regions))})"
+            params += uas_zones_filter.regions
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        uas_zones = (UASZone.from_json(json.loads(row[0])) for row in rows)
+
+        return [uas_zone for uas_zone in uas_zones if uas_zone_matches_filter(uas_zone, uas_zones_filter)]
+
+    def reconcile(self, client: Any, uas_zones_filter: UASZonesFilter) -> None:
+        """
+        Brings the stored UASZones that satisfy the filter up to date with the Geofencing Service: the retrieved ones
+        are stored and the ones that are not retrieved any more are deleted. The filter should have the vertical range
+        the store was populated with.
+
+        :param client: a GeofencingServiceClient
+        :param uas_zones_filter:
+        """
+        reply = client.filter_uas_zones(uas_zones_filter)
+
+        retrieved_identifiers = {uas_zone.identifier for uas_zone in reply.uas_zone_list}
+        stale_identifiers = [uas_zone.identifier for uas_zone in self.query(uas_zones_filter)
+                             if uas_zone.identifier not in retrieved_identifiers]
+
+        self.put_many(reply.uas_zone_list)
+        self.delete_many(stale_identifiers)
+
+    def reconcile_in_background(self, client: Any, uas_zones_filter: UASZonesFilter) -> threading.Thread:
+        """
+        Runs reconcile in a daemon thread, so that the worker can use the local snapshot in the meantime
+
+        :param client: a GeofencingServiceClient
+        :param uas_zones_filter:
+        :return: the started thread
+        """
+        thread = threading.Thread(target=self.reconcile, args=(client, uas_zones_filter), daemon=True)
+        thread.start()
+
+        return thread
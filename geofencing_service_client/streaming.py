@@ -0,0 +1,283 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from geofencing_service_client.models import UASZone, GenericReply
+
+_WHITESPACE = ' \t\n\r'
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r'[\s,:\]}]')
+
+
+class _ValueScanner:
+
+    def __init__(self, first_char: str) -> None:
+        """
+        Finds where a JSON value ends by tracking the nesting depth of its containers and the escapes of its strings
+        across chunks, so that the value is decoded in one go once it has been read completely.
+
+        :param first_char: the first character of the value
+        """
+        self._scalar = first_char not in '{["'
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def scan(self, text: str, pos: int) -> Optional[int]:
+        """
+        :param text: the next piece of the value
+        :param pos: where to resume scanning in text
+        :return: the end of the value in text or None if it continues after it
+        """
+        if self._scalar:
+            match = _SCALAR_END.search(text, pos)
+            return match.start() if match else None
+
+        while True:
+            if self._in_string:
+                if self._escaped:
+                    if pos >= len(text):
+                        return None
+                    pos += 1
+                    self._escaped = False
+
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+
+                if match.group() == '\\':
+                    self._escaped = True
+                    continue
+
+                self._in_string = False
+                if self._depth == 0:
+                    return pos
+            else:
+                match = _STRUCTURAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in '[{':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return pos
+
+
+class _JSONStreamReader:
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._exhausted = False
+
+    def _read_chunk(self) -> bool:
+        # the buffer is only replaced once it has been consumed, or saved by value, so it never grows over one chunk
+        if not self._exhausted:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._exhausted = True
+                self._utf8_decoder.decode(b'', final=True)
+            else:
+                self._buffer = self._utf8_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+                self._pos = 0
+                return True
+
+        self._buffer = ''
+        self._pos = 0
+        return False
+
+    def peek(self) -> str:
+        """
+        Returns the next non whitespace character without consuming it
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._read_chunk():
+                raise ValueError('Unexpected end of JSON stream')
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f'Expected {char!r} at position {self._pos} of JSON stream')
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decodes the next complete JSON value reading as many chunks as it needs
+        """
+        scanner = _ValueScanner(self.peek())
+        start = self._pos
+        parts: List[str] = []
+
+        end = scanner.scan(self._buffer, start)
+        while end is None:
+            parts.append(self._buffer[start:])
+            start = 0
+            if not self._read_chunk():
+                # a scalar ends with the document, anything else is left to raw_decode to report as truncated
+                end = 0
+                break
+            end = scanner.scan(self._buffer, 0)
+
+        parts.append(self._buffer[start:end])
+        text = ''.join(parts) if len(parts) > 1 else parts[0]
+
+        value, value_end = self._decoder.raw_decode(text)
+        if value_end != len(text):
+            raise json.JSONDecodeError('Extra data', text, value_end)
+
+        self._pos = end
+        return value
+
+
+def iter_json_array_member(chunks: Iterable[Union[bytes, str]],
+                           key: str,
+                           members: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Incrementally parses a JSON object from the given chunks yielding the items of its array member under key one at
+    a time. The rest of its members are decoded in full and stored in members as soon as they are read.
+
+    :param chunks: the raw JSON document as an iterable of bytes or str
+    :param key: the key of the array member to stream
+    :param members: where to store the rest of the members of the object
+    """
+    members = {} if members is None else members
+    reader = _JSONStreamReader(chunks)
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+
+    while True:
+        member_key = reader.value()
+        reader.expect(':')
+
+        if member_key == key:
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.peek() == ']':
+                        reader.expect(']')
+                        break
+                    reader.expect(',')
+        else:
+            members[member_key] = reader.value()
+
+        if reader.peek() == '}':
+            return
+        reader.expect(',')
+
+
+class UASZoneFilterReplyStream:
+
+    def __init__(self,
+                 chunks: Iterable[Union[bytes, str]],
+                 on_close=None,
+                 uas_zone_class: Type[UASZone] = UASZone) -> None:
+        """
+        Iterates over the UASZones of a UASZoneFilterReply document while it is being read, so that only one of
+        them is kept in memory at a time.
+
+        :param chunks: the raw JSON document as an iterable of bytes or str
+        :param on_close: called once the document has been read or the stream is closed
+        :param uas_zone_class: the class the UASZones are decoded with, i.e. UASZone or LazyUASZone
+        """
+        self._members: Dict[str, Any] = {}
+        self._items = iter_json_array_member(chunks, 'UASZoneList', self._members)
+        self._on_close = on_close
+        self._uas_zone_class = uas_zone_class
+        self._generic_reply: Optional[GenericReply] = None
+
+    @property
+    def generic_reply(self) -> Optional[GenericReply]:
+        """
+        The genericReply of the document or None if it has not been read yet
+        """
+        if self._generic_reply is None and 'genericReply' in self._members:
+            self._generic_reply = GenericReply.from_json(self._members['genericReply'])
+
+        return self._generic_reply
+
+    def __iter__(self) -> 'UASZoneFilterReplyStream':
+        return self
+
+    def __next__(self) -> UASZone:
+        try:
+            return self._uas_zone_class.from_json(next(self._items))
+        except Exception:
+            # also covers StopIteration once the document has been read
+            self.close()
+            raise
+
+    def read_generic_reply(self) -> GenericReply:
+        """
+        Consumes the rest of the document and returns its genericReply
+        """
+        for _ in self:
+            pass
+
+        return self.generic_reply
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def __enter__(self) -> 'UASZoneFilterReplyStream':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -30,12 +30,130 @@ Details on EUROCONTROL: http://www.eurocontrol.int
 
 __author__ = "EUROCONTROL (SWIM)"
 
-from datetime import datetime, timezone
+import re
+from datetime import datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from enum import Enum
+from typing import Iterable, Iterator, Callable, Hashable, TypeVar, Optional, Type, Any
+
+import dateutil.parser
+
+T = TypeVar('T')
+E = TypeVar('E', bound=Enum)
+
+_ISO_DATETIME_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?'
+)
+_ISO_TIME_PATTERN = re.compile(r'(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?')
 
 
 def get_time_from_datetime_iso(datetime_iso: str) -> str:
     return datetime_iso.split('T')[1]
 
 
+@lru_cache(maxsize=None)
+def _parse_iso_timezone(offset: Optional[str]) -> Optional[tzinfo]:
+    # dateutil decides between tzutc, tzlocal and tzoffset depending on the local timezone, so it is asked once per
+    # offset in order to get exactly the same tzinfo
+    if offset is None:
+        return None
+
+    return dateutil.parser.parse('2000-01-01T00:00:00' + offset).tzinfo
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime_iso(datetime_iso: str) -> datetime:
+    """
+    Parses the strict ISO 8601 date times emitted by the Geofencing Service without going through dateutil, which
+    is only used as a fallback for any other format. The result is the same as of dateutil.parser.parse.
+    """
+    match = _ISO_DATETIME_PATTERN.fullmatch(datetime_iso)
+    if match is None:
+        return dateutil.parser.parse(datetime_iso)
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        int(fraction.ljust(6, '0')) if fraction else 0,
+                        tzinfo=_parse_iso_timezone(offset))
+    except ValueError:
+        return dateutil.parser.parse(datetime_iso)
+
+
+@lru_cache(maxsize=None)
+def _fixed_timezone(offset: Optional[str]) -> Optional[timezone]:
+    if offset is None:
+        return None
+
+    if offset == 'Z':
+        return timezone.utc
+
+    sign = -1 if offset[0] == '-' else 1
+    utcoffset = sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+
+    return timezone.utc if not utcoffset else timezone(utcoffset)
+
+
+@lru_cache(maxsize=4096)
+def parse_time_iso(time_iso: str) -> time:
+    """
+    Parses an ISO 8601 time of day such as 09:00:00+01:00 into a time with a fixed offset timezone, falling back to
+    dateutil for anything other than the strict format emitted by the Geofencing Service.
+    """
+    match = _ISO_TIME_PATTERN.fullmatch(time_iso)
+    if match is None:
+        return time_from_datetime(dateutil.parser.parse(f'2000-01-01T{time_iso}'))
+
+    hour, minute, second, fraction, offset = match.groups()
+    try:
+        return time(int(hour), int(minute), int(second), int(fraction.ljust(6, '0')) if fraction else 0,
+                    tzinfo=_fixed_timezone(offset))
+    except ValueError:
+        return time_from_datetime(dateutil.parser.parse(f'2000-01-01T{time_iso}'))
+
+
+def time_from_datetime(dt: datetime) -> time:
+    """
+    Returns the time of day of dt with its timezone replaced by the fixed offset it has on that day, as timezones
+    like tzlocal cannot compute their offset from a time alone.
+    """
+    if dt.tzinfo is None:
+        return dt.time()
+
+    utcoffset = dt.utcoffset()
+
+    return dt.time().replace(tzinfo=timezone.utc if not utcoffset else timezone(utcoffset))
+
+
+def enum_coercion(enum_class: Type[E]) -> Callable[[Any], E]:
+    """
+    Returns a function equivalent to enum_class(value) which looks the value up in a prebuilt table instead, and
+    returns members as they are. Anything not in the table goes through enum_class(value), which raises the same
+    ValueError for invalid values.
+    """
+    members = {member.value: member for member in enum_class}
+    members.update({member: member for member in enum_class})
+
+    def coerce(value: Any) -> E:
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            return enum_class(value)
+
+    return coerce
+
+
 def make_timezone_aware(dt: datetime):
     return dt.replace(tzinfo=timezone.utc)
+
+
+def unique_by(items: Iterable[T], key: Callable[[T], Hashable]) -> Iterator[T]:
+    """
+    Yields the items lazily skipping the ones whose key has already been seen
+    """
+    seen = set()
+    for item in items:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            yield item
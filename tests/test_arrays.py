@@ -0,0 +1,92 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from geofencing_service_client.arrays import ArrayPolygon, ArrayCircle, ArrayUASZoneFilterReply, ArrayUASZone
+from tests.utils import make_uas_zones_filter_reply
+
+POLYGON_JSON = {
+    "type": "Polygon",
+    "coordinates": [
+        [[2.485866, 49.029301], [2.604141, 49.034704], [2.631263, 48.987301], [2.485866, 49.029301]],
+        [[2.5, 49.0], [2.55, 49.01], [2.52, 48.99], [2.5, 49.0]],
+    ]
+}
+
+
+def test_array_polygon__from_json_to_json():
+    polygon = ArrayPolygon.from_json(POLYGON_JSON)
+
+    assert 2 == len(polygon.coordinates)
+    assert (4, 2) == polygon.exterior.shape
+    assert np.float64 == polygon.exterior.dtype
+    assert polygon.exterior.flags['C_CONTIGUOUS']
+    assert POLYGON_JSON == polygon.to_json()
+
+
+def test_array_polygon__rings_which_are_arrays_are_not_copied():
+    ring = np.array(POLYGON_JSON['coordinates'][0], dtype=np.float32)
+
+    polygon = ArrayPolygon([ring], dtype=np.float32)
+
+    assert polygon.exterior is ring
+    assert [] == polygon.interiors
+
+
+def test_array_polygon__eq():
+    assert ArrayPolygon.from_json(POLYGON_JSON) == ArrayPolygon.from_json(POLYGON_JSON)
+    assert ArrayPolygon.from_json(POLYGON_JSON) != ArrayPolygon(POLYGON_JSON['coordinates'][:1])
+
+
+def test_array_circle__from_json_to_json():
+    circle_json = {"type": "Circle", "center": [2.485866, 49.029301], "radius": 500}
+
+    circle = ArrayCircle.from_json(circle_json)
+
+    assert (2,) == circle.center.shape
+    assert circle == ArrayCircle.from_json(circle_json)
+    assert circle_json == circle.to_json()
+
+
+def test_array_uas_zone_filter_reply__from_json_to_json():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    array_uas_zones_filter_reply = ArrayUASZoneFilterReply.from_json(uas_zones_filter_reply_dict)
+
+    uas_zones = zip(uas_zones_filter_reply.uas_zone_list, array_uas_zones_filter_reply.uas_zone_list)
+    for uas_zone, array_uas_zone in uas_zones:
+        assert isinstance(array_uas_zone, ArrayUASZone)
+        assert isinstance(array_uas_zone.geometry[0].horizontal_projection, (ArrayPolygon, ArrayCircle))
+        assert uas_zone.to_json() == array_uas_zone.to_json()
@@ -0,0 +1,342 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+import asyncio
+from copy import deepcopy
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from rest_client.errors import APIError
+
+from geofencing_service_client.async_geofencing_service import AsyncGeofencingServiceClient
+from geofencing_service_client.rate_limit import EndpointGroup
+from tests.utils import make_uas_zones_filter_reply, make_uas_zones_filter, make_uas_zone, \
+    make_uas_zone_create_reply, make_subscribe_to_uas_zones_updates_reply, make_uas_zone_subscription_reply, \
+    make_uas_zone_subscriptions_reply, make_reply, make_async_request_handler
+
+BASE_URL = 'geofencing-service/api/1.0/'
+
+
+def make_response(status_code, content):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.json = Mock(return_value=content)
+
+    return response
+
+
+def make_error_response(status_code):
+    response = Mock()
+    response.status_code = status_code
+    response.text = '{"genericReply": {"RequestExceptionDescription": "error"}}'
+
+    return response
+
+
+@pytest.mark.parametrize('error_code', [400, 401, 403, 404, 500])
+def test_filter_uas_zones__http_error_code__raises_api_error_with_extracted_detail(error_code):
+    request_handler = make_async_request_handler(post=make_error_response(error_code))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    with pytest.raises(APIError) as e:
+        asyncio.run(client.filter_uas_zones(uas_zones_filter=Mock()))
+
+    assert 'error' == e.value.detail
+
+
+def test_filter_uas_zones__proper_response_is_returned():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    request_handler = make_async_request_handler(post=make_response(200, uas_zones_filter_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    uas_zones_filter_reply = asyncio.run(client.filter_uas_zones(uas_zones_filter=uas_zones_filter))
+
+    assert expected_uas_zones_filter_reply == uas_zones_filter_reply
+
+    called_url = request_handler.post.call_args[0][0]
+    assert BASE_URL + 'uas_zones/filter/' == called_url
+
+
+def test_filter_uas_zones__many_concurrent_calls_on_one_event_loop():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    request_handler = make_async_request_handler(post=make_response(200, uas_zones_filter_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    async def filter_many():
+        return await asyncio.gather(*[client.filter_uas_zones(uas_zones_filter) for _ in range(100)])
+
+    replies = asyncio.run(filter_many())
+
+    assert 100 == len(replies)
+    assert all(expected_uas_zones_filter_reply == reply for reply in replies)
+    assert 100 == request_handler.post.call_count
+
+
+def test_post_uas_zone__proper_response_is_returned():
+    _, uas_zone = make_uas_zone()
+    uas_zone_create_reply_dict, expected_uas_zone_create_reply = make_uas_zone_create_reply()
+
+    request_handler = make_async_request_handler(post=make_response(201, uas_zone_create_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    uas_zone_create_reply = asyncio.run(client.post_uas_zone(uas_zone=uas_zone))
+
+    assert expected_uas_zone_create_reply == uas_zone_create_reply
+
+    called_url = request_handler.post.call_args[0][0]
+    assert BASE_URL + 'uas_zones/' == called_url
+
+
+def test_delete_uas_zone_by_identifier():
+    request_handler = make_async_request_handler(delete=make_response(204, {}))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    assert asyncio.run(client.delete_uas_zone_by_identifier(1)) is None
+
+    called_url = request_handler.delete.call_args[0][0]
+    assert BASE_URL + 'uas_zones/1' == called_url
+
+
+def test_post_subscription__proper_response_is_returned():
+    _, uas_zones_filter = make_uas_zones_filter()
+    subscribe_to_uas_zones_updates_reply_dict, expected_subscribe_to_uas_zones_updates_reply = \
+        make_subscribe_to_uas_zones_updates_reply()
+
+    request_handler = make_async_request_handler(post=make_response(201, subscribe_to_uas_zones_updates_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    reply = asyncio.run(client.post_subscription(uas_zones_filter=uas_zones_filter))
+
+    assert expected_subscribe_to_uas_zones_updates_reply == reply
+
+    called_url = request_handler.post.call_args[0][0]
+    assert BASE_URL + 'subscriptions/' == called_url
+
+
+def test_get_subscription_by_id__proper_response_is_returned():
+    uas_zone_subscription_reply_dict, expected_uas_zone_subscription_reply = make_uas_zone_subscription_reply()
+
+    request_handler = make_async_request_handler(get=make_response(200, uas_zone_subscription_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    reply = asyncio.run(client.get_subscription_by_id(subscription_id='sub_id'))
+
+    assert expected_uas_zone_subscription_reply == reply
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'subscriptions/sub_id' == called_url
+
+
+def test_get_subscriptions__proper_response_is_returned():
+    uas_zone_subscriptions_reply_dict, expected_uas_zone_subscriptions_reply = make_uas_zone_subscriptions_reply()
+
+    request_handler = make_async_request_handler(get=make_response(200, uas_zone_subscriptions_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    reply = asyncio.run(client.get_subscriptions())
+
+    assert expected_uas_zone_subscriptions_reply == reply
+
+    called_url = request_handler.get.call_args[0][0]
+    assert BASE_URL + 'subscriptions/' == called_url
+
+
+@pytest.mark.parametrize('method, call', [
+    ('put', lambda client: client.put_subscription(subscription_id='sub_id', update_data={'active': False})),
+    ('delete', lambda client: client.delete_subscription_by_id(subscription_id='sub_id')),
+])
+def test_subscription_by_id_updates__proper_response_is_returned(method, call):
+    reply_dict, expected_reply = make_reply()
+
+    request_handler = make_async_request_handler(**{method: make_response(200, reply_dict)})
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    reply = asyncio.run(call(client))
+
+    assert expected_reply == reply
+
+    called_url = getattr(request_handler, method).call_args[0][0]
+    assert BASE_URL + 'subscriptions/sub_id' == called_url
+
+
+def test_post_uas_zones__returns_a_result_per_zone_in_order_and_collects_errors():
+    uas_zone_create_reply_dict, expected_uas_zone_create_reply = make_uas_zone_create_reply()
+    uas_zones = []
+    for identifier in ['first', 'invalid']:
+        _, uas_zone = make_uas_zone()
+        uas_zone.identifier = identifier
+        uas_zones.append(uas_zone)
+
+    async def post(url, json):
+        if json['identifier'] == 'invalid':
+            return make_error_response(400)
+        return make_response(201, uas_zone_create_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=post)
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    report = asyncio.run(client.post_uas_zones(uas_zones, max_concurrency=2))
+
+    assert expected_uas_zone_create_reply == report.results[0]
+    assert isinstance(report.results[1], APIError)
+    assert 2 == report.stats.count
+
+
+def test_filter_uas_zones_many__merge__uas_zones_are_deduplicated_by_identifier():
+    uas_zones_filters = []
+    for region in [1, 2, 1]:
+        _, uas_zones_filter = make_uas_zones_filter()
+        uas_zones_filter.regions = [region]
+        uas_zones_filters.append(uas_zones_filter)
+
+    async def post(url, json):
+        uas_zones_filter_reply_dict, _ = make_uas_zones_filter_reply()
+        uas_zones_filter_reply_dict['UASZoneList'][0]['identifier'] = f"zone_{json['regions'][0]}"
+        return make_response(200, uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=post)
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    replies = asyncio.run(client.filter_uas_zones_many(uas_zones_filters, max_concurrency=2))
+    uas_zones = asyncio.run(client.filter_uas_zones_many(uas_zones_filters, merge=True))
+
+    assert ['zone_1', 'zone_2', 'zone_1'] == [reply.uas_zone_list[0].identifier for reply in replies]
+    assert ['zone_1', 'zone_2'] == [uas_zone.identifier for uas_zone in uas_zones]
+
+
+def test_iter_filter_uas_zones_tiled__uas_zones_are_deduplicated_across_tiles():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    request_handler = make_async_request_handler(post=make_response(200, uas_zones_filter_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    async def collect():
+        return [uas_zone async for uas_zone in client.iter_filter_uas_zones_tiled(uas_zones_filter, rows=2, columns=2)]
+
+    uas_zones = asyncio.run(collect())
+
+    assert expected_uas_zones_filter_reply.uas_zone_list == uas_zones
+    assert 4 == request_handler.post.call_count
+
+
+def test_iter_filter_uas_zones_tiled__polygon_with_hole__uas_zones_within_the_hole_are_left_out():
+    uas_zones_filter_reply_dict, _ = make_uas_zones_filter_reply()
+    uas_zone_dict = uas_zones_filter_reply_dict['UASZoneList'][0]
+    uas_zone_dicts = []
+    for identifier, min_xy in (('in the area', 0.2), ('in the hole', 1.2)):
+        uas_zone_dict = deepcopy(uas_zone_dict)
+        uas_zone_dict['identifier'] = identifier
+        uas_zone_dict['geometry'] = uas_zone_dict['geometry'][:1]
+        uas_zone_dict['geometry'][0]['horizontalProjection']['coordinates'] = [
+            [[min_xy, min_xy], [min_xy + 0.6, min_xy], [min_xy + 0.6, min_xy + 0.6], [min_xy, min_xy]]
+        ]
+        uas_zone_dicts.append(uas_zone_dict)
+    uas_zones_filter_reply_dict['UASZoneList'] = uas_zone_dicts
+
+    request_handler = make_async_request_handler(post=make_response(200, uas_zones_filter_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection.coordinates = [
+        [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0], [0.0, 3.0], [0.0, 0.0]],
+        [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]]
+    ]
+
+    async def collect():
+        return [uas_zone async for uas_zone in client.iter_filter_uas_zones_tiled(uas_zones_filter, rows=1, columns=1)]
+
+    uas_zones = asyncio.run(collect())
+
+    assert ['in the area'] == [uas_zone.identifier for uas_zone in uas_zones]
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+def test_iter_filter_uas_zones_by_time_window__uas_zones_are_deduplicated_across_windows(lazy):
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    request_handler = make_async_request_handler(post=make_response(200, uas_zones_filter_reply_dict))
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler)
+
+    async def collect():
+        return [uas_zone async for uas_zone in client.iter_filter_uas_zones_by_time_window(uas_zones_filter,
+                                                                                           window=timedelta(weeks=1),
+                                                                                           lazy=lazy)]
+
+    uas_zones = asyncio.run(collect())
+
+    assert expected_uas_zones_filter_reply.uas_zone_list == uas_zones
+    assert 5 == request_handler.post.call_count
+
+
+def test_rate_limiter__requests_are_limited_per_endpoint_group():
+    request_handler = make_async_request_handler(post=make_response(204, {}), delete=make_response(204, {}))
+
+    groups = []
+
+    async def acquire_async(group):
+        groups.append(group)
+
+    rate_limiter = Mock()
+    rate_limiter.acquire_async = Mock(side_effect=acquire_async)
+
+    client = AsyncGeofencingServiceClient(request_handler=request_handler, rate_limiter=rate_limiter)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    asyncio.run(client.filter_uas_zones(uas_zones_filter))
+    asyncio.run(client.delete_uas_zone_by_identifier(1))
+    asyncio.run(client.post_subscription(uas_zones_filter))
+
+    assert [EndpointGroup.READS, EndpointGroup.WRITES, EndpointGroup.SUBSCRIPTIONS] == groups
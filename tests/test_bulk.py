@@ -0,0 +1,97 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import asyncio
+import time
+
+import pytest
+
+from geofencing_service_client.bulk import iter_concurrently, iter_concurrently_async, map_concurrently
+
+
+def _sleep_and_return(delay):
+    time.sleep(delay)
+    return delay
+
+
+async def _async_sleep_and_return(delay):
+    await asyncio.sleep(delay)
+    return delay
+
+
+def test_map_concurrently__results_are_in_input_order():
+    assert [0.03, 0.01, 0.02] == map_concurrently(_sleep_and_return, [0.03, 0.01, 0.02], max_concurrency=3)
+
+
+def test_iter_concurrently__ordered():
+    assert [0.03, 0.01, 0.02] == list(iter_concurrently(_sleep_and_return, [0.03, 0.01, 0.02], max_concurrency=3))
+
+
+def test_iter_concurrently__unordered__results_are_yielded_as_completed():
+    results = list(iter_concurrently(_sleep_and_return, [0.05, 0.01, 0.03], max_concurrency=3, ordered=False))
+
+    assert [0.01, 0.03, 0.05] == results
+
+
+def test_iter_concurrently__calls_are_started_as_results_are_consumed():
+    calls = []
+
+    def record(item):
+        calls.append(item)
+        return item
+
+    results = iter_concurrently(record, range(10), max_concurrency=2)
+
+    assert 0 == next(results)
+    time.sleep(0.01)
+    assert len(calls) <= 3
+
+    results.close()
+
+
+def test_iter_concurrently__exception_is_propagated():
+    def fail(item):
+        raise ValueError(item)
+
+    with pytest.raises(ValueError):
+        list(iter_concurrently(fail, [1], max_concurrency=1))
+
+
+def test_iter_concurrently_async__ordered_and_unordered():
+    async def collect(ordered):
+        return [result async for result in iter_concurrently_async(_async_sleep_and_return,
+                                                                   [0.05, 0.01, 0.03],
+                                                                   max_concurrency=3,
+                                                                   ordered=ordered)]
+
+    assert [0.05, 0.01, 0.03] == asyncio.run(collect(ordered=True))
+    assert [0.01, 0.03, 0.05] == asyncio.run(collect(ordered=False))
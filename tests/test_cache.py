@@ -0,0 +1,165 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import datetime, timezone
+
+import pytest
+
+from geofencing_service_client.cache import FilterReplyCache
+from tests.utils import make_uas_zones_filter, make_uas_zones_filter_reply
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _make_uas_zones_filter(month):
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.start_date_time = datetime(2020, month, 1, tzinfo=timezone.utc)
+
+    return uas_zones_filter
+
+
+def test_cache__get__hit_and_miss_are_counted():
+    _, reply = make_uas_zones_filter_reply()
+    cache = FilterReplyCache()
+
+    assert cache.get(_make_uas_zones_filter(1)) is None
+
+    cache.put(_make_uas_zones_filter(1), reply)
+
+    assert reply is cache.get(_make_uas_zones_filter(1))
+    assert 1 == cache.stats.hits
+    assert 1 == cache.stats.misses
+    assert 0.5 == cache.stats.hit_rate
+
+
+def test_cache__entries_expire_after_ttl():
+    _, reply = make_uas_zones_filter_reply()
+    clock = FakeClock()
+    cache = FilterReplyCache(ttl=10, clock=clock)
+
+    cache.put(_make_uas_zones_filter(1), reply)
+    clock.now = 9.9
+    assert reply is cache.get(_make_uas_zones_filter(1))
+
+    clock.now = 10
+    assert cache.get(_make_uas_zones_filter(1)) is None
+    assert 1 == cache.stats.expirations
+    assert 0 == len(cache)
+
+
+def test_cache__least_recently_used_entries_are_evicted():
+    _, reply = make_uas_zones_filter_reply()
+    cache = FilterReplyCache(max_entries=2)
+
+    cache.put(_make_uas_zones_filter(1), reply)
+    cache.put(_make_uas_zones_filter(2), reply)
+    cache.get(_make_uas_zones_filter(1))
+    cache.put(_make_uas_zones_filter(3), reply)
+
+    assert cache.get(_make_uas_zones_filter(1)) is not None
+    assert cache.get(_make_uas_zones_filter(2)) is None
+    assert cache.get(_make_uas_zones_filter(3)) is not None
+    assert 1 == cache.stats.evictions
+
+
+def test_cache__byte_budget__entries_are_evicted_beyond_it():
+    _, reply = make_uas_zones_filter_reply()
+    cache = FilterReplyCache(max_bytes=1)
+
+    cache.put(_make_uas_zones_filter(1), reply)
+
+    assert 0 == len(cache)
+
+
+def test_cache__invalidate__drops_entries_and_rejects_stale_replies():
+    _, reply = make_uas_zones_filter_reply()
+    cache = FilterReplyCache()
+
+    cache.put(_make_uas_zones_filter(1), reply)
+    generation = cache.generation
+    cache.invalidate()
+    cache.put(_make_uas_zones_filter(2), reply, generation=generation)
+
+    assert 0 == len(cache)
+    assert 1 == cache.stats.invalidations
+
+
+def test_cache__invalid_max_entries__raises_value_error():
+    with pytest.raises(ValueError):
+        FilterReplyCache(max_entries=0)
+
+
+def test_cache__derive_contained__narrower_filter_is_answered_from_the_wider_reply():
+    _, reply = make_uas_zones_filter_reply()
+    _, wider_uas_zones_filter = make_uas_zones_filter()
+    _, narrower_uas_zones_filter = make_uas_zones_filter()
+    narrower_uas_zones_filter.start_date_time = datetime(2020, 1, 10, tzinfo=timezone.utc)
+
+    cache = FilterReplyCache(derive_contained=True)
+    cache.put(wider_uas_zones_filter, reply)
+
+    derived_reply = cache.get(narrower_uas_zones_filter)
+
+    assert reply.uas_zone_list == derived_reply.uas_zone_list
+    assert reply.generic_reply == derived_reply.generic_reply
+    assert 1 == cache.stats.derived_hits
+
+
+def test_cache__derive_contained__wider_filter_is_not_answered_from_the_narrower_reply():
+    _, reply = make_uas_zones_filter_reply()
+    _, wider_uas_zones_filter = make_uas_zones_filter()
+    _, narrower_uas_zones_filter = make_uas_zones_filter()
+    narrower_uas_zones_filter.start_date_time = datetime(2020, 1, 10, tzinfo=timezone.utc)
+
+    cache = FilterReplyCache(derive_contained=True)
+    cache.put(narrower_uas_zones_filter, reply)
+
+    assert cache.get(wider_uas_zones_filter) is None
+
+
+def test_cache__derive_contained__disabled_by_default():
+    _, reply = make_uas_zones_filter_reply()
+    _, wider_uas_zones_filter = make_uas_zones_filter()
+    _, narrower_uas_zones_filter = make_uas_zones_filter()
+    narrower_uas_zones_filter.start_date_time = datetime(2020, 1, 10, tzinfo=timezone.utc)
+
+    cache = FilterReplyCache()
+    cache.put(wider_uas_zones_filter, reply)
+
+    assert cache.get(narrower_uas_zones_filter) is None
@@ -0,0 +1,176 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from copy import deepcopy
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from geofencing_service_client.collection import UASZoneCollection, TYPES, RESTRICTIONS, U_SPACE_CLASSES, \
+    MIN_TIMESTAMP, MAX_TIMESTAMP
+from geofencing_service_client.geometry import circle_bounding_box
+from geofencing_service_client.models import CodeRestrictionType, CodeUSpaceClassType, UASZone
+from tests.utils import make_uas_zone
+
+
+def make_uas_zone_objects():
+    polygon_and_circle, _ = make_uas_zone()
+
+    polygon_only = deepcopy(polygon_and_circle)
+    polygon_only['identifier'] = 'polygon_only'
+    polygon_only['restriction'] = 'PROHIBITED'
+    polygon_only['geometry'] = polygon_only['geometry'][:1]
+    polygon_only['geometry'][0]['horizontalProjection']['coordinates'] = [
+        [[10.0, 50.0], [11.0, 50.0], [11.0, 51.0], [10.0, 50.0]],
+        [[10.2, 50.2], [10.4, 50.2], [10.4, 50.4], [10.2, 50.2]],
+    ]
+    polygon_only['geometry'][0]['upperLimit'] = 120
+
+    circle_only = deepcopy(polygon_and_circle)
+    circle_only['identifier'] = 'circle_only'
+    circle_only['uSpaceClass'] = None
+    circle_only['applicability'] = None
+    circle_only['geometry'] = circle_only['geometry'][1:]
+    circle_only['geometry'][0]['uomDimensions'] = 'FT'
+    circle_only['geometry'][0]['upperLimit'] = 1000
+
+    return [polygon_and_circle, polygon_only, circle_only]
+
+
+def test_uas_zone_collection__from_json__columns():
+    uas_zone_objects = make_uas_zone_objects()
+
+    collection = UASZoneCollection.from_json({'UASZoneList': uas_zone_objects})
+
+    assert 3 == len(collection)
+    assert ['zsdffgs', 'polygon_only', 'circle_only'] == list(collection.identifiers)
+    assert [CodeRestrictionType.NO_RESTRICTION, CodeRestrictionType.PROHIBITED, CodeRestrictionType.NO_RESTRICTION] \
+        == [RESTRICTIONS[code] for code in collection.restrictions]
+    assert {'COMMON'} == {TYPES[code].value for code in collection.types}
+    assert CodeUSpaceClassType.EUROCONTROL == U_SPACE_CLASSES[collection.u_space_classes[0]]
+    assert -1 == collection.u_space_classes[2]
+    assert [0, 120, pytest.approx(304.8)] == list(collection.upper_limits)
+
+    circle_min_x, circle_min_y, circle_max_x, circle_max_y = circle_bounding_box([2.485866, 49.029301], 7000)
+    assert [min(circle_min_x, 2.485866), min(circle_min_y, 48.983358),
+            max(circle_max_x, 2.631263), max(circle_max_y, 49.034704)] == list(collection.bounding_boxes[0])
+    assert [10.0, 50.0, 11.0, 51.0] == list(collection.bounding_boxes[1])
+    assert [circle_min_x, circle_min_y, circle_max_x, circle_max_y] == list(collection.bounding_boxes[2])
+
+    start = int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp())
+    assert [start, start, MIN_TIMESTAMP] == list(collection.applicability_starts)
+    assert MAX_TIMESTAMP == collection.applicability_ends[2]
+
+    assert 3 == len(collection.ring_offsets) - 1
+    assert [0, 1, 3, 3] == list(collection.zone_ring_offsets)
+
+
+def test_uas_zone_collection__rings_are_views_on_the_coordinates():
+    uas_zone_objects = make_uas_zone_objects()
+
+    collection = UASZoneCollection.from_uas_zone_list_json(uas_zone_objects)
+
+    rings = collection.rings(1)
+    assert uas_zone_objects[1]['geometry'][0]['horizontalProjection']['coordinates'] == \
+        [ring.tolist() for ring in rings]
+    assert all(np.shares_memory(ring, collection.coordinates) for ring in rings)
+    assert [] == collection.rings(2)
+
+
+def test_uas_zone_collection__mask_and_slice():
+    uas_zone_objects = make_uas_zone_objects()
+    collection = UASZoneCollection.from_uas_zone_list_json(uas_zone_objects)
+
+    prohibited = collection[collection.restrictions == RESTRICTIONS.index(CodeRestrictionType.PROHIBITED)]
+    assert ['polygon_only'] == list(prohibited.identifiers)
+    assert uas_zone_objects[1]['geometry'][0]['horizontalProjection']['coordinates'] == \
+        [ring.tolist() for ring in prohibited.rings(0)]
+
+    in_area = collection[collection.intersects_bounding_box((10.5, 50.5, 12, 52))]
+    assert ['polygon_only'] == list(in_area.identifiers)
+
+    applicable = collection[collection.applicable_between(datetime(2022, 1, 1), datetime(2022, 2, 1))]
+    assert ['circle_only'] == list(applicable.identifiers)
+
+    tail = collection[1:]
+    assert ['polygon_only', 'circle_only'] == list(tail.identifiers)
+    assert [0, 2, 2] == list(tail.zone_ring_offsets)
+    assert len(tail.coordinates) == tail.ring_offsets[-1]
+
+
+def test_uas_zone_collection__negative_and_out_of_range_indexes():
+    uas_zone_objects = make_uas_zone_objects()
+    collection = UASZoneCollection.from_uas_zone_list_json(uas_zone_objects)
+
+    assert UASZone.from_json(uas_zone_objects[-2]) == collection[-2]
+    assert uas_zone_objects[-1] == collection.uas_zone_object(-1)
+    assert [ring.tolist() for ring in collection.rings(1)] == [ring.tolist() for ring in collection.rings(-2)]
+    for index in (3, -4):
+        with pytest.raises(IndexError):
+            collection[index]
+        with pytest.raises(IndexError):
+            collection.rings(index)
+
+
+def test_uas_zone_collection__zones_are_converted_back_on_demand():
+    uas_zone_objects = make_uas_zone_objects()[:2]
+    collection = UASZoneCollection.from_uas_zone_list_json(uas_zone_objects)
+
+    assert UASZone.from_json(uas_zone_objects[1]) == collection[1]
+    assert [UASZone.from_json(uas_zone_object) for uas_zone_object in uas_zone_objects] == collection.to_uas_zones()
+
+
+def test_uas_zone_collection__slim_objects_do_not_hold_the_columns_nor_the_coordinates():
+    uas_zone_objects = make_uas_zone_objects()
+    collection = UASZoneCollection.from_uas_zone_list_json(uas_zone_objects)
+
+    slim_object = collection.slim_objects[1]
+    assert not {'identifier', 'type', 'restriction', 'uSpaceClass'} & set(slim_object)
+    assert 'coordinates' not in slim_object['geometry'][0]['horizontalProjection']
+    assert uas_zone_objects[1]['zoneAuthority'] == slim_object['zoneAuthority']
+    assert uas_zone_objects == [collection.uas_zone_object(index) for index in range(len(collection))]
+
+
+def test_uas_zone_collection__positions_with_altitudes():
+    uas_zone_objects = make_uas_zone_objects()
+    projection = uas_zone_objects[1]['geometry'][0]['horizontalProjection']
+    projection['coordinates'][0] = [position + [100.0] for position in projection['coordinates'][0]]
+
+    collection = UASZoneCollection.from_uas_zone_list_json(uas_zone_objects)
+
+    assert (len(collection.coordinates), 2) == collection.coordinates.shape
+    assert [[10.0, 50.0], [11.0, 50.0], [11.0, 51.0], [10.0, 50.0]] == collection.rings(1)[0].tolist()
+    assert [10.0, 50.0, 11.0, 51.0] == list(collection.bounding_boxes[1])
+    assert UASZone.from_json(uas_zone_objects[1]) == collection[1]
+    assert uas_zone_objects[1] == collection.uas_zone_object(1)
@@ -0,0 +1,80 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from geofencing_service_client.compact import CompactUASZone, CompactAirspaceVolume, CompactPolygon, \
+    CompactUASZoneFilterReply, CompactAuthority, CompactTimePeriod, CompactDailyPeriod
+from tests.utils import make_uas_zone, make_uas_zones_filter_reply
+
+
+def test_compact_uas_zone__from_json_to_json():
+    uas_zone_dict, uas_zone = make_uas_zone()
+
+    compact_uas_zone = CompactUASZone.from_json(uas_zone_dict)
+
+    assert uas_zone.to_json() == compact_uas_zone.to_json()
+    assert uas_zone.restriction == compact_uas_zone.restriction
+    assert isinstance(compact_uas_zone.zone_authority, CompactAuthority)
+    assert isinstance(compact_uas_zone.geometry[0], CompactAirspaceVolume)
+    assert isinstance(compact_uas_zone.geometry[0].horizontal_projection, CompactPolygon)
+    assert isinstance(compact_uas_zone.applicability, CompactTimePeriod)
+    assert all(isinstance(s, CompactDailyPeriod) for s in compact_uas_zone.applicability.schedule)
+
+
+def test_compact_uas_zone__has_no_instance_dict():
+    uas_zone_dict, _ = make_uas_zone()
+
+    compact_uas_zone = CompactUASZone.from_json(uas_zone_dict)
+
+    for obj in [compact_uas_zone, compact_uas_zone.zone_authority, compact_uas_zone.geometry[0],
+                compact_uas_zone.geometry[0].horizontal_projection, compact_uas_zone.applicability]:
+        assert not hasattr(obj, '__dict__')
+
+
+def test_compact_uas_zone__eq():
+    uas_zone_dict, _ = make_uas_zone()
+
+    compact_uas_zone = CompactUASZone.from_json(uas_zone_dict)
+
+    assert compact_uas_zone == CompactUASZone.from_json(uas_zone_dict)
+
+    compact_uas_zone.geometry[0].upper_limit += 1
+    assert compact_uas_zone != CompactUASZone.from_json(uas_zone_dict)
+
+
+def test_compact_uas_zone_filter_reply__from_json():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    compact_uas_zones_filter_reply = CompactUASZoneFilterReply.from_json(uas_zones_filter_reply_dict)
+
+    assert all(isinstance(uas_zone, CompactUASZone) for uas_zone in compact_uas_zones_filter_reply.uas_zone_list)
+    assert [uas_zone.to_json() for uas_zone in uas_zones_filter_reply.uas_zone_list] == \
+        [uas_zone.to_json() for uas_zone in compact_uas_zones_filter_reply.uas_zone_list]
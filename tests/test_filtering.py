@@ -0,0 +1,157 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import datetime, timedelta, timezone
+
+from geofencing_service_client.filtering import uas_zones_filter_contains, uas_zone_matches_filter
+from geofencing_service_client.models import Polygon
+from tests.utils import make_uas_zones_filter, make_uas_zone
+
+INNER_POLYGON = Polygon(coordinates=[[
+    [2.55, 49.0],
+    [2.56, 49.0],
+    [2.56, 49.01],
+    [2.55, 49.01],
+    [2.55, 49.0]
+]])
+
+FAR_AWAY_POLYGON = Polygon(coordinates=[[
+    [3.55, 50.0],
+    [3.56, 50.0],
+    [3.56, 50.01],
+    [3.55, 50.01],
+    [3.55, 50.0]
+]])
+
+
+PLUS_TWO_HOURS = timezone(timedelta(hours=2))
+
+
+def _make_inner_uas_zones_filter():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection = INNER_POLYGON
+    uas_zones_filter.start_date_time = datetime(2020, 1, 10, tzinfo=timezone.utc)
+    uas_zones_filter.end_date_time = datetime(2020, 1, 20, tzinfo=timezone.utc)
+
+    return uas_zones_filter
+
+
+def test_uas_zones_filter_contains__narrower_filter():
+    _, outer = make_uas_zones_filter()
+
+    assert uas_zones_filter_contains(outer, _make_inner_uas_zones_filter())
+    assert uas_zones_filter_contains(outer, outer)
+    assert not uas_zones_filter_contains(_make_inner_uas_zones_filter(), outer)
+
+
+def test_uas_zones_filter_contains__wider_time_range__is_not_contained():
+    _, outer = make_uas_zones_filter()
+    inner = _make_inner_uas_zones_filter()
+    inner.end_date_time = datetime(2020, 3, 1, tzinfo=timezone.utc)
+
+    assert not uas_zones_filter_contains(outer, inner)
+
+
+def test_uas_zones_filter_contains__different_vertical_range__is_not_contained():
+    _, outer = make_uas_zones_filter()
+    inner = _make_inner_uas_zones_filter()
+    inner.airspace_volume.upper_limit = 100
+
+    assert not uas_zones_filter_contains(outer, inner)
+
+
+def test_uas_zones_filter_contains__other_regions__are_not_contained():
+    _, outer = make_uas_zones_filter()
+    inner = _make_inner_uas_zones_filter()
+    inner.regions = [1, 2]
+
+    assert not uas_zones_filter_contains(outer, inner)
+
+
+def test_uas_zones_filter_contains__date_times_are_compared_as_sent():
+    # the start of the outer filter is sent as 10:00Z, after the start of the inner one
+    _, outer = make_uas_zones_filter()
+    outer.start_date_time = datetime(2020, 1, 10, 10, tzinfo=PLUS_TWO_HOURS)
+    inner = _make_inner_uas_zones_filter()
+    inner.start_date_time = datetime(2020, 1, 10, 9, tzinfo=timezone.utc)
+
+    assert not uas_zones_filter_contains(outer, inner)
+
+
+def test_uas_zones_filter_contains__inner_polygon_with_holes__is_not_contained():
+    _, outer = make_uas_zones_filter()
+    inner = _make_inner_uas_zones_filter()
+    inner.airspace_volume.horizontal_projection = Polygon(coordinates=INNER_POLYGON.coordinates + [[
+        [2.552, 49.002],
+        [2.558, 49.002],
+        [2.558, 49.008],
+        [2.552, 49.002]
+    ]])
+
+    assert not uas_zones_filter_contains(outer, inner)
+
+
+def test_uas_zone_matches_filter():
+    _, uas_zone = make_uas_zone()
+    uas_zones_filter = _make_inner_uas_zones_filter()
+
+    assert uas_zone_matches_filter(uas_zone, uas_zones_filter)
+
+    uas_zones_filter.airspace_volume.horizontal_projection = FAR_AWAY_POLYGON
+    assert not uas_zone_matches_filter(uas_zone, uas_zones_filter)
+
+
+def test_uas_zone_matches_filter__applicability_out_of_the_time_range__does_not_match():
+    _, uas_zone = make_uas_zone()
+    uas_zones_filter = _make_inner_uas_zones_filter()
+    uas_zones_filter.start_date_time = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    uas_zones_filter.end_date_time = datetime(2022, 2, 1, tzinfo=timezone.utc)
+
+    assert not uas_zone_matches_filter(uas_zone, uas_zones_filter)
+
+
+def test_uas_zone_matches_filter__other_region__does_not_match():
+    _, uas_zone = make_uas_zone()
+    uas_zones_filter = _make_inner_uas_zones_filter()
+    uas_zones_filter.regions = [2]
+
+    assert not uas_zone_matches_filter(uas_zone, uas_zones_filter)
+
+
+def test_uas_zone_matches_filter__date_times_of_the_filter_are_compared_as_sent():
+    # the applicability of the zone ends at 2021-01-01T00:00Z and the filter is sent as starting at 01:00Z
+    _, uas_zone = make_uas_zone()
+    uas_zones_filter = _make_inner_uas_zones_filter()
+    uas_zones_filter.start_date_time = datetime(2021, 1, 1, 1, tzinfo=PLUS_TWO_HOURS)
+    uas_zones_filter.end_date_time = datetime(2021, 2, 1, tzinfo=timezone.utc)
+
+    assert not uas_zone_matches_filter(uas_zone, uas_zones_filter)
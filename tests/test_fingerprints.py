@@ -0,0 +1,73 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import datetime, timezone, timedelta
+
+from geofencing_service_client.fingerprints import uas_zones_filter_fingerprint, canonicalize
+from tests.utils import make_uas_zones_filter
+
+
+def test_canonicalize__coordinates_formatting_is_not_significant():
+    assert canonicalize({'coordinates': [[[2, 49.0000000000001]]]}) == canonicalize({'coordinates': [[[2.0, 49.0]]]})
+
+
+def test_canonicalize__date_times_are_converted_to_utc():
+    assert canonicalize({'startDateTime': '2020-01-01T02:00:00+02:00'}) == \
+        canonicalize({'startDateTime': '2020-01-01T00:00:00Z'})
+
+
+def test_canonicalize__regions_order_is_not_significant():
+    assert canonicalize({'regions': [2, 1]}) == canonicalize({'regions': [1, 2]})
+
+
+def test_uas_zones_filter_fingerprint__equivalent_filters__have_the_same_fingerprint():
+    _, uas_zones_filter = make_uas_zones_filter()
+    _, other_uas_zones_filter = make_uas_zones_filter()
+    other_uas_zones_filter.airspace_volume.horizontal_projection.coordinates[0][0] = [2.4858660, 49.0293010]
+
+    assert uas_zones_filter_fingerprint(uas_zones_filter) == uas_zones_filter_fingerprint(other_uas_zones_filter)
+
+
+def test_uas_zones_filter_fingerprint__different_filters__have_different_fingerprints():
+    _, uas_zones_filter = make_uas_zones_filter()
+    _, other_uas_zones_filter = make_uas_zones_filter()
+    other_uas_zones_filter.end_date_time = datetime(2020, 3, 1, tzinfo=timezone.utc)
+
+    assert uas_zones_filter_fingerprint(uas_zones_filter) != uas_zones_filter_fingerprint(other_uas_zones_filter)
+
+
+def test_uas_zones_filter_fingerprint__timezone_representation_is_not_significant():
+    _, uas_zones_filter = make_uas_zones_filter()
+    _, other_uas_zones_filter = make_uas_zones_filter()
+    other_uas_zones_filter.start_date_time = datetime(2020, 1, 1, tzinfo=timezone(timedelta(0)))
+
+    assert uas_zones_filter_fingerprint(uas_zones_filter) == uas_zones_filter_fingerprint(other_uas_zones_filter)
@@ -27,6 +27,12 @@ http://opensource.org/licenses/BSD-3-Clause
 
 Details on EUROCONTROL: http://www.eurocontrol.int
 """
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -35,7 +41,12 @@ __author__ = "EUROCONTROL (SWIM)"
 
 from rest_client.errors import APIError
 
+from geofencing_service_client.cache import FilterReplyCache
 from geofencing_service_client.geofencing_service import GeofencingServiceClient
+from geofencing_service_client.hedging import HedgingPolicy
+from geofencing_service_client.interning import InternTable
+from geofencing_service_client.json_codecs import StdlibJSONCodec
+from geofencing_service_client.rate_limit import EndpointGroup
 from tests.utils import make_uas_zones_filter_reply, make_uas_zones_filter, \
     make_uas_zone, make_uas_zone_create_reply, make_subscribe_to_uas_zones_updates_reply, \
     make_uas_zone_subscription_reply, make_uas_zone_subscriptions_reply, make_reply
@@ -331,3 +342,516 @@ def test_get_subscriptions__proper_response_is_returned():
 
     called_url = request_handler.get.call_args[0][0]
     assert BASE_URL + 'subscriptions/' == called_url
+
+
+def _make_post_uas_zone_response(url, **kwargs):
+    uas_zone_create_reply_dict, _ = make_uas_zone_create_reply()
+
+    if kwargs['json']['identifier'] == 'timeout':
+        raise TimeoutError('read timed out')
+
+    response = Mock()
+    if kwargs['json']['identifier'] == 'invalid':
+        response.status_code = 400
+        response.text = '{"genericReply": {"RequestExceptionDescription": "invalid zone"}}'
+    elif kwargs['json']['identifier'] == 'bad gateway':
+        response.status_code = 502
+        response.text = '<html>Bad Gateway</html>'
+    else:
+        response.status_code = 201
+        response.content = uas_zone_create_reply_dict
+        response.json = Mock(return_value=uas_zone_create_reply_dict)
+
+    return response
+
+
+def test_post_uas_zones__returns_a_result_per_zone_in_order_and_collects_errors():
+    uas_zones = []
+    for identifier in ['first', 'invalid', 'third']:
+        _, uas_zone = make_uas_zone()
+        uas_zone.identifier = identifier
+        uas_zones.append(uas_zone)
+    _, expected_uas_zone_create_reply = make_uas_zone_create_reply()
+
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=_make_post_uas_zone_response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    report = client.post_uas_zones(uas_zones, max_concurrency=2)
+
+    assert 3 == len(report.results)
+    assert expected_uas_zone_create_reply == report.results[0]
+    assert isinstance(report.results[1], APIError)
+    assert 'invalid zone' == report.results[1].detail
+    assert expected_uas_zone_create_reply == report.results[2]
+    assert 2 == len(report.succeeded)
+    assert 1 == len(report.failed)
+    assert 3 == report.stats.count
+    assert report.stats.throughput > 0
+
+
+def test_post_uas_zones__non_api_errors_are_collected_as_well():
+    uas_zones = []
+    for identifier in ['first', 'bad gateway', 'timeout', 'fourth']:
+        _, uas_zone = make_uas_zone()
+        uas_zone.identifier = identifier
+        uas_zones.append(uas_zone)
+
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=_make_post_uas_zone_response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    report = client.post_uas_zones(uas_zones, max_concurrency=2)
+
+    assert isinstance(report.results[1], ValueError)
+    assert isinstance(report.results[2], TimeoutError)
+    assert 2 == len(report.succeeded)
+    assert [report.results[1], report.results[2]] == report.failed
+
+
+def test_post_uas_zones__invalid_max_concurrency__raises_value_error():
+    client = GeofencingServiceClient(request_handler=Mock())
+
+    with pytest.raises(ValueError):
+        client.post_uas_zones([], max_concurrency=0)
+
+
+def _make_filter_uas_zones_response(url, **kwargs):
+    """
+    Replies with one UASZone whose identifier is derived by the region of the filter
+    """
+    uas_zones_filter_reply_dict, _ = make_uas_zones_filter_reply()
+    uas_zones_filter_reply_dict['UASZoneList'][0]['identifier'] = f"zone_{kwargs['json']['regions'][0]}"
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    return response
+
+
+def _make_uas_zones_filters(regions):
+    uas_zones_filters = []
+    for region in regions:
+        _, uas_zones_filter = make_uas_zones_filter()
+        uas_zones_filter.regions = [region]
+        uas_zones_filters.append(uas_zones_filter)
+
+    return uas_zones_filters
+
+
+def test_filter_uas_zones_many__replies_are_returned_in_input_order():
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=_make_filter_uas_zones_response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    replies = client.filter_uas_zones_many(_make_uas_zones_filters([3, 1, 2]), max_concurrency=3)
+
+    assert ['zone_3', 'zone_1', 'zone_2'] == [reply.uas_zone_list[0].identifier for reply in replies]
+    assert 3 == request_handler.post.call_count
+
+
+def test_filter_uas_zones_many__merge__uas_zones_are_deduplicated_by_identifier():
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=_make_filter_uas_zones_response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    uas_zones = client.filter_uas_zones_many(_make_uas_zones_filters([1, 2, 1]), merge=True)
+
+    assert ['zone_1', 'zone_2'] == [uas_zone.identifier for uas_zone in uas_zones]
+
+
+def test_filter_uas_zones_many__http_error_code__raises_api_error():
+    response = Mock()
+    response.status_code = 500
+    response.text = '{"genericReply": {"RequestExceptionDescription": "error"}}'
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    with pytest.raises(APIError):
+        client.filter_uas_zones_many(_make_uas_zones_filters([1, 2]))
+
+
+def test_iter_filter_uas_zones_tiled__uas_zones_are_deduplicated_across_tiles():
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones = list(client.iter_filter_uas_zones_tiled(uas_zones_filter, rows=2, columns=2))
+
+    assert expected_uas_zones_filter_reply.uas_zone_list == uas_zones
+    assert 4 == request_handler.post.call_count
+
+
+def test_iter_filter_uas_zones_tiled__concave_polygon__uas_zones_outside_of_it_are_left_out():
+    uas_zones_filter_reply_dict, _ = make_uas_zones_filter_reply()
+    uas_zone_dict = uas_zones_filter_reply_dict['UASZoneList'][0]
+    uas_zone_dicts = []
+    for identifier, min_x in (('in the leg', 0.2), ('in the notch', 1.2)):
+        uas_zone_dict = deepcopy(uas_zone_dict)
+        uas_zone_dict['identifier'] = identifier
+        uas_zone_dict['geometry'] = uas_zone_dict['geometry'][:1]
+        uas_zone_dict['geometry'][0]['horizontalProjection']['coordinates'] = [
+            [[min_x, 2.0], [min_x + 0.6, 2.0], [min_x + 0.6, 2.5], [min_x, 2.5], [min_x, 2.0]]
+        ]
+        uas_zone_dicts.append(uas_zone_dict)
+    uas_zones_filter_reply_dict['UASZoneList'] = uas_zone_dicts
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection.coordinates = [
+        [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0], [2.0, 3.0], [2.0, 1.0], [1.0, 1.0], [1.0, 3.0], [0.0, 3.0], [0.0, 0.0]]
+    ]
+    uas_zones = list(client.iter_filter_uas_zones_tiled(uas_zones_filter, rows=3, columns=3))
+
+    assert ['in the leg'] == [uas_zone.identifier for uas_zone in uas_zones]
+    assert 7 == request_handler.post.call_count
+
+
+def test_iter_filter_uas_zones_tiled__polygon_with_hole__uas_zones_within_the_hole_are_left_out():
+    uas_zones_filter_reply_dict, _ = make_uas_zones_filter_reply()
+    uas_zone_dict = uas_zones_filter_reply_dict['UASZoneList'][0]
+    uas_zone_dicts = []
+    for identifier, min_xy in (('in the area', 0.2), ('in the hole', 1.2)):
+        uas_zone_dict = deepcopy(uas_zone_dict)
+        uas_zone_dict['identifier'] = identifier
+        uas_zone_dict['geometry'] = uas_zone_dict['geometry'][:1]
+        uas_zone_dict['geometry'][0]['horizontalProjection']['coordinates'] = [
+            [[min_xy, min_xy], [min_xy + 0.6, min_xy], [min_xy + 0.6, min_xy + 0.6], [min_xy, min_xy]]
+        ]
+        uas_zone_dicts.append(uas_zone_dict)
+    uas_zones_filter_reply_dict['UASZoneList'] = uas_zone_dicts
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection.coordinates = [
+        [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0], [0.0, 3.0], [0.0, 0.0]],
+        [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]]
+    ]
+    uas_zones = list(client.iter_filter_uas_zones_tiled(uas_zones_filter, rows=1, columns=1))
+
+    assert ['in the area'] == [uas_zone.identifier for uas_zone in uas_zones]
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+def test_iter_filter_uas_zones_by_time_window__uas_zones_are_deduplicated_across_windows(lazy):
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones = list(client.iter_filter_uas_zones_by_time_window(uas_zones_filter,
+                                                                 window=timedelta(weeks=1),
+                                                                 lazy=lazy))
+
+    assert expected_uas_zones_filter_reply.uas_zone_list == uas_zones
+    assert 5 == request_handler.post.call_count
+
+    called_start_date_times = [call[1]['json']['startDateTime'] for call in request_handler.post.call_args_list]
+    assert sorted(called_start_date_times) == called_start_date_times
+
+
+def test_iter_filter_uas_zones_by_time_window__lazy__windows_are_requested_as_uas_zones_are_consumed():
+    uas_zones_filter_reply_dict, _ = make_uas_zones_filter_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones = client.iter_filter_uas_zones_by_time_window(uas_zones_filter, window=timedelta(days=1), lazy=True)
+
+    next(uas_zones)
+
+    assert 1 == request_handler.post.call_count
+
+
+def test_filter_uas_zones__with_cache__reply_is_served_from_cache_until_invalidated():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    delete_response = Mock()
+    delete_response.status_code = 204
+    delete_response.content = {}
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+    request_handler.delete = Mock(return_value=delete_response)
+
+    client = GeofencingServiceClient(request_handler=request_handler, cache=FilterReplyCache())
+
+    assert expected_uas_zones_filter_reply == client.filter_uas_zones(uas_zones_filter)
+    assert expected_uas_zones_filter_reply == client.filter_uas_zones(uas_zones_filter)
+    assert 1 == request_handler.post.call_count
+
+    client.delete_uas_zone_by_identifier(1)
+
+    assert expected_uas_zones_filter_reply == client.filter_uas_zones(uas_zones_filter)
+    assert 2 == request_handler.post.call_count
+    assert 1 == client.cache.stats.hits
+
+
+def test_filter_uas_zones__coalesce_requests__concurrent_identical_calls_share_one_request():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter_reply_dict, expected_uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    def slow_post(*args, **kwargs):
+        time.sleep(0.2)
+        return response
+
+    request_handler = Mock()
+    request_handler.post = Mock(side_effect=slow_post)
+
+    client = GeofencingServiceClient(request_handler=request_handler, coalesce_requests=True)
+
+    barrier = threading.Barrier(5)
+
+    def filter_uas_zones():
+        barrier.wait()
+        return client.filter_uas_zones(uas_zones_filter)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        replies = list(executor.map(lambda _: filter_uas_zones(), range(5)))
+
+    assert 1 == request_handler.post.call_count
+    assert all(expected_uas_zones_filter_reply == reply for reply in replies)
+
+
+def test_get_subscription_by_id__coalesce_requests__error_is_handled_once_and_shared():
+    response = Mock()
+    response.status_code = 404
+    response.text = '{"genericReply": {"RequestExceptionDescription": "not found"}}'
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.2)
+        return response
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=slow_get)
+
+    client = GeofencingServiceClient(request_handler=request_handler, coalesce_requests=True)
+
+    barrier = threading.Barrier(3)
+
+    def get_subscription_by_id():
+        barrier.wait()
+        try:
+            client.get_subscription_by_id('sub_id')
+        except APIError as e:
+            return e.detail
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        details = list(executor.map(lambda _: get_subscription_by_id(), range(3)))
+
+    assert ['not found'] * 3 == details
+    assert 1 == request_handler.get.call_count
+
+
+def test_get_subscription_by_id__hedging_policy__slow_request_is_hedged():
+    uas_zone_subscription_reply_dict, expected_uas_zone_subscription_reply = make_uas_zone_subscription_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zone_subscription_reply_dict
+    response.json = Mock(return_value=uas_zone_subscription_reply_dict)
+
+    calls = []
+
+    def get(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.5)
+        return response
+
+    request_handler = Mock()
+    request_handler.get = Mock(side_effect=get)
+
+    hedging_policy = HedgingPolicy(initial_delay=0.05, budget=1)
+    client = GeofencingServiceClient(request_handler=request_handler, hedging_policy=hedging_policy)
+
+    assert expected_uas_zone_subscription_reply == client.get_subscription_by_id(subscription_id='sub_id')
+    assert 1 == hedging_policy.stats.hedge_wins
+
+
+def test_rate_limiter__requests_are_limited_per_endpoint_group():
+    response = Mock()
+    response.status_code = 204
+    response.content = {}
+
+    request_handler = Mock()
+    request_handler.get = Mock(return_value=response)
+    request_handler.post = Mock(return_value=response)
+    request_handler.delete = Mock(return_value=response)
+
+    rate_limiter = Mock()
+    client = GeofencingServiceClient(request_handler=request_handler, rate_limiter=rate_limiter)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    client.filter_uas_zones(uas_zones_filter)
+    client.delete_uas_zone_by_identifier(1)
+    client.get_subscriptions()
+    client.delete_subscription_by_id('sub_id')
+
+    assert [EndpointGroup.READS, EndpointGroup.WRITES, EndpointGroup.SUBSCRIPTIONS, EndpointGroup.SUBSCRIPTIONS] == \
+        [call[0][0] for call in rate_limiter.acquire.call_args_list]
+
+
+def test_iter_filter_uas_zones():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+    content = json.dumps(uas_zones_filter_reply_dict).encode()
+
+    response = Mock()
+    response.status_code = 200
+    response.iter_content = Mock(return_value=iter([content[:100], content[100:]]))
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    stream = client.iter_filter_uas_zones(uas_zones_filter)
+
+    assert uas_zones_filter_reply.uas_zone_list == list(stream)
+    assert uas_zones_filter_reply.generic_reply == stream.generic_reply
+    request_handler.post.assert_called_once_with(BASE_URL + 'uas_zones/filter/',
+                                                 json=uas_zones_filter.to_json(), stream=True)
+    response.close.assert_called_once_with()
+
+
+def test_iter_filter_uas_zones__http_error_code__raises_api_error():
+    response = Mock()
+    response.status_code = 400
+    response.text = json.dumps({'genericReply': {'RequestExceptionDescription': 'invalid filter'}})
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    with pytest.raises(APIError) as e:
+        client.iter_filter_uas_zones(uas_zones_filter)
+
+    assert 'invalid filter' == e.value.detail
+    response.close.assert_called_once_with()
+
+
+def test_json_codec__bodies_are_encoded_and_decoded_with_it():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(uas_zones_filter_reply_dict).encode()
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler, json_codec=StdlibJSONCodec())
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    assert uas_zones_filter_reply == client.filter_uas_zones(uas_zones_filter)
+
+    request_handler.post.assert_called_once_with(BASE_URL + 'uas_zones/filter/',
+                                                 data=json.dumps(uas_zones_filter.to_json()).encode(),
+                                                 headers={'Content-Type': 'application/json'})
+    response.json.assert_not_called()
+
+
+def test_json_codec__http_error_code__raises_api_error_with_the_same_detail():
+    response = Mock()
+    response.status_code = 400
+    response.text = json.dumps({'genericReply': {'RequestExceptionDescription': 'invalid filter'}})
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler, json_codec=StdlibJSONCodec())
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    with pytest.raises(APIError) as e:
+        client.filter_uas_zones(uas_zones_filter)
+
+    assert 'invalid filter' == e.value.detail
+    assert 400 == e.value.status_code
+
+
+def test_intern_table__filtered_uas_zones_share_identical_sub_objects():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+    uas_zones_filter_reply_dict['UASZoneList'].append(deepcopy(uas_zones_filter_reply_dict['UASZoneList'][0]))
+
+    response = Mock()
+    response.status_code = 200
+    response.content = uas_zones_filter_reply_dict
+    response.json = Mock(return_value=uas_zones_filter_reply_dict)
+
+    request_handler = Mock()
+    request_handler.post = Mock(return_value=response)
+
+    client = GeofencingServiceClient(request_handler=request_handler, intern_table=InternTable())
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zone1, uas_zone2 = client.filter_uas_zones(uas_zones_filter).uas_zone_list
+
+    assert uas_zones_filter_reply.uas_zone_list[0] == uas_zone1
+    assert uas_zone1.zone_authority is uas_zone2.zone_authority
+    assert uas_zone1.applicability is uas_zone2.applicability
@@ -0,0 +1,198 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import pytest
+
+from geofencing_service_client.geometry import ring_bounding_box, split_bounding_box, clip_ring_to_bounding_box, \
+    ring_area, ring_is_convex, point_in_ring, rings_intersect, ring_contains_ring, haversine_distance, \
+    horizontal_projections_intersect, horizontal_projection_contains, polygons_intersect, point_in_polygon
+from geofencing_service_client.models import Polygon, Circle
+
+SQUARE = [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]]
+
+TRIANGLE = [[0.0, 0.0], [4.0, 0.0], [0.0, 4.0], [0.0, 0.0]]
+
+SQUARE_WITH_HOLE = [SQUARE, [[1.0, 1.0], [3.0, 1.0], [3.0, 3.0], [1.0, 3.0], [1.0, 1.0]]]
+
+U_SHAPE = [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0], [2.0, 3.0], [2.0, 1.0], [1.0, 1.0], [1.0, 3.0], [0.0, 3.0], [0.0, 0.0]]
+
+
+def test_ring_bounding_box():
+    assert (0.0, 0.0, 4.0, 4.0) == ring_bounding_box(TRIANGLE)
+
+
+def test_split_bounding_box():
+    cells = split_bounding_box((0.0, 0.0, 4.0, 2.0), rows=2, columns=2)
+
+    assert [
+        (0.0, 0.0, 2.0, 1.0),
+        (2.0, 0.0, 4.0, 1.0),
+        (0.0, 1.0, 2.0, 2.0),
+        (2.0, 1.0, 4.0, 2.0),
+    ] == cells
+
+
+@pytest.mark.parametrize('rows, columns', [(0, 1), (1, 0)])
+def test_split_bounding_box__invalid_grid__raises_value_error(rows, columns):
+    with pytest.raises(ValueError):
+        split_bounding_box((0.0, 0.0, 1.0, 1.0), rows=rows, columns=columns)
+
+
+def test_clip_ring_to_bounding_box__ring_within_the_box__is_unchanged():
+    assert SQUARE == clip_ring_to_bounding_box(SQUARE, (-1.0, -1.0, 5.0, 5.0))
+
+
+def test_clip_ring_to_bounding_box__ring_is_clipped_and_closed():
+    clipped = clip_ring_to_bounding_box(SQUARE, (2.0, 2.0, 6.0, 6.0))
+
+    assert clipped[0] == clipped[-1]
+    assert (2.0, 2.0, 4.0, 4.0) == ring_bounding_box(clipped)
+    assert 5 == len(clipped)
+
+
+def test_clip_ring_to_bounding_box__ring_outside_the_box__returns_empty_ring():
+    assert [] == clip_ring_to_bounding_box(TRIANGLE, (3.0, 3.0, 4.0, 4.0))
+
+
+def test_clip_ring_to_bounding_box__ring_touching_the_box__returns_empty_ring():
+    assert [] == clip_ring_to_bounding_box(SQUARE, (4.0, 0.0, 5.0, 4.0))
+    assert [] == clip_ring_to_bounding_box(SQUARE, (4.0, 4.0, 5.0, 5.0))
+    assert [] == clip_ring_to_bounding_box(U_SHAPE, (1.0, 1.0, 2.0, 3.0))
+
+
+def test_clip_ring_to_bounding_box__clipped_ring_has_no_repeated_points():
+    clipped = clip_ring_to_bounding_box(U_SHAPE, (0.0, 0.0, 1.0, 1.0))
+
+    assert 5 == len(clipped)
+    assert clipped[0] == clipped[-1]
+    assert {(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)} == {tuple(point) for point in clipped}
+
+
+def test_clip_ring_to_bounding_box__concave_ring__encloses_the_area_within_the_box():
+    assert 2.0 == ring_area(clip_ring_to_bounding_box(U_SHAPE, (0.0, 2.0, 3.0, 3.0)))
+
+
+def test_ring_area():
+    assert 16.0 == ring_area(SQUARE)
+    assert 8.0 == ring_area(TRIANGLE)
+    assert 7.0 == ring_area(U_SHAPE)
+
+
+@pytest.mark.parametrize('ring, expected_result', [
+    (SQUARE, True),
+    (list(reversed(TRIANGLE)), True),
+    ([[0.0, 0.0], [2.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 0.0]], True),
+    (U_SHAPE, False),
+])
+def test_ring_is_convex(ring, expected_result):
+    assert expected_result == ring_is_convex(ring)
+
+
+@pytest.mark.parametrize('point, expected_result', [
+    ([1.0, 1.0], True),
+    ([0.0, 2.0], True),
+    ([3.0, 3.0], False),
+    ([-1.0, 1.0], False),
+])
+def test_point_in_ring(point, expected_result):
+    assert expected_result == point_in_ring(point, TRIANGLE)
+
+
+@pytest.mark.parametrize('ring, expected_result', [
+    ([[1.0, 1.0], [5.0, 1.0], [5.0, 5.0], [1.0, 1.0]], True),
+    ([[4.0, 0.0], [5.0, 0.0], [5.0, 1.0], [4.0, 0.0]], True),
+    ([[5.0, 5.0], [6.0, 5.0], [6.0, 6.0], [5.0, 5.0]], False),
+])
+def test_rings_intersect(ring, expected_result):
+    assert expected_result == rings_intersect(SQUARE, ring)
+
+
+@pytest.mark.parametrize('point, expected_result', [
+    ([0.5, 0.5], True),
+    ([1.0, 2.0], True),
+    ([2.0, 2.0], False),
+    ([5.0, 5.0], False),
+])
+def test_point_in_polygon(point, expected_result):
+    assert expected_result == point_in_polygon(point, SQUARE_WITH_HOLE)
+
+
+@pytest.mark.parametrize('rings, expected_result', [
+    ([[[1.5, 1.5], [2.5, 1.5], [2.5, 2.5], [1.5, 1.5]]], False),
+    ([[[0.5, 1.5], [2.5, 1.5], [2.5, 2.5], [0.5, 1.5]]], True),
+    ([[[-1.0, -1.0], [5.0, -1.0], [5.0, 5.0], [-1.0, 5.0], [-1.0, -1.0]]], True),
+    ([[[5.0, 5.0], [6.0, 5.0], [6.0, 6.0], [5.0, 5.0]]], False),
+])
+def test_polygons_intersect__holes_are_excluded(rings, expected_result):
+    assert expected_result == polygons_intersect(SQUARE_WITH_HOLE, rings)
+    assert expected_result == polygons_intersect(rings, SQUARE_WITH_HOLE)
+
+
+def test_horizontal_projections_intersect__circle_within_a_hole__does_not_intersect():
+    polygon = Polygon(coordinates=SQUARE_WITH_HOLE)
+
+    assert not horizontal_projections_intersect(Circle(center=[2.0, 2.0], radius=1000), polygon)
+    assert horizontal_projections_intersect(Circle(center=[2.0, 2.0], radius=200000), polygon)
+
+
+@pytest.mark.parametrize('ring, expected_result', [
+    ([[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 1.0]], True),
+    ([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 0.0]], True),
+    ([[1.0, 1.0], [5.0, 1.0], [5.0, 2.0], [1.0, 1.0]], False),
+])
+def test_ring_contains_ring(ring, expected_result):
+    assert expected_result == ring_contains_ring(SQUARE, ring)
+
+
+def test_haversine_distance():
+    # one degree of latitude
+    assert 111195 == round(haversine_distance([0.0, 0.0], [0.0, 1.0]))
+
+
+def test_horizontal_projections_intersect():
+    polygon = Polygon(coordinates=[[[0.0, 0.0], [0.01, 0.0], [0.01, 0.01], [0.0, 0.01], [0.0, 0.0]]])
+
+    assert horizontal_projections_intersect(polygon, Circle(center=[0.005, 0.005], radius=1))
+    assert horizontal_projections_intersect(Circle(center=[0.02, 0.005], radius=1200), polygon)
+    assert not horizontal_projections_intersect(Circle(center=[0.02, 0.005], radius=1000), polygon)
+    assert horizontal_projections_intersect(Circle(center=[0.0, 0.0], radius=600),
+                                            Circle(center=[0.0, 0.01], radius=600))
+
+
+def test_horizontal_projection_contains():
+    polygon = Polygon(coordinates=[[[0.0, 0.0], [0.01, 0.0], [0.01, 0.01], [0.0, 0.01], [0.0, 0.0]]])
+
+    assert horizontal_projection_contains(Circle(center=[0.005, 0.005], radius=2000), polygon)
+    assert not horizontal_projection_contains(Circle(center=[0.005, 0.005], radius=500), polygon)
+    assert horizontal_projection_contains(Circle(center=[0.0, 0.0], radius=1000),
+                                          Circle(center=[0.0, 0.001], radius=500))
+    assert not horizontal_projection_contains(polygon, Circle(center=[0.005, 0.005], radius=1))
@@ -0,0 +1,135 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from geofencing_service_client.hedging import HedgingPolicy
+
+
+def _make_slow_first_call(delay):
+    """
+    Returns a function whose first call is slow and the next ones are fast
+    """
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            index = next(counter)
+        if index == 0:
+            time.sleep(delay)
+        return index
+
+    return call
+
+
+def test_hedging_policy__fast_reply__is_not_hedged():
+    policy = HedgingPolicy(initial_delay=0.5, budget=1)
+
+    assert 'reply' == policy.call(lambda: 'reply')
+    assert 1 == policy.stats.requests
+    assert 0 == policy.stats.hedges
+
+
+def test_hedging_policy__slow_reply__is_hedged_and_the_hedge_wins():
+    policy = HedgingPolicy(initial_delay=0.05, budget=1)
+
+    assert 1 == policy.call(_make_slow_first_call(delay=0.5))
+    assert 1 == policy.stats.hedges
+    assert 1 == policy.stats.hedge_wins
+    assert 1.0 == policy.stats.hedge_rate
+    assert 1.0 == policy.stats.win_rate
+
+
+def test_hedging_policy__budget_exhausted__waits_for_the_primary_request():
+    policy = HedgingPolicy(initial_delay=0.05, budget=0)
+
+    assert 0 == policy.call(_make_slow_first_call(delay=0.2))
+    assert 0 == policy.stats.hedges
+
+
+def test_hedging_policy__failing_primary__the_successful_hedge_wins():
+    counter = itertools.count()
+
+    def call():
+        if next(counter) == 0:
+            time.sleep(0.1)
+            raise ValueError
+        time.sleep(0.2)
+        return 'reply'
+
+    policy = HedgingPolicy(initial_delay=0.05, budget=1)
+
+    assert 'reply' == policy.call(call)
+
+
+def test_hedging_policy__both_requests_fail__error_is_raised():
+    def call():
+        time.sleep(0.1)
+        raise ValueError
+
+    policy = HedgingPolicy(initial_delay=0.05, budget=1)
+
+    with pytest.raises(ValueError):
+        policy.call(call)
+
+
+def test_hedging_policy__delay_follows_the_observed_latencies():
+    policy = HedgingPolicy(percentile=50, initial_delay=1.0, min_delay=0.0, min_samples=3)
+
+    assert 1.0 == policy.delay
+
+    for _ in range(3):
+        policy.call(lambda: None)
+
+    assert policy.delay < 1.0
+
+
+def test_hedging_policy__time_waiting_for_a_free_worker__is_not_counted_as_latency():
+    policy = HedgingPolicy(percentile=0, initial_delay=1.0, min_delay=0.0, budget=0, min_samples=2, max_workers=1)
+    slow_call = threading.Thread(target=policy.call, args=(lambda: time.sleep(0.3),))
+    slow_call.start()
+    time.sleep(0.05)
+
+    policy.call(lambda: None)
+    slow_call.join()
+
+    assert policy.delay < 0.1
+
+
+def test_hedging_policy__invalid_budget__raises_value_error():
+    with pytest.raises(ValueError):
+        HedgingPolicy(budget=2)
@@ -0,0 +1,123 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from copy import deepcopy
+
+import pytest
+
+from geofencing_service_client.interning import InternTable
+from geofencing_service_client.models import UASZone, Authority, UASZoneFilterReply
+from tests.utils import make_uas_zone, make_uas_zones_filter_reply
+
+
+def make_uas_zone_objects(count):
+    uas_zone_dict, _ = make_uas_zone()
+
+    uas_zone_objects = []
+    for i in range(count):
+        # a copy of the JSON as if each zone had been decoded separately from the response
+        uas_zone_object = deepcopy(uas_zone_dict)
+        uas_zone_object['identifier'] = f'zone_{i}'
+        uas_zone_object['restrictionConditions'] = ['condition']
+        uas_zone_objects.append(uas_zone_object)
+
+    return uas_zone_objects
+
+
+def test_uas_zone_class__identical_sub_objects_are_shared():
+    intern_table = InternTable()
+    uas_zone_objects = make_uas_zone_objects(3)
+
+    uas_zones = [intern_table.uas_zone_class.from_json(uas_zone_object) for uas_zone_object in uas_zone_objects]
+
+    assert [UASZone.from_json(uas_zone_object) for uas_zone_object in uas_zone_objects] == uas_zones
+    for uas_zone in uas_zones[1:]:
+        assert uas_zone.zone_authority is uas_zones[0].zone_authority
+        assert uas_zone.applicability is uas_zones[0].applicability
+        assert uas_zone.country is uas_zones[0].country
+        assert uas_zone.restriction_conditions is uas_zones[0].restriction_conditions
+    assert 0 < intern_table.hits
+
+
+def test_uas_zone_class__different_sub_objects_are_not_shared():
+    intern_table = InternTable()
+    uas_zone_objects = make_uas_zone_objects(2)
+    uas_zone_objects[1]['zoneAuthority']['name'] = 'other authority'
+
+    uas_zone1, uas_zone2 = [intern_table.uas_zone_class.from_json(uas_zone_object)
+                            for uas_zone_object in uas_zone_objects]
+
+    assert 'other authority' == uas_zone2.zone_authority.name
+    assert uas_zone1.zone_authority != uas_zone2.zone_authority
+    assert uas_zone1.applicability is uas_zone2.applicability
+
+
+def test_intern_table__is_bounded():
+    intern_table = InternTable(max_entries=2)
+    authority_dict = make_uas_zone()[0]['zoneAuthority']
+
+    authority = intern_table.intern_model(Authority, authority_dict)
+    intern_table.intern_string('a')
+    intern_table.intern_string('b')
+
+    assert 2 == len(intern_table)
+    assert authority is not intern_table.intern_model(Authority, deepcopy(authority_dict))
+
+
+def test_intern_table__invalid_max_entries__raises_value_error():
+    with pytest.raises(ValueError):
+        InternTable(max_entries=0)
+
+
+def test_uas_zone_filter_reply_class():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    intern_table = InternTable()
+    interned_reply = intern_table.uas_zone_filter_reply_class.from_json(uas_zones_filter_reply_dict)
+
+    assert isinstance(interned_reply, UASZoneFilterReply)
+    assert uas_zones_filter_reply.uas_zone_list == interned_reply.uas_zone_list
+    assert uas_zones_filter_reply.generic_reply == interned_reply.generic_reply
+    assert 0 < intern_table.misses
+
+
+def test_uas_zone_class__is_bound_to_its_table():
+    uas_zone_object = make_uas_zone_objects(1)[0]
+    intern_table, other_intern_table = InternTable(), InternTable()
+
+    uas_zone = intern_table.uas_zone_class.from_json(uas_zone_object)
+    other_uas_zone = other_intern_table.uas_zone_class.from_json(deepcopy(uas_zone_object))
+
+    assert uas_zone == other_uas_zone
+    assert type(uas_zone.zone_authority) is Authority
+    assert uas_zone.zone_authority is not other_uas_zone.zone_authority
+    assert len(intern_table) == len(other_intern_table)
@@ -0,0 +1,73 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import json
+
+import pytest
+
+from geofencing_service_client.json_codecs import StdlibJSONCodec, OrjsonCodec, UjsonCodec, default_json_codec
+from tests.utils import make_uas_zone
+
+
+def make_codec(codec_class):
+    try:
+        return codec_class()
+    except ImportError:
+        pytest.skip(f'{codec_class.name} is not installed')
+
+
+@pytest.mark.parametrize('codec_class', [StdlibJSONCodec, OrjsonCodec, UjsonCodec])
+def test_json_codec__dumps_loads(codec_class):
+    codec = make_codec(codec_class)
+    uas_zone_dict, _ = make_uas_zone()
+    uas_zone_dict['name'] = 'zone/é'
+
+    data = codec.dumps(uas_zone_dict)
+
+    assert isinstance(data, bytes)
+    assert uas_zone_dict == json.loads(data)
+    assert uas_zone_dict == codec.loads(data)
+    assert uas_zone_dict == codec.loads(json.dumps(uas_zone_dict))
+
+
+def test_default_json_codec__prefers_the_fastest_installed():
+    installed = []
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codec_class()
+            installed.append(codec_class)
+        except ImportError:
+            pass
+
+    expected_class = installed[0] if installed else StdlibJSONCodec
+
+    assert isinstance(default_json_codec(), expected_class)
@@ -0,0 +1,122 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest.mock import Mock
+
+import pytest
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from geofencing_service_client.mirror import ZoneMirror, InMemoryBroker
+from geofencing_service_client.models import UASZoneFilterReply, UASZonesUpdateMessage
+from tests.utils import make_uas_zone, make_uas_zones_filter, make_generic_reply, \
+    make_subscribe_to_uas_zones_updates_reply
+
+
+def _make_uas_zone(identifier):
+    _, uas_zone = make_uas_zone()
+    uas_zone.identifier = identifier
+
+    return uas_zone
+
+
+def _make_message(event, identifier):
+    return UASZonesUpdateMessage(event=event, uas_zone=_make_uas_zone(identifier)).to_json()
+
+
+def _make_client(identifiers):
+    _, generic_reply = make_generic_reply()
+    _, subscribe_reply = make_subscribe_to_uas_zones_updates_reply()
+
+    client = Mock()
+    client.post_subscription = Mock(return_value=subscribe_reply)
+    client.filter_uas_zones = Mock(return_value=UASZoneFilterReply(
+        uas_zone_list=[_make_uas_zone(identifier) for identifier in identifiers],
+        generic_reply=generic_reply
+    ))
+
+    return client
+
+
+def test_zone_mirror__initial_uas_zones_are_loaded_and_updates_are_applied():
+    _, uas_zones_filter = make_uas_zones_filter()
+    client = _make_client(['first', 'second'])
+    broker = InMemoryBroker()
+    on_update = Mock()
+
+    with ZoneMirror(client, uas_zones_filter, transport=broker, on_update=on_update) as mirror:
+        assert ['first', 'second'] == sorted(uas_zone.identifier for uas_zone in mirror.uas_zones)
+
+        broker.publish('location', _make_message('create', 'third'))
+        broker.publish('location', _make_message('delete', 'first'))
+
+        assert ['second', 'third'] == sorted(uas_zone.identifier for uas_zone in mirror.uas_zones)
+        assert 'first' not in mirror
+        assert _make_uas_zone('third') == mirror.get('third')
+        assert 2 == on_update.call_count
+
+    client.post_subscription.assert_called_once_with(uas_zones_filter)
+    client.delete_subscription_by_id.assert_called_once_with('123456')
+
+    broker.publish('location', _make_message('create', 'fourth'))
+    assert 'fourth' not in mirror
+
+
+def test_zone_mirror__updates_received_while_loading_are_applied_after_the_initial_uas_zones():
+    _, uas_zones_filter = make_uas_zones_filter()
+    client = _make_client(['first'])
+    broker = InMemoryBroker()
+
+    filter_uas_zones = client.filter_uas_zones
+
+    def filter_and_publish(*args, **kwargs):
+        broker.publish('location', _make_message('delete', 'first'))
+        broker.publish('location', _make_message('create', 'second'))
+        return filter_uas_zones(*args, **kwargs)
+
+    client.filter_uas_zones = Mock(side_effect=filter_and_publish)
+
+    mirror = ZoneMirror(client, uas_zones_filter, transport=broker)
+    mirror.start()
+
+    assert ['second'] == [uas_zone.identifier for uas_zone in mirror.uas_zones]
+
+
+def test_zone_mirror__initial_filter_fails__subscription_is_deleted():
+    _, uas_zones_filter = make_uas_zones_filter()
+    client = _make_client([])
+    client.filter_uas_zones = Mock(side_effect=ValueError)
+
+    mirror = ZoneMirror(client, uas_zones_filter, transport=InMemoryBroker())
+
+    with pytest.raises(ValueError):
+        mirror.start()
+
+    assert not mirror.started
+    client.delete_subscription_by_id.assert_called_once_with('123456')
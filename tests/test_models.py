@@ -30,7 +30,8 @@ Details on EUROCONTROL: http://www.eurocontrol.int
 
 __author__ = "EUROCONTROL (SWIM)"
 
-from datetime import datetime, timezone
+from copy import deepcopy
+from datetime import datetime, time, timedelta, timezone
 
 import pytest
 
@@ -38,7 +39,9 @@ from geofencing_service_client.models import AirspaceVolume, DailyPeriod, CodeWe
     CodeYesNoType, Authority, UASZone, CodeRestrictionType, CodeUSpaceClassType, CodeZoneType, \
     UASZonesFilter, GenericReply, RequestStatus, UASZoneFilterReply, UASZoneCreateReply, \
     SubscribeToUASZonesUpdatesReply, UASZoneSubscriptionReplyObject, UASZoneSubscriptionReply, \
-    UASZoneSubscriptionsReply, Polygon, CodeAuthorityRole, Circle
+    UASZoneSubscriptionsReply, Polygon, CodeAuthorityRole, Circle, UASZonesUpdateMessage, UASZonesUpdateEvent, \
+    LazyUASZone, LazyUASZoneFilterReply
+from tests.utils import make_uas_zone, make_uas_zones_filter_reply
 
 
 @pytest.mark.parametrize('polygon_json, expected_object', [
@@ -268,8 +271,8 @@ def test_airspace_volume__to_json(airspace_volume, expected_json):
         },
         DailyPeriod(
             day=CodeWeekDay.MON,
-            start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+            start_time=time(12, 0, 0, tzinfo=timezone.utc),
+            end_time=time(18, 0, 0, tzinfo=timezone.utc)
         )
     )
 ])
@@ -277,12 +280,30 @@ def test_daily_period__from_json(daily_period_json, expected_object):
     assert expected_object == DailyPeriod.from_json(daily_period_json)
 
 
+def test_daily_period__datetimes_are_converted_to_times_of_day():
+    daily_period = DailyPeriod(day='MON',
+                               start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+                               end_time=datetime(2000, 1, 1, 18, 30, 0))
+
+    assert time(12, 0, 0, tzinfo=timezone.utc) == daily_period.start_time
+    assert time(18, 30, 0) == daily_period.end_time
+
+
+def test_daily_period__from_json_to_json__keeps_the_offset():
+    daily_period_json = {'day': 'TUE', 'startTime': '08:15:30.250000+02:00', 'endTime': '17:00:00-05:30'}
+
+    daily_period = DailyPeriod.from_json(daily_period_json)
+
+    assert timedelta(hours=2) == daily_period.start_time.utcoffset()
+    assert daily_period_json == daily_period.to_json()
+
+
 @pytest.mark.parametrize('daily_period, expected_json', [
     (
         DailyPeriod(
             day=CodeWeekDay.MON,
-            start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+            start_time=time(12, 0, 0, tzinfo=timezone.utc),
+            end_time=time(18, 0, 0, tzinfo=timezone.utc)
         ),
         {
             'day': 'MON',
@@ -318,13 +339,13 @@ def test_daily_period__to_json(daily_period, expected_json):
             schedule=[
                 DailyPeriod(
                     day=CodeWeekDay.MON,
-                    start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-                    end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+                    start_time=time(12, 0, 0, tzinfo=timezone.utc),
+                    end_time=time(18, 0, 0, tzinfo=timezone.utc)
                 ),
                 DailyPeriod(
                     day=CodeWeekDay.SAT,
-                    start_time=datetime(2000, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
-                    end_time=datetime(2000, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+                    start_time=time(9, 0, 0, tzinfo=timezone.utc),
+                    end_time=time(15, 0, 0, tzinfo=timezone.utc)
                 )
             ]
         )
@@ -343,13 +364,13 @@ def test_time_period__from_json(time_period_json, expected_object):
             schedule=[
                 DailyPeriod(
                     day=CodeWeekDay.MON,
-                    start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-                    end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+                    start_time=time(12, 0, 0, tzinfo=timezone.utc),
+                    end_time=time(18, 0, 0, tzinfo=timezone.utc)
                 ),
                 DailyPeriod(
                     day=CodeWeekDay.SAT,
-                    start_time=datetime(2000, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
-                    end_time=datetime(2000, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+                    start_time=time(9, 0, 0, tzinfo=timezone.utc),
+                    end_time=time(15, 0, 0, tzinfo=timezone.utc)
                 )
             ]
         ),
@@ -548,13 +569,13 @@ def test_authority__to_json(authority, expected_json):
                 schedule=[
                     DailyPeriod(
                         day=CodeWeekDay.MON,
-                        start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-                        end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+                        start_time=time(12, 0, 0, tzinfo=timezone.utc),
+                        end_time=time(18, 0, 0, tzinfo=timezone.utc)
                     ),
                     DailyPeriod(
                         day=CodeWeekDay.SAT,
-                        start_time=datetime(2000, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
-                        end_time=datetime(2000, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+                        start_time=time(9, 0, 0, tzinfo=timezone.utc),
+                        end_time=time(15, 0, 0, tzinfo=timezone.utc)
                     )
                 ]
             ),
@@ -626,13 +647,13 @@ def test_uas_zone__from_json(uas_zone_json, expected_object):
                 schedule=[
                     DailyPeriod(
                         day=CodeWeekDay.MON,
-                        start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-                        end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+                        start_time=time(12, 0, 0, tzinfo=timezone.utc),
+                        end_time=time(18, 0, 0, tzinfo=timezone.utc)
                     ),
                     DailyPeriod(
                         day=CodeWeekDay.SAT,
-                        start_time=datetime(2000, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
-                        end_time=datetime(2000, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+                        start_time=time(9, 0, 0, tzinfo=timezone.utc),
+                        end_time=time(15, 0, 0, tzinfo=timezone.utc)
                     )
                 ]
             ),
@@ -1043,13 +1064,13 @@ def test_generic_reply__from_json(generic_reply_json, expected_object):
                         schedule=[
                             DailyPeriod(
                                 day=CodeWeekDay.MON,
-                                start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-                                end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+                                start_time=time(12, 0, 0, tzinfo=timezone.utc),
+                                end_time=time(18, 0, 0, tzinfo=timezone.utc)
                             ),
                             DailyPeriod(
                                 day=CodeWeekDay.SAT,
-                                start_time=datetime(2000, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
-                                end_time=datetime(2000, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+                                start_time=time(9, 0, 0, tzinfo=timezone.utc),
+                                end_time=time(15, 0, 0, tzinfo=timezone.utc)
                             )
                         ]
                     ),
@@ -1206,13 +1227,13 @@ def test_uas_zones_filter_reply__from_json(uas_zones_filter_reply_json, expected
                     schedule=[
                         DailyPeriod(
                             day=CodeWeekDay.MON,
-                            start_time=datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-                            end_time=datetime(2000, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+                            start_time=time(12, 0, 0, tzinfo=timezone.utc),
+                            end_time=time(18, 0, 0, tzinfo=timezone.utc)
                         ),
                         DailyPeriod(
                             day=CodeWeekDay.SAT,
-                            start_time=datetime(2000, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
-                            end_time=datetime(2000, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+                            start_time=time(9, 0, 0, tzinfo=timezone.utc),
+                            end_time=time(15, 0, 0, tzinfo=timezone.utc)
                         )
                     ]
                 ),
@@ -1739,3 +1760,144 @@ def test_uas_zone_subscription_reply__from_json(uas_zone_subscription_reply_json
 ])
 def test_uas_zone_subscriptions_reply__from_json(uas_zone_subscriptions_reply_json, expected_object):
     assert expected_object == UASZoneSubscriptionsReply.from_json(uas_zone_subscriptions_reply_json)
+
+
+def test_uas_zones_update_message__from_json_to_json():
+    uas_zone_dict, uas_zone = make_uas_zone()
+    message_dict = {'event': 'delete', 'uas_zone': uas_zone_dict}
+
+    message = UASZonesUpdateMessage.from_json(message_dict)
+
+    assert UASZonesUpdateEvent.DELETE == message.event
+    assert uas_zone == message.uas_zone
+    assert message_dict == message.to_json()
+
+
+def test_lazy_uas_zone__fields_are_decoded_on_first_access():
+    uas_zone_dict, uas_zone = make_uas_zone()
+
+    lazy_uas_zone = LazyUASZone.from_json(uas_zone_dict)
+
+    assert 'zone_authority' not in lazy_uas_zone.__dict__
+    assert uas_zone.identifier == lazy_uas_zone.identifier
+    assert uas_zone.geometry == lazy_uas_zone.geometry
+    assert 'zone_authority' not in lazy_uas_zone.__dict__
+    assert 'applicability' not in lazy_uas_zone.__dict__
+    assert uas_zone.zone_authority == lazy_uas_zone.zone_authority
+
+
+def test_lazy_uas_zone__compares_equal_to_the_eagerly_decoded_uas_zone():
+    uas_zone_dict, uas_zone = make_uas_zone()
+
+    assert uas_zone == LazyUASZone.from_json(uas_zone_dict)
+    assert LazyUASZone.from_json(uas_zone_dict) == uas_zone
+    assert LazyUASZone.from_json(uas_zone_dict) == LazyUASZone.from_json(uas_zone_dict)
+
+    lazy_uas_zone = LazyUASZone.from_json(uas_zone_dict)
+    lazy_uas_zone.name = 'other name'
+    assert uas_zone != lazy_uas_zone
+
+
+def test_lazy_uas_zone__fingerprint__is_cached_until_a_field_is_assigned(monkeypatch):
+    uas_zone_dict, uas_zone = make_uas_zone()
+    lazy_uas_zone = LazyUASZone.from_json(uas_zone_dict)
+    decode = LazyUASZone.decode
+    decode_calls = []
+    monkeypatch.setattr(LazyUASZone, 'decode', lambda self: decode_calls.append(self) or decode(self))
+
+    assert uas_zone.fingerprint == lazy_uas_zone.fingerprint
+    assert uas_zone.fingerprint == lazy_uas_zone.fingerprint
+    assert 1 == len(decode_calls)
+
+    lazy_uas_zone.name = 'other name'
+    assert uas_zone.fingerprint != lazy_uas_zone.fingerprint
+    assert 2 == len(decode_calls)
+
+
+def test_lazy_uas_zone__to_json__only_encodes_the_accessed_fields_again():
+    uas_zone_dict, uas_zone = make_uas_zone()
+
+    lazy_uas_zone = LazyUASZone.from_json(uas_zone_dict)
+    assert uas_zone_dict == lazy_uas_zone.to_json()
+
+    lazy_uas_zone.restriction = CodeRestrictionType.REQ_AUTHORISATION
+    lazy_uas_zone.geometry.pop()
+
+    expected_dict = dict(uas_zone_dict, restriction='REQ_AUTHORISATION', geometry=uas_zone_dict['geometry'][:-1])
+    assert expected_dict == lazy_uas_zone.to_json()
+
+
+def test_lazy_uas_zone_filter_reply__from_json():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    lazy_uas_zones_filter_reply = LazyUASZoneFilterReply.from_json(uas_zones_filter_reply_dict)
+
+    assert all(isinstance(uas_zone, LazyUASZone) for uas_zone in lazy_uas_zones_filter_reply.uas_zone_list)
+    assert uas_zones_filter_reply.uas_zone_list == lazy_uas_zones_filter_reply.uas_zone_list
+
+
+def test_uas_zone__fingerprint__is_the_same_for_equivalent_zones():
+    uas_zone_dict, uas_zone = make_uas_zone()
+
+    other_uas_zone_dict = deepcopy(uas_zone_dict)
+    other_uas_zone_dict['applicability']['startDateTime'] = '2020-01-01T01:00:00+01:00'
+    other_uas_zone = UASZone.from_json(other_uas_zone_dict)
+
+    assert uas_zone.fingerprint == other_uas_zone.fingerprint
+    assert uas_zone == other_uas_zone
+    assert 1 == len({uas_zone, other_uas_zone, LazyUASZone.from_json(uas_zone_dict)})
+
+
+def test_uas_zone__fingerprint__is_reset_when_the_zone_or_its_nested_objects_are_assigned():
+    _, uas_zone = make_uas_zone()
+    _, other_uas_zone = make_uas_zone()
+    fingerprint = uas_zone.fingerprint
+
+    uas_zone.name = 'other name'
+    assert fingerprint != uas_zone.fingerprint
+    assert uas_zone != other_uas_zone
+
+    uas_zone.name = other_uas_zone.name
+    assert fingerprint == uas_zone.fingerprint
+
+    uas_zone.geometry[0].upper_limit = 100
+    assert fingerprint != uas_zone.fingerprint
+    assert uas_zone != other_uas_zone
+
+    uas_zone.geometry[0].upper_limit = other_uas_zone.geometry[0].upper_limit
+    uas_zone.zone_authority.name = 'other authority'
+    assert uas_zone != other_uas_zone
+
+
+def test_uas_zone__fingerprint__is_reset_when_a_projection_or_a_schedule_entry_is_assigned():
+    _, uas_zone = make_uas_zone()
+    _, other_uas_zone = make_uas_zone()
+    fingerprint = uas_zone.fingerprint
+
+    uas_zone.geometry[0].horizontal_projection.coordinates = [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]]
+    assert fingerprint != uas_zone.fingerprint
+    assert uas_zone != other_uas_zone
+
+    horizontal_projection = other_uas_zone.geometry[0].horizontal_projection
+    uas_zone.geometry[0].horizontal_projection.coordinates = horizontal_projection.coordinates
+    assert fingerprint == uas_zone.fingerprint
+
+    uas_zone.applicability.schedule[0].day = CodeWeekDay.SUN
+    assert fingerprint != uas_zone.fingerprint
+    assert uas_zone != other_uas_zone
+
+
+@pytest.mark.parametrize('model_class, key', [
+    (AirspaceVolume, 'geometry'), (TimePeriod, 'applicability'), (Authority, 'zoneAuthority')
+])
+def test_fingerprinted_models__eq_and_hash(model_class, key):
+    uas_zone_dict, _ = make_uas_zone()
+    object_dict = uas_zone_dict[key][0] if key == 'geometry' else uas_zone_dict[key]
+
+    model = model_class.from_json(object_dict)
+    other_model = model_class.from_json(deepcopy(object_dict))
+
+    assert model is not other_model
+    assert model == other_model
+    assert hash(model) == hash(other_model)
+    assert 64 == len(model.fingerprint)
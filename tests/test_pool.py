@@ -0,0 +1,80 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from geofencing_service_client.geofencing_service import GeofencingServiceClient
+from geofencing_service_client.pool import PooledRequestHandler
+
+
+def test_pooled_request_handler__adapter_is_sized_and_mounted():
+    request_handler = PooledRequestHandler(host='localhost:8080', pool_size=20, max_retries=3)
+
+    adapter = request_handler.get_adapter('https://localhost:8080/')
+
+    assert 20 == adapter._pool_maxsize
+    assert adapter._pool_block
+    assert 3 == adapter.max_retries.total
+    assert adapter is request_handler.get_adapter('http://localhost:8080/')
+
+
+@pytest.mark.parametrize('https, expected_url', [
+    (True, 'https://localhost:8080/geofencing-service/api/1.0/ping-credentials'),
+    (False, 'http://localhost:8080/geofencing-service/api/1.0/ping-credentials'),
+])
+def test_pooled_request_handler__relative_urls_are_resolved_against_the_host(https, expected_url):
+    request_handler = PooledRequestHandler(host='localhost:8080', https=https, timeout=5)
+
+    with mock.patch.object(requests.Session, 'request') as session_request:
+        request_handler.get('geofencing-service/api/1.0/ping-credentials')
+
+    called_url = session_request.call_args[0][1]
+    assert expected_url == called_url
+    assert 5 == session_request.call_args[1]['timeout']
+
+
+def test_pooled_request_handler__invalid_pool_size__raises_value_error():
+    with pytest.raises(ValueError):
+        PooledRequestHandler(host='localhost', pool_size=0)
+
+
+def test_create_pooled__client_uses_a_pooled_request_handler_and_is_prewarmed():
+    with mock.patch.object(GeofencingServiceClient, 'ping_credentials', Mock()) as ping_credentials:
+        client = GeofencingServiceClient.create_pooled(host='localhost', username='user', password='pass',
+                                                       pool_size=4, prewarm=10, coalesce_requests=True)
+
+    assert isinstance(client.request_handler, PooledRequestHandler)
+    assert ('user', 'pass') == client.request_handler.auth
+    assert 4 == ping_credentials.call_count
@@ -0,0 +1,105 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import asyncio
+import time
+
+import pytest
+
+from geofencing_service_client.rate_limit import TokenBucket, RateLimiter, EndpointGroup
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket__burst_is_available_and_the_rest_is_smoothed():
+    bucket = TokenBucket(rate=10, capacity=2, clock=FakeClock())
+
+    assert 0.0 == bucket.reserve()
+    assert 0.0 == bucket.reserve()
+    assert pytest.approx(0.1) == bucket.reserve()
+    assert pytest.approx(0.2) == bucket.reserve()
+
+
+def test_token_bucket__tokens_are_refilled_over_time_up_to_the_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 10.0
+
+    assert 0.0 == bucket.reserve()
+    assert 0.0 == bucket.reserve()
+    assert pytest.approx(0.1) == bucket.reserve()
+
+
+def test_token_bucket__invalid_rate__raises_value_error():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket__acquire__waits_for_the_tokens():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    start = time.perf_counter()
+    for _ in range(3):
+        bucket.acquire()
+
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_token_bucket__acquire_async__waits_for_the_tokens():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    async def acquire_many():
+        await asyncio.gather(*[bucket.acquire_async() for _ in range(3)])
+
+    start = time.perf_counter()
+    asyncio.run(acquire_many())
+
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_rate_limiter__groups_without_rate_are_unlimited():
+    rate_limiter = RateLimiter(writes=5)
+
+    assert [EndpointGroup.WRITES] == list(rate_limiter.buckets)
+
+    rate_limiter.acquire(EndpointGroup.READS)
+    asyncio.run(rate_limiter.acquire_async(EndpointGroup.SUBSCRIPTIONS))
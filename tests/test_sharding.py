@@ -0,0 +1,148 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import timedelta
+
+import pytest
+
+from geofencing_service_client.geometry import ring_bounding_box, ring_area
+from geofencing_service_client.models import Circle, Polygon
+from geofencing_service_client.sharding import split_uas_zones_filter_by_area, split_uas_zones_filter_by_time, \
+    tiles_are_exact
+from tests.utils import make_uas_zones_filter
+
+U_SHAPE = [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0], [2.0, 3.0], [2.0, 1.0], [1.0, 1.0], [1.0, 3.0], [0.0, 3.0], [0.0, 0.0]]
+
+
+def test_split_uas_zones_filter_by_area__tiles_cover_the_bounding_box_of_the_polygon():
+    _, uas_zones_filter = make_uas_zones_filter()
+    polygon_ring = uas_zones_filter.airspace_volume.horizontal_projection.coordinates[0]
+    min_x, min_y, max_x, max_y = ring_bounding_box(polygon_ring)
+
+    tile_filters = split_uas_zones_filter_by_area(uas_zones_filter, rows=2, columns=2)
+
+    assert 4 == len(tile_filters)
+
+    tile_bounding_boxes = [
+        ring_bounding_box(tile_filter.airspace_volume.horizontal_projection.coordinates[0])
+        for tile_filter in tile_filters
+    ]
+    assert min_x == min(bb[0] for bb in tile_bounding_boxes)
+    assert min_y == min(bb[1] for bb in tile_bounding_boxes)
+    assert max_x == max(bb[2] for bb in tile_bounding_boxes)
+    assert max_y == max(bb[3] for bb in tile_bounding_boxes)
+
+
+def test_split_uas_zones_filter_by_area__the_rest_of_the_filter_is_kept():
+    _, uas_zones_filter = make_uas_zones_filter()
+
+    for tile_filter in split_uas_zones_filter_by_area(uas_zones_filter, rows=3, columns=3):
+        assert uas_zones_filter.regions == tile_filter.regions
+        assert uas_zones_filter.start_date_time == tile_filter.start_date_time
+        assert uas_zones_filter.end_date_time == tile_filter.end_date_time
+        assert uas_zones_filter.airspace_volume.upper_limit == tile_filter.airspace_volume.upper_limit
+        assert uas_zones_filter.airspace_volume.lower_limit == tile_filter.airspace_volume.lower_limit
+
+
+def test_split_uas_zones_filter_by_area__concave_polygon__tiles_are_the_cells_overlapping_with_it():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection = Polygon(coordinates=[U_SHAPE])
+
+    tile_filters = split_uas_zones_filter_by_area(uas_zones_filter, rows=3, columns=3)
+
+    tile_rings = [tile_filter.airspace_volume.horizontal_projection.coordinates[0] for tile_filter in tile_filters]
+    assert [
+        (0.0, 0.0, 1.0, 1.0), (1.0, 0.0, 2.0, 1.0), (2.0, 0.0, 3.0, 1.0),
+        (0.0, 1.0, 1.0, 2.0), (2.0, 1.0, 3.0, 2.0),
+        (0.0, 2.0, 1.0, 3.0), (2.0, 2.0, 3.0, 3.0),
+    ] == [ring_bounding_box(tile_ring) for tile_ring in tile_rings]
+    for tile_ring in tile_rings:
+        assert 1.0 == ring_area(tile_ring)
+        assert all(p != q for p, q in zip(tile_ring, tile_ring[1:]))
+    assert not tiles_are_exact(uas_zones_filter)
+
+
+def test_split_uas_zones_filter_by_area__convex_polygon__tiles_are_exact():
+    _, uas_zones_filter = make_uas_zones_filter()
+    polygon_ring = uas_zones_filter.airspace_volume.horizontal_projection.coordinates[0]
+
+    tile_filters = split_uas_zones_filter_by_area(uas_zones_filter, rows=3, columns=3)
+
+    tile_rings = [tile_filter.airspace_volume.horizontal_projection.coordinates[0] for tile_filter in tile_filters]
+    assert ring_area(polygon_ring) == pytest.approx(sum(ring_area(tile_ring) for tile_ring in tile_rings))
+    assert tiles_are_exact(uas_zones_filter)
+
+
+def test_tiles_are_exact__convex_polygon_with_hole__is_not_exact():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection = Polygon(coordinates=[
+        [[0.0, 0.0], [3.0, 0.0], [3.0, 3.0], [0.0, 3.0], [0.0, 0.0]],
+        [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]]
+    ])
+
+    assert not tiles_are_exact(uas_zones_filter)
+
+
+def test_split_uas_zones_filter_by_area__circle__is_not_split():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.airspace_volume.horizontal_projection = Circle(center=[2.48, 49.02], radius=1000)
+
+    assert [uas_zones_filter] == split_uas_zones_filter_by_area(uas_zones_filter, rows=2, columns=2)
+
+
+def test_split_uas_zones_filter_by_time__windows_are_consecutive_and_cover_the_range():
+    _, uas_zones_filter = make_uas_zones_filter()
+
+    window_filters = split_uas_zones_filter_by_time(uas_zones_filter, window=timedelta(weeks=1))
+
+    assert 5 == len(window_filters)
+    assert uas_zones_filter.start_date_time == window_filters[0].start_date_time
+    assert uas_zones_filter.end_date_time == window_filters[-1].end_date_time
+    for previous, current in zip(window_filters, window_filters[1:]):
+        assert previous.end_date_time == current.start_date_time
+    assert timedelta(days=3) == window_filters[-1].end_date_time - window_filters[-1].start_date_time
+
+
+def test_split_uas_zones_filter_by_time__empty_range__returns_the_filter_itself():
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.end_date_time = uas_zones_filter.start_date_time
+
+    window_filters = split_uas_zones_filter_by_time(uas_zones_filter, window=timedelta(days=1))
+
+    assert [uas_zones_filter] == window_filters
+
+
+def test_split_uas_zones_filter_by_time__non_positive_window__raises_value_error():
+    _, uas_zones_filter = make_uas_zones_filter()
+
+    with pytest.raises(ValueError):
+        split_uas_zones_filter_by_time(uas_zones_filter, window=timedelta(0))
@@ -0,0 +1,111 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geofencing_service_client.singleflight import SingleFlight
+
+
+def _run_concurrently(func, times):
+    barrier = threading.Barrier(times)
+
+    def call():
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=times) as executor:
+        futures = [executor.submit(call) for _ in range(times)]
+
+    return futures
+
+
+def test_single_flight__concurrent_calls_with_the_same_key_share_one_call():
+    single_flight = SingleFlight()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    futures = _run_concurrently(lambda: single_flight.do('key', slow_call), times=5)
+    results = [future.result() for future in futures]
+
+    assert 1 == len(calls)
+    assert all(result is results[0] for result in results)
+    assert 0 == single_flight.in_flight
+
+
+def test_single_flight__exception_is_shared_with_the_waiting_calls():
+    single_flight = SingleFlight()
+
+    def failing_call():
+        time.sleep(0.2)
+        raise ValueError('error')
+
+    futures = _run_concurrently(lambda: single_flight.do('key', failing_call), times=3)
+
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result()
+
+
+def test_single_flight__sequential_calls_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    assert 1 == single_flight.do('key', lambda: 1)
+    assert 2 == single_flight.do('key', lambda: 2)
+
+
+def test_single_flight__calls_with_different_keys_are_not_coalesced():
+    single_flight = SingleFlight()
+    counter = iter(range(10))
+
+    def slow_call():
+        time.sleep(0.1)
+        return next(counter)
+
+    keys = iter(range(3))
+    lock = threading.Lock()
+
+    def call_with_own_key():
+        with lock:
+            key = next(keys)
+        return single_flight.do(key, slow_call)
+
+    futures = _run_concurrently(call_with_own_key, times=3)
+
+    assert [0, 1, 2] == sorted(future.result() for future in futures)
@@ -0,0 +1,98 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import json
+from copy import deepcopy
+
+import pytest
+
+from geofencing_service_client import snapshot
+from geofencing_service_client.models import UASZone
+from tests.utils import make_uas_zone, make_uas_zones_filter_reply
+
+
+def make_uas_zones():
+    uas_zone_dict, uas_zone = make_uas_zone()
+
+    other_uas_zone_dict = deepcopy(uas_zone_dict)
+    other_uas_zone_dict['identifier'] = 'other'
+    other_uas_zone_dict['name'] = 'zone é'
+    other_uas_zone_dict['geometry'][0]['horizontalProjection']['coordinates'] = [
+        [[10, 50], [11, 50], [11, 51], [10, 50]]
+    ]
+
+    return [uas_zone, UASZone.from_json(other_uas_zone_dict)]
+
+
+def test_dumps_loads__uas_zones():
+    uas_zones = make_uas_zones()
+
+    data = snapshot.dumps(uas_zones)
+
+    assert isinstance(data, bytes)
+    assert len(data) < len(json.dumps([uas_zone.to_json() for uas_zone in uas_zones]))
+    assert uas_zones == snapshot.loads(data)
+    assert [uas_zone.to_json() for uas_zone in uas_zones] == \
+        [uas_zone.to_json() for uas_zone in snapshot.loads(data)]
+
+
+def test_dumps_loads__integer_coordinates_are_kept():
+    uas_zones = make_uas_zones()
+
+    loaded = snapshot.loads(snapshot.dumps(uas_zones))
+
+    assert [[10, 50], [11, 50], [11, 51], [10, 50]] == loaded[1].geometry[0].horizontal_projection.coordinates[0]
+    assert all(type(c) is int for point in loaded[1].geometry[0].horizontal_projection.coordinates[0] for c in point)
+
+
+def test_dumps_loads__uas_zone_filter_reply():
+    _, uas_zones_filter_reply = make_uas_zones_filter_reply()
+
+    assert uas_zones_filter_reply == snapshot.loads(snapshot.dumps(uas_zones_filter_reply))
+
+
+def test_loads__zero_copy__rings_reference_the_data():
+    np = pytest.importorskip('numpy')
+    uas_zones = make_uas_zones()
+    data = snapshot.dumps(uas_zones)
+
+    loaded = snapshot.loads(data, zero_copy=True)
+
+    ring = loaded[0].geometry[0].horizontal_projection.exterior
+    assert np.shares_memory(ring, np.frombuffer(data, dtype=np.uint8))
+    assert uas_zones[0].geometry[0].horizontal_projection.coordinates[0] == ring.tolist()
+    assert [uas_zone.to_json() for uas_zone in uas_zones] == [uas_zone.to_json() for uas_zone in loaded]
+
+
+def test_loads__invalid_data__raises_value_error():
+    with pytest.raises(ValueError):
+        snapshot.loads(b'not a snapshot' + b'\0' * 32)
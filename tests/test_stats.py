@@ -0,0 +1,74 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import pytest
+
+from geofencing_service_client.stats import percentile, LatencyStats
+
+
+@pytest.mark.parametrize('values, p, expected_percentile', [
+    ([1.0], 50, 1.0),
+    ([3.0, 1.0, 2.0], 0, 1.0),
+    ([3.0, 1.0, 2.0], 50, 2.0),
+    ([3.0, 1.0, 2.0], 100, 3.0),
+    (list(range(1, 101)), 90, 90),
+    (list(range(1, 101)), 99, 99),
+])
+def test_percentile(values, p, expected_percentile):
+    assert expected_percentile == percentile(values, p)
+
+
+@pytest.mark.parametrize('values, p', [
+    ([], 50),
+    ([1.0], -1),
+    ([1.0], 101),
+])
+def test_percentile__invalid_input__raises_value_error(values, p):
+    with pytest.raises(ValueError):
+        percentile(values, p)
+
+
+def test_latency_stats():
+    stats = LatencyStats(latencies=[0.1, 0.2, 0.3, 0.4], elapsed=2.0)
+
+    assert 4 == stats.count
+    assert 2.0 == stats.throughput
+    assert 0.2 == stats.p50
+    assert 0.4 == stats.p99
+
+
+def test_latency_stats__empty_run():
+    stats = LatencyStats(latencies=[], elapsed=0.0)
+
+    assert 0 == stats.count
+    assert 0.0 == stats.throughput
+    assert 0.0 == stats.p50
@@ -0,0 +1,141 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from geofencing_service_client.models import UASZoneFilterReply, Polygon
+from geofencing_service_client.store import SQLiteZoneStore
+from tests.utils import make_uas_zone, make_uas_zones_filter, make_generic_reply
+
+
+def _make_uas_zone(identifier):
+    _, uas_zone = make_uas_zone()
+    uas_zone.identifier = identifier
+
+    return uas_zone
+
+
+def test_store__uas_zones_persist_across_instances(tmp_path):
+    path = str(tmp_path / 'uas_zones.db')
+
+    with SQLiteZoneStore(path) as store:
+        store.put_many([_make_uas_zone('first'), _make_uas_zone('second')])
+
+    with SQLiteZoneStore(path) as store:
+        assert 2 == len(store)
+        assert _make_uas_zone('first') == store.get('first')
+        assert ['first', 'second'] == sorted(uas_zone.identifier for uas_zone in store.all())
+
+
+def test_store__put__replaces_uas_zone_with_the_same_identifier():
+    store = SQLiteZoneStore(':memory:')
+    uas_zone = _make_uas_zone('first')
+
+    store.put(uas_zone)
+    uas_zone.name = 'renamed'
+    store.put(uas_zone)
+
+    assert 1 == len(store)
+    assert 'renamed' == store.get('first').name
+
+
+def test_store__bounding_box_index_is_kept_in_sync():
+    store = SQLiteZoneStore(':memory:')
+    uas_zone = _make_uas_zone('first')
+
+    store.put_many([_make_uas_zone('first'), _make_uas_zone('second'), uas_zone])
+    store.put(uas_zone)
+    store.delete('second')
+
+    assert [(1,)] == store._connection.execute("SELECT COUNT(*) FROM uas_zones_rtree").fetchall()
+    assert 1 == len(store)
+
+
+def test_store__delete():
+    store = SQLiteZoneStore(':memory:')
+    store.put_many([_make_uas_zone('first'), _make_uas_zone('second')])
+
+    store.delete('first')
+
+    assert store.get('first') is None
+    assert 1 == len(store)
+
+
+def test_store__query__uas_zones_are_selected_by_area_time_and_region():
+    store = SQLiteZoneStore(':memory:')
+    store.put(_make_uas_zone('first'))
+    _, uas_zones_filter = make_uas_zones_filter()
+
+    assert ['first'] == [uas_zone.identifier for uas_zone in store.query(uas_zones_filter)]
+
+    uas_zones_filter.airspace_volume.horizontal_projection = Polygon(coordinates=[[
+        [3.55, 50.0], [3.56, 50.0], [3.56, 50.01], [3.55, 50.01], [3.55, 50.0]
+    ]])
+    assert [] == store.query(uas_zones_filter)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.start_date_time = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    uas_zones_filter.end_date_time = datetime(2022, 2, 1, tzinfo=timezone.utc)
+    assert [] == store.query(uas_zones_filter)
+
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.regions = [2]
+    assert [] == store.query(uas_zones_filter)
+
+
+def test_store__query__date_times_of_the_filter_are_compared_as_sent():
+    # the applicability of the zone starts at 2020-01-01T00:00Z and the filter is sent as ending at 01:00Z
+    store = SQLiteZoneStore(':memory:')
+    store.put(_make_uas_zone('first'))
+    _, uas_zones_filter = make_uas_zones_filter()
+    uas_zones_filter.start_date_time = datetime(2019, 12, 1, tzinfo=timezone.utc)
+    uas_zones_filter.end_date_time = datetime(2020, 1, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+
+    assert ['first'] == [uas_zone.identifier for uas_zone in store.query(uas_zones_filter)]
+
+
+def test_store__reconcile__retrieved_uas_zones_are_stored_and_stale_ones_are_deleted():
+    store = SQLiteZoneStore(':memory:')
+    store.put_many([_make_uas_zone('stale'), _make_uas_zone('kept')])
+    _, uas_zones_filter = make_uas_zones_filter()
+    _, generic_reply = make_generic_reply()
+
+    client = Mock()
+    client.filter_uas_zones = Mock(return_value=UASZoneFilterReply(
+        uas_zone_list=[_make_uas_zone('kept'), _make_uas_zone('new')],
+        generic_reply=generic_reply
+    ))
+
+    store.reconcile_in_background(client, uas_zones_filter).join()
+
+    assert ['kept', 'new'] == sorted(uas_zone.identifier for uas_zone in store.all())
+    client.filter_uas_zones.assert_called_once_with(uas_zones_filter)
@@ -0,0 +1,88 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from geofencing_service_client.streaming import iter_json_array_member, UASZoneFilterReplyStream
+from tests.utils import make_uas_zones_filter_reply
+
+
+def chunked(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 1024])
+def test_iter_json_array_member__items_and_members_are_parsed_across_chunks(chunk_size):
+    document = {'before': {'a': [1, 2]}, 'items': [12345, "é€", {"b": None}, [1.5e3]], 'after': 67890}
+    members = {}
+
+    items = iter_json_array_member(chunked(json.dumps(document, ensure_ascii=False).encode(), chunk_size),
+                                   'items', members)
+
+    assert 12345 == next(items)
+    assert {'before': {'a': [1, 2]}} == members
+    assert ["é€", {"b": None}, [1.5e3]] == list(items)
+    assert {'before': {'a': [1, 2]}, 'after': 67890} == members
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5])
+def test_iter_json_array_member__brackets_quotes_and_escapes_within_strings(chunk_size):
+    items = ['a]b}c', '{"[', 'back\\slash\\', 'quote\\"', {'k]': ['\\', '"}']}, 'nested "quotes"', -1.25e-3, True, None]
+    document = json.dumps({'items': items}, indent=1)
+
+    assert items == list(iter_json_array_member(chunked(document.encode(), chunk_size), 'items'))
+
+
+def test_iter_json_array_member__empty_array_and_object():
+    assert [] == list(iter_json_array_member([' { "items" : [ ] } '], 'items'))
+    assert [] == list(iter_json_array_member(['{}'], 'items'))
+
+
+def test_iter_json_array_member__truncated_document__raises_value_error():
+    with pytest.raises(ValueError):
+        list(iter_json_array_member(['{"items": [1, 2'], 'items'))
+
+
+def test_uas_zone_filter_reply_stream__generic_reply_is_available_once_read():
+    uas_zones_filter_reply_dict, uas_zones_filter_reply = make_uas_zones_filter_reply()
+    on_close = Mock()
+
+    stream = UASZoneFilterReplyStream(chunked(json.dumps(uas_zones_filter_reply_dict).encode(), 16),
+                                      on_close=on_close)
+
+    assert stream.generic_reply is None
+    assert uas_zones_filter_reply.uas_zone_list == list(stream)
+    assert uas_zones_filter_reply.generic_reply == stream.generic_reply
+    on_close.assert_called_once_with()
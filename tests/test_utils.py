@@ -0,0 +1,95 @@
+"""
+Copyright 2019 EUROCONTROL
+==========================================
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the
+following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this list of conditions and the following
+   disclaimer.
+2. Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following
+   disclaimer in the documentation and/or other materials provided with the distribution.
+3. Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+==========================================
+
+Editorial note: this license is an instance of the BSD license template as provided by the Open Source Initiative:
+http://opensource.org/licenses/BSD-3-Clause
+
+Details on EUROCONTROL: http://www.eurocontrol.int
+"""
+
+__author__ = "EUROCONTROL (SWIM)"
+
+from datetime import time, timedelta, timezone
+
+import dateutil.parser
+import pytest
+
+from geofencing_service_client.models import CodeZoneType
+from geofencing_service_client.utils import parse_datetime_iso, parse_time_iso, enum_coercion
+
+
+@pytest.mark.parametrize('datetime_iso', [
+    '2020-01-01T00:00:00+00:00',
+    '2020-01-01T00:00:00Z',
+    '2020-01-01T00:00:00-00:00',
+    '2020-01-01T12:30:15.5+02:00',
+    '2020-01-01T12:30:15.123456-05:30',
+    '2020-01-01T12:30:15',
+    # fallbacks
+    '2020-01-01T12:30:15.123456789Z',
+    '2020-01-01 12:30:15+01:00',
+    '20200101T123015Z',
+])
+def test_parse_datetime_iso__is_the_same_as_dateutil(datetime_iso):
+    expected = dateutil.parser.parse(datetime_iso)
+
+    result = parse_datetime_iso(datetime_iso)
+
+    assert expected == result
+    assert repr(expected) == repr(result)
+
+
+def test_parse_datetime_iso__invalid_date__raises_value_error():
+    with pytest.raises(ValueError):
+        parse_datetime_iso('2020-13-01T00:00:00Z')
+
+
+@pytest.mark.parametrize('time_iso, expected', [
+    ('12:00:00+00:00', time(12, 0, 0, tzinfo=timezone.utc)),
+    ('12:00:00Z', time(12, 0, 0, tzinfo=timezone.utc)),
+    ('12:00:00.5-01:30', time(12, 0, 0, 500000, tzinfo=timezone(-timedelta(hours=1, minutes=30)))),
+    ('12:00:00', time(12, 0, 0)),
+    # fallback
+    ('12:00+01:00', time(12, 0, 0, tzinfo=timezone(timedelta(hours=1)))),
+])
+def test_parse_time_iso(time_iso, expected):
+    result = parse_time_iso(time_iso)
+
+    assert expected == result
+    assert expected.utcoffset() == result.utcoffset()
+
+
+def test_enum_coercion():
+    coerce = enum_coercion(CodeZoneType)
+
+    assert CodeZoneType.COMMON is coerce('COMMON')
+    assert CodeZoneType.COMMON is coerce(CodeZoneType.COMMON)
+
+
+@pytest.mark.parametrize('value', ['INVALID', None, ['COMMON']])
+def test_enum_coercion__invalid_value__raises_value_error(value):
+    coerce = enum_coercion(CodeZoneType)
+
+    with pytest.raises(ValueError):
+        coerce(value)
@@ -31,6 +31,7 @@ Details on EUROCONTROL: http://www.eurocontrol.int
 __author__ = "EUROCONTROL (SWIM)"
 
 from typing import Tuple, Dict, Any
+from unittest.mock import Mock
 
 from geofencing_service_client.models import UASZonesFilter, UASZone, GenericReply, UASZoneFilterReply, \
     UASZoneCreateReply, SubscribeToUASZonesUpdatesReply, UASZoneSubscriptionReplyObject, UASZoneSubscriptionReply, \
@@ -402,3 +403,19 @@ def make_uas_zone_subscriptions_reply():
     uas_zone_subscriptions_reply = UASZoneSubscriptionsReply.from_json(uas_zone_subscriptions_reply_dict)
 
     return uas_zone_subscriptions_reply_dict, uas_zone_subscriptions_reply
+
+
+def make_async_request_handler(**responses) -> Mock:
+    """
+    Builds a request handler whose http methods are coroutines returning the provided responses, i.e.
+    make_async_request_handler(post=response). The calls are still recorded by the respective Mock.
+    """
+    request_handler = Mock()
+
+    for method, response in responses.items():
+        async def send(*args, _response=response, **kwargs):
+            return _response
+
+        setattr(request_handler, method, Mock(side_effect=send))
+
+    return request_handler